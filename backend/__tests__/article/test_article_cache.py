@@ -0,0 +1,95 @@
+"""
+Test Scenarios for the read-through article cache (repositories/cached_article_repository.py):
+1. Repeated GET /api/articles/<article_id> is served from the cache after the first read.
+2. PUT and DELETE invalidate the cached entry, so the next read sees the change.
+3. The LRU evicts the least recently used entry once max_size is reached.
+4. Entries expire after the TTL.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from repositories.cached_article_repository import CachedArticleRepository
+from utilities.lru_cache import TTLCache
+
+
+class TestArticleCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+
+        cls.client.post("/api/register", json={
+            "username": "cachemod",
+            "email": "cachemod@example.com",
+            "password": "password123"
+        })
+        cls.test_db.users.update_one({"username": "cachemod"}, {"$set": {"role": "moderator"}})
+        login_resp = cls.client.post(
+            "/api/login",
+            json={"username_or_email": "cachemod", "password": "password123"}
+        )
+        if login_resp.status_code != 200:
+            raise Exception(f"Login should succeed for moderator, got {login_resp.status_code}")
+        cls.client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+
+    def setUp(self):
+        self.repo = self.app.article_service.repo
+        self.assertIsInstance(self.repo, CachedArticleRepository)
+        self.repo.cache.clear()
+        create_resp = self.client.post("/api/articles", json={
+            "title": "Cached Article",
+            "content": "Cached content."
+        })
+        self.article_id = create_resp.get_json()["article_id"]
+
+    def test_repeated_reads_hit_cache(self):
+        hits_before = self.repo.cache.hits
+        for _ in range(3):
+            resp = self.client.get(f"/api/articles/{self.article_id}")
+            self.assertEqual(resp.status_code, 200)
+            self.assertEqual(resp.get_json()["article_id"], self.article_id)
+        self.assertEqual(self.repo.cache.hits - hits_before, 2, "Only the first read should miss")
+
+    def test_update_invalidates_cache(self):
+        self.client.get(f"/api/articles/{self.article_id}")
+        resp = self.client.put(f"/api/articles/{self.article_id}", json={"title": "Fresh Title"})
+        self.assertEqual(resp.status_code, 200)
+        resp = self.client.get(f"/api/articles/{self.article_id}")
+        self.assertEqual(resp.get_json()["title"], "Fresh Title")
+
+    def test_delete_invalidates_cache(self):
+        self.client.get(f"/api/articles/{self.article_id}")
+        resp = self.client.delete(f"/api/articles/{self.article_id}")
+        self.assertEqual(resp.status_code, 200)
+        resp = self.client.get(f"/api/articles/{self.article_id}")
+        self.assertEqual(resp.status_code, 404)
+
+    def test_lru_eviction_and_ttl(self):
+        now = [0.0]
+        cache = TTLCache(max_size=2, ttl=10, clock=lambda: now[0])
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"), "Least recently used entry should be evicted")
+        self.assertEqual(cache.stats()["evictions"], 1)
+        now[0] = 11
+        self.assertIsNone(cache.get("a"), "Entry should expire after the TTL")
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+References: backend/__docs__/useCases/article/UseCase_ListArticles.md,
+            backend/__docs__/useCases/article/UseCase_SearchArticles.md
+
+Test Scenarios:
+1. facets=true on /api/articles returns the page plus author and month bucket counts and the total.
+2. author= and month= filters narrow both the page and the counts.
+3. facets=true on /api/articles/search counts only the articles matching the query.
+4. Filters also work without facets and in cursor mode; facets with a cursor return 400.
+5. Invalid filter values return 400.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+
+
+class TestArticleFacets(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.articles.delete_many({})
+
+        rows = [
+            ("alice", 2025, 1, "Python Basics"),
+            ("alice", 2025, 2, "Python Testing"),
+            ("alice", 2025, 2, "Gardening Notes"),
+            ("bob", 2025, 2, "Python Packaging"),
+            ("bob", 2025, 3, "Cooking Rice"),
+        ]
+        cls.test_db.articles.insert_many([
+            {
+                "title": title,
+                "content": f"{title} body text.",
+                "author": author,
+                "created_at": datetime(year, month, 10, tzinfo=timezone.utc),
+                "updated_at": datetime(year, month, 10, tzinfo=timezone.utc),
+            }
+            for author, year, month, title in rows
+        ])
+
+    def test_list_facets(self):
+        resp = self.client.get("/api/articles?facets=true&limit=2")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.get_json()
+        self.assertEqual(len(data["articles"]), 2)
+        self.assertEqual(data["total"], 5)
+        self.assertEqual(data["facets"]["author"], [{"value": "alice", "count": 3}, {"value": "bob", "count": 2}])
+        self.assertEqual(
+            data["facets"]["month"],
+            [{"value": "2025-03", "count": 1}, {"value": "2025-02", "count": 3}, {"value": "2025-01", "count": 1}],
+        )
+
+    def test_filters_narrow_page_and_counts(self):
+        resp = self.client.get("/api/articles?facets=true&author=alice&month=2025-02&limit=10")
+        data = resp.get_json()
+        self.assertEqual(sorted(a["title"] for a in data["articles"]), ["Gardening Notes", "Python Testing"])
+        self.assertEqual(data["total"], 2)
+        self.assertEqual(data["facets"]["author"], [{"value": "alice", "count": 2}])
+
+    def test_search_facets(self):
+        resp = self.client.get("/api/articles/search?query=python&facets=true")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.get_json()
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(data["facets"]["author"], [{"value": "alice", "count": 2}, {"value": "bob", "count": 1}])
+        resp = self.client.get("/api/articles/search?query=python&author=bob")
+        self.assertEqual([a["title"] for a in resp.get_json()], ["Python Packaging"])
+
+    def test_filters_without_facets(self):
+        resp = self.client.get("/api/articles?author=bob&limit=10")
+        self.assertEqual({a["author"] for a in resp.get_json()}, {"bob"})
+        resp = self.client.get("/api/articles?cursor=&from=2025-02-01&to=2025-03-01&limit=10")
+        self.assertEqual(len(resp.get_json()["articles"]), 3)
+        resp = self.client.get("/api/articles?cursor=&facets=true")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_invalid_filters(self):
+        for query in ("month=2025-13", "from=yesterday", "from=2025-03-01&to=2025-01-01"):
+            resp = self.client.get(f"/api/articles?{query}")
+            self.assertEqual(resp.status_code, 400, query)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+References: backend/__docs__/useCases/article/UseCase_BulkCreateArticles.md
+
+Test Scenarios:
+1. A moderator imports a JSON array of articles and receives 201 with one article_id per item.
+2. Invalid items are reported by index with a 207 while the valid ones are stored.
+3. An NDJSON body is accepted, one article per line.
+4. A regular user receives a 403 error.
+5. A batch that fails after earlier batches were stored is reported per item, not as a 500.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from utilities.custom_exceptions import RepositoryError
+
+
+class TestBulkCreateArticles(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+
+        for username, role in (("bulkmod", "moderator"), ("bulkuser", "regular")):
+            cls.client.post("/api/register", json={
+                "username": username,
+                "email": f"{username}@example.com",
+                "password": "password123"
+            })
+            cls.test_db.users.update_one({"username": username}, {"$set": {"role": role}})
+        cls.moderator_token = cls._login("bulkmod")
+        cls.regular_token = cls._login("bulkuser")
+
+    @classmethod
+    def _login(cls, username):
+        resp = cls.client.post("/api/login", json={"username_or_email": username, "password": "password123"})
+        if resp.status_code != 200:
+            raise Exception(f"Login should succeed for {username}, got {resp.status_code}")
+        return resp.get_json()["access_token"]
+
+    def setUp(self):
+        self.test_db.articles.delete_many({})
+        self.client.set_cookie("access_token", self.moderator_token, domain="localhost")
+
+    def test_bulk_create_json_array(self):
+        items = [{"title": f"Bulk {i}", "content": f"Bulk content {i}"} for i in range(5)]
+        resp = self.client.post("/api/articles/bulk", json=items)
+        self.assertEqual(resp.status_code, 201)
+        data = resp.get_json()
+        self.assertEqual((data["inserted"], data["failed"]), (5, 0))
+        self.assertEqual([r["index"] for r in data["results"]], list(range(5)))
+        stored = self.test_db.articles.find_one({"title": "Bulk 0"})
+        self.assertEqual(stored["author"], "bulkmod")
+        self.assertIn("excerpt", stored)
+
+    def test_bulk_create_partial_failure(self):
+        items = [
+            {"title": "Good", "content": "Fine"},
+            {"title": "", "content": "Missing title"},
+            "not an object",
+        ]
+        resp = self.client.post("/api/articles/bulk", json=items)
+        self.assertEqual(resp.status_code, 207)
+        results = resp.get_json()["results"]
+        self.assertIn("article_id", results[0])
+        self.assertIn("error", results[1])
+        self.assertIn("error", results[2])
+        self.assertEqual(self.test_db.articles.count_documents({}), 1)
+
+    def test_bulk_create_ndjson(self):
+        body = '{"title": "Line 1", "content": "One"}\n{"title": "Line 2", "content": "Two"}\n'
+        resp = self.client.post("/api/articles/bulk", data=body, content_type="application/x-ndjson")
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.get_json()["inserted"], 2)
+
+    def test_bulk_create_requires_moderator(self):
+        self.client.set_cookie("access_token", self.regular_token, domain="localhost")
+        resp = self.client.post("/api/articles/bulk", json=[{"title": "T", "content": "C"}])
+        self.assertEqual(resp.status_code, 403)
+
+    def test_bulk_create_batch_failure_keeps_results(self):
+        service = self.app.article_service
+        original = service.repo.create_articles
+        calls = []
+
+        def failing_second_batch(documents):
+            calls.append(len(documents))
+            if len(calls) == 2:
+                raise RepositoryError("Error creating articles: connection reset")
+            return original(documents)
+
+        service.repo.create_articles = failing_second_batch
+        try:
+            items = [{"title": f"Batch {i}", "content": "Body"} for i in range(5)]
+            result = service.bulk_create_articles(items, author="bulkmod", batch_size=2)
+        finally:
+            service.repo.create_articles = original
+        self.assertEqual(calls, [2, 2], "No batch should be attempted after one fails")
+        self.assertEqual(result["inserted"], 2)
+        self.assertEqual(result["failed"], 3)
+        self.assertEqual([r["index"] for r in result["results"] if "article_id" in r], [0, 1])
+        self.assertEqual(self.test_db.articles.count_documents({"title": {"$regex": "^Batch "}}), 2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
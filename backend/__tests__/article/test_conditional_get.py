@@ -0,0 +1,118 @@
+"""
+Test Scenarios for ETag / conditional GETs on article endpoints:
+1. GET /api/articles/<article_id> returns a strong ETag and Last-Modified.
+2. Repeating the request with If-None-Match returns 304 with an empty body, also when the
+   ETag comes back weak (W/"...") from a proxy.
+3. After the article is updated, the old ETag no longer matches and 200 is returned.
+4. List pages and search results return an ETag and honour If-None-Match.
+5. A keyset page's ETag changes when a next page appears, even though its articles do not.
+6. Backfilling an article's summary changes its ETag, so cached copies are refetched.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+
+
+class TestConditionalGet(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+
+        cls.client.post("/api/register", json={
+            "username": "etagmod",
+            "email": "etagmod@example.com",
+            "password": "password123"
+        })
+        cls.test_db.users.update_one({"username": "etagmod"}, {"$set": {"role": "moderator"}})
+        login_resp = cls.client.post(
+            "/api/login",
+            json={"username_or_email": "etagmod", "password": "password123"}
+        )
+        if login_resp.status_code != 200:
+            raise Exception(f"Login should succeed for moderator, got {login_resp.status_code}")
+        cls.client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+        create_resp = cls.client.post("/api/articles", json={
+            "title": "ETag Article",
+            "content": "Conditional requests save bandwidth."
+        })
+        cls.article_id = create_resp.get_json()["article_id"]
+
+    def test_get_article_etag_roundtrip(self):
+        resp = self.client.get(f"/api/articles/{self.article_id}")
+        self.assertEqual(resp.status_code, 200)
+        etag = resp.headers.get("ETag")
+        self.assertIsNotNone(etag)
+        self.assertFalse(etag.startswith("W/"), "ETag should be strong")
+        self.assertIsNotNone(resp.headers.get("Last-Modified"))
+
+        resp = self.client.get(f"/api/articles/{self.article_id}", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.get_data(), b"")
+
+        resp = self.client.get(f"/api/articles/{self.article_id}", headers={"If-None-Match": f"W/{etag}"})
+        self.assertEqual(resp.status_code, 304, "If-None-Match uses weak comparison")
+
+    def test_update_changes_etag(self):
+        etag = self.client.get(f"/api/articles/{self.article_id}").headers["ETag"]
+        resp = self.client.put(f"/api/articles/{self.article_id}", json={"title": "ETag Article v2"})
+        self.assertEqual(resp.status_code, 200)
+        resp = self.client.get(f"/api/articles/{self.article_id}", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers["ETag"], etag)
+
+    def test_list_and_search_etags(self):
+        for url in ("/api/articles?limit=5", "/api/articles/search?query=ETag"):
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            etag = resp.headers.get("ETag")
+            self.assertIsNotNone(etag)
+            resp = self.client.get(url, headers={"If-None-Match": etag})
+            self.assertEqual(resp.status_code, 304, f"Expected 304 for {url}")
+
+    def test_cursor_page_etag_tracks_next_cursor(self):
+        url = "/api/articles?cursor=&limit=2&author=cursoretag"
+        for title in ("Cursor One", "Cursor Two"):
+            self.test_db.articles.insert_one({"title": title, "content": "Body", "author": "cursoretag"})
+        resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(resp.get_json()["next_cursor"])
+        etag = resp.headers["ETag"]
+
+        self.test_db.articles.insert_one({"title": "Cursor Three", "content": "Body", "author": "cursoretag"})
+        resp = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 200, "A page that gained a next_cursor must not be 304")
+        self.assertIsNotNone(resp.get_json()["next_cursor"])
+        self.assertNotEqual(resp.headers["ETag"], etag)
+
+    def test_summary_backfill_changes_etag(self):
+        result = self.test_db.articles.insert_one({
+            "title": "Legacy Article",
+            "content": "Stored before summaries existed.",
+            "author": "legacy",
+            "created_at": "Fri, 28 Feb 2025 01:56:08 GMT",
+            "updated_at": "Fri, 28 Feb 2025 01:56:08 GMT",
+        })
+        url = f"/api/articles/{result.inserted_id}"
+        etag = self.client.get(url).headers["ETag"]
+        self.app.article_service.backfill_summaries()
+        resp = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 200, "A backfilled article must not be served as unchanged")
+        self.assertIn("excerpt", resp.get_json())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Test Scenarios:
 1. Successful creation of an article by a moderator or admin.
 2. Failure when required fields are missing.
 3. Unauthorized creation attempt by a user with a role of regular.
+4. Created articles carry a precomputed excerpt, word_count and reading_time.
 """
 
 import unittest
@@ -92,6 +93,22 @@ class TestCreateArticle(unittest.TestCase):
         self.assertEqual(data["message"], "Article created successfully")
         self.assertIn("article_id", data)
 
+    def test_create_article_stores_summary(self):
+        access_token = self.get_access_token("moduser", "password123")
+        article_data = {
+            "title": "Summary Article",
+            "content": "word " * 450
+        }
+        headers = {"Cookie": f"access_token={access_token}"}
+        resp = self.client.post("/api/articles", json=article_data, headers=headers)
+        self.assertEqual(resp.status_code, 201, "Expected 201 status on successful creation")
+        from bson import ObjectId
+        stored = self.test_db.articles.find_one({"_id": ObjectId(resp.get_json()["article_id"])})
+        self.assertEqual(stored["word_count"], 450)
+        self.assertEqual(stored["reading_time"], 3)
+        self.assertTrue(stored["excerpt"].endswith("..."))
+        self.assertLessEqual(len(stored["excerpt"]), Config.ARTICLE_EXCERPT_LENGTH + 3)
+
     def test_create_article_missing_fields(self):
         # Log in as moderator.
         access_token = self.get_access_token("moduser", "password123")
@@ -0,0 +1,94 @@
+"""
+References: backend/__docs__/useCases/article/UseCase_ExportArticles.md
+
+Test Scenarios:
+1. An admin receives every article as NDJSON, one object per line.
+2. since= exports only articles updated at or after the given timestamp.
+3. A non-admin user receives a 403 error.
+4. An invalid since parameter returns a 400 error.
+"""
+
+import json
+import unittest
+from datetime import datetime, timezone, timedelta
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+
+
+class TestExportArticles(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+
+        base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        cls.test_db.articles.insert_many([
+            {
+                "title": f"Export Article {i}",
+                "content": f"Content {i}",
+                "author": "test_author",
+                "created_at": base_time + timedelta(days=i),
+                "updated_at": base_time + timedelta(days=i)
+            }
+            for i in range(7)
+        ])
+
+        for username, role in (("exportadmin", "admin"), ("exportuser", "regular")):
+            cls.client.post("/api/register", json={
+                "username": username,
+                "email": f"{username}@example.com",
+                "password": "password123"
+            })
+            cls.test_db.users.update_one({"username": username}, {"$set": {"role": role}})
+        cls.admin_token = cls._login("exportadmin")
+        cls.regular_token = cls._login("exportuser")
+
+    @classmethod
+    def _login(cls, username):
+        resp = cls.client.post("/api/login", json={"username_or_email": username, "password": "password123"})
+        if resp.status_code != 200:
+            raise Exception(f"Login should succeed for {username}, got {resp.status_code}")
+        return resp.get_json()["access_token"]
+
+    def _export_lines(self, query=""):
+        self.client.set_cookie("access_token", self.admin_token, domain="localhost")
+        resp = self.client.get(f"/api/articles/export{query}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.mimetype, "application/x-ndjson")
+        return [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+
+    def test_export_all_articles(self):
+        articles = self._export_lines("?fields=title")
+        self.assertEqual([a["title"] for a in articles], [f"Export Article {i}" for i in range(7)])
+        self.assertNotIn("content", articles[0])
+
+    def test_export_since(self):
+        articles = self._export_lines("?since=2025-01-05T00:00:00Z")
+        self.assertEqual([a["title"] for a in articles], ["Export Article 4", "Export Article 5", "Export Article 6"])
+
+    def test_export_requires_admin(self):
+        self.client.set_cookie("access_token", self.regular_token, domain="localhost")
+        resp = self.client.get("/api/articles/export")
+        self.assertEqual(resp.status_code, 403)
+        self.assertIn("not authorized", resp.get_json()["error"].lower())
+
+    def test_export_invalid_since(self):
+        self.client.set_cookie("access_token", self.admin_token, domain="localhost")
+        resp = self.client.get("/api/articles/export?since=yesterday")
+        self.assertEqual(resp.status_code, 400)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,12 +8,22 @@ Test Scenarios:
    - For example, GET /api/articles?page=2&limit=2 should return articles 3 and 4.
 3. Handling of invalid pagination parameters.
    - Expect GET /api/articles?page=abc to return a 400 error.
+4. Keyset pagination with an opaque cursor.
+   - GET /api/articles?cursor=&limit=2 returns the first page plus a next_cursor;
+     following next_cursor walks every article exactly once and ends with next_cursor = null.
+5. Page size is capped server-side.
+   - A limit above ARTICLES_MAX_PAGE_SIZE returns at most ARTICLES_MAX_PAGE_SIZE articles.
+6. A malformed cursor, or a well-formed one holding an invalid article id, returns a 400 error.
+7. Sparse fieldsets.
+   - GET /api/articles?fields=title,author returns only article_id, updated_at, title and author;
+     an unknown field returns a 400 error.
 """
 
 import unittest
 from app import create_app
 from app.config import Config
 from pymongo import MongoClient
+from utilities.pagination import encode_cursor
 
 class TestListArticles(unittest.TestCase):
 
@@ -77,6 +87,56 @@ class TestListArticles(unittest.TestCase):
         self.assertIn("error", data)
         self.assertIn("invalid pagination", data["error"].lower())
 
+    def test_list_articles_cursor_walks_all_pages(self):
+        """Test that following next_cursor returns every article once, in insertion order."""
+        titles = []
+        resp = self.client.get("/api/articles?cursor=&limit=2")
+        while True:
+            self.assertEqual(resp.status_code, 200, "Expected 200 status in cursor mode")
+            data = resp.get_json()
+            self.assertIn("articles", data)
+            self.assertIn("next_cursor", data)
+            self.assertLessEqual(len(data["articles"]), 2)
+            titles.extend(article["title"] for article in data["articles"])
+            if data["next_cursor"] is None:
+                break
+            resp = self.client.get(f"/api/articles?cursor={data['next_cursor']}&limit=2")
+        self.assertEqual(titles, [f"Test Article {i}" for i in range(1, 6)])
+
+    def test_list_articles_limit_is_capped(self):
+        """Test that limit is capped at the configured maximum page size."""
+        original_max = self.app.article_service.max_page_size
+        self.app.article_service.max_page_size = 3
+        try:
+            resp = self.client.get("/api/articles?limit=1000")
+        finally:
+            self.app.article_service.max_page_size = original_max
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.get_json()), 3, "Limit should be capped at the maximum page size")
+
+    def test_list_articles_invalid_cursor(self):
+        """Test that a malformed cursor results in a 400 error."""
+        resp = self.client.get("/api/articles?cursor=not-a-cursor!")
+        self.assertEqual(resp.status_code, 400, "Expected 400 status for a malformed cursor")
+        data = resp.get_json()
+        self.assertIn("invalid cursor", data["error"].lower())
+
+        resp = self.client.get(f"/api/articles?cursor={encode_cursor(['not-an-object-id'])}")
+        self.assertEqual(resp.status_code, 400, "Expected 400 status for a cursor with an invalid id")
+
+    def test_list_articles_sparse_fields(self):
+        """Test that fields= limits the returned keys."""
+        resp = self.client.get("/api/articles?fields=title,author")
+        self.assertEqual(resp.status_code, 200)
+        for article in resp.get_json():
+            self.assertEqual(set(article.keys()), {"article_id", "updated_at", "title", "author"})
+
+    def test_list_articles_unknown_field(self):
+        """Test that requesting an unknown field results in a 400 error."""
+        resp = self.client.get("/api/articles?fields=title,password")
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("invalid fields", resp.get_json()["error"].lower())
+
     @classmethod
     def tearDownClass(cls):
         cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
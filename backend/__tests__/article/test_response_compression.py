@@ -0,0 +1,75 @@
+"""
+Test Scenarios for response compression (utilities/compression.py):
+1. Large JSON responses are gzip-compressed when the client sends Accept-Encoding: gzip.
+2. Responses below COMPRESS_MIN_SIZE are sent uncompressed.
+3. Clients that do not accept gzip receive identity responses.
+4. /static/swagger.json is served from the precompressed copy and revalidates with its ETag.
+"""
+
+import gzip
+import json
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+
+
+class TestResponseCompression(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.articles.delete_many({})
+        cls.test_db.articles.insert_many([
+            {
+                "title": f"Long Article {i}",
+                "content": "Compression makes repeated prose cheap to send. " * 100,
+                "author": "test_author",
+                "created_at": "Fri, 28 Feb 2025 01:56:08 GMT",
+                "updated_at": "Fri, 28 Feb 2025 01:56:08 GMT"
+            }
+            for i in range(3)
+        ])
+
+    def test_large_response_is_gzipped(self):
+        resp = self.client.get("/api/articles?limit=3", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers.get("Content-Encoding"), "gzip")
+        self.assertIn("Accept-Encoding", resp.headers.get("Vary", ""))
+        articles = json.loads(gzip.decompress(resp.get_data()))
+        self.assertEqual(len(articles), 3)
+
+    def test_small_response_is_not_compressed(self):
+        resp = self.client.get("/api/articles?limit=1&fields=title", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(resp.headers.get("Content-Encoding"))
+
+    def test_identity_when_gzip_not_accepted(self):
+        resp = self.client.get("/api/articles?limit=3", headers={"Accept-Encoding": "gzip;q=0, identity"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertIsNone(resp.headers.get("Content-Encoding"))
+        self.assertEqual(len(resp.get_json()), 3)
+
+    def test_swagger_is_precompressed(self):
+        resp = self.client.get("/static/swagger.json", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.headers.get("Content-Encoding"), "gzip")
+        self.assertIn("paths", json.loads(gzip.decompress(resp.get_data())))
+        resp = self.client.get(
+            "/static/swagger.json",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": resp.headers["ETag"]}
+        )
+        self.assertEqual(resp.status_code, 304)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
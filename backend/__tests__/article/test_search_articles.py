@@ -6,12 +6,21 @@ Test Scenarios:
    expect GET /api/articles/search?query=... to return a 200 status and a non-empty array of articles.
 2. No matches: Given a search query that matches no articles, expect a 200 status with an empty array.
 3. Invalid parameters: If the search query is missing (or invalid), expect a 400 error with an appropriate message.
+4. Content matches: words that only appear in the content are found through the text index.
+5. Short queries: queries below SEARCH_MIN_TEXT_LENGTH match title prefixes, with regex characters escaped.
+   Longer queries the text index finds nothing for (a partial word) fall back to title prefixes.
+   Articles stored without title_lower are found once backfilled; title_lower is never returned.
+6. Pagination: limit bounds the page size and paging stops at SEARCH_MAX_RESULTS.
+7. Snippets: results carry a highlighted window of the body instead of the full content.
+8. Fuzzy mode: mode=fuzzy finds titles despite typos; an unknown mode returns 400.
+9. A matched word longer than the snippet length still yields a snippet highlighting it.
 """
 
 import unittest
 from app import create_app
 from app.config import Config
 from pymongo import MongoClient
+from utilities.text_utils import build_snippet
 
 class TestSearchArticles(unittest.TestCase):
 
@@ -60,6 +69,8 @@ class TestSearchArticles(unittest.TestCase):
         ]
         result = cls.test_db.articles.insert_many(articles)
         cls.inserted_ids = [str(_id) for _id in result.inserted_ids]
+        # Inserted directly, like articles stored before prefix search used title_lower.
+        cls.backfilled = cls.app.article_service.backfill_title_lower()
 
     def test_search_articles_success(self):
         """Test that a valid search query returns matching articles."""
@@ -69,7 +80,7 @@ class TestSearchArticles(unittest.TestCase):
         data = resp.get_json()
         self.assertIsInstance(data, list, "Expected a list of articles")
         # Expect at least one article that mentions Python
-        self.assertTrue(any("Python" in article["title"] or "Python" in article["content"]
+        self.assertTrue(any("Python" in article["title"] or "Python" in article["snippet"]["text"]
                             for article in data), "Expected at least one matching article")
 
     def test_search_articles_no_matches(self):
@@ -88,11 +99,85 @@ class TestSearchArticles(unittest.TestCase):
         self.assertIn("error", data)
         self.assertIn("missing", data["error"].lower())
 
+    def test_search_articles_content_match(self):
+        """A word only present in an article's content is matched by the text index."""
+        resp = self.client.get("/api/articles/search?query=comparison")
+        self.assertEqual(resp.status_code, 200)
+        titles = [article["title"] for article in resp.get_json()]
+        self.assertEqual(titles, ["Flask vs Django: A Comparative Analysis"])
+
+    def test_search_articles_partial_word_prefix(self):
+        """A query whose word is only partly typed falls back to a title prefix match."""
+        resp = self.client.get("/api/articles/search?query=BREA")
+        self.assertEqual([a["title"] for a in resp.get_json()], ["Breaking News: Python Takes Over"])
+
+    def test_title_lower_backfilled_not_returned(self):
+        self.assertEqual(self.backfilled, 4)
+        self.assertEqual(self.test_db.articles.count_documents({"title_lower": {"$exists": False}}), 0)
+        resp = self.client.get(f"/api/articles/{self.inserted_ids[0]}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotIn("title_lower", resp.get_json())
+
+    def test_search_articles_short_query_prefix(self):
+        """Short queries match the start of titles and treat regex characters literally."""
+        resp = self.client.get("/api/articles/search?query=Fl")
+        self.assertEqual([a["title"] for a in resp.get_json()], ["Flask vs Django: A Comparative Analysis"])
+        resp = self.client.get("/api/articles/search?query=.*")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.get_json(), [], "Regex metacharacters must not match everything")
+
+    def test_search_articles_snippet(self):
+        """Each result has a snippet whose highlight offsets point at the matched words."""
+        resp = self.client.get("/api/articles/search?query=garden")
+        data = resp.get_json()
+        self.assertEqual(len(data), 1)
+        article = data[0]
+        self.assertNotIn("content", article, "The body should be replaced by the snippet")
+        snippet = article["snippet"]
+        self.assertTrue(snippet["highlights"])
+        for start, end in snippet["highlights"]:
+            self.assertEqual(snippet["text"][start:end].lower(), "garden")
+        start, end = article["title_highlights"][0]
+        self.assertEqual(article["title"][start:end], "Garden")
+
+    def test_search_articles_fuzzy(self):
+        """A misspelled query finds nothing by default but matches with mode=fuzzy."""
+        resp = self.client.get("/api/articles/search?query=Djnago")
+        self.assertEqual(resp.get_json(), [])
+        resp = self.client.get("/api/articles/search?query=Djnago&mode=fuzzy")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.get_json()
+        self.assertEqual([a["title"] for a in data], ["Flask vs Django: A Comparative Analysis"])
+        start, end = data[0]["title_highlights"][0]
+        self.assertEqual(data[0]["title"][start:end], "Django")
+        resp = self.client.get("/api/articles/search?query=Django&mode=exact")
+        self.assertEqual(resp.status_code, 400)
+
+    def test_search_articles_pagination(self):
+        """limit bounds the page; pages past SEARCH_MAX_RESULTS are empty."""
+        resp = self.client.get("/api/articles/search?query=news&limit=1")
+        self.assertEqual(len(resp.get_json()), 1)
+        resp = self.client.get("/api/articles/search?query=news&limit=1&page=2")
+        self.assertEqual(len(resp.get_json()), 1)
+        max_results = self.app.article_service.search_max_results
+        resp = self.client.get(f"/api/articles/search?query=news&limit=1&page={max_results + 1}")
+        self.assertEqual(resp.get_json(), [])
+        resp = self.client.get("/api/articles/search?query=news&limit=abc")
+        self.assertEqual(resp.status_code, 400)
 
     @classmethod
     def tearDownClass(cls):
         cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
         cls.mongo_client.close()
 
+class TestBuildSnippet(unittest.TestCase):
+
+    def test_word_longer_than_length(self):
+        text = "short words then " + "a" * 200
+        snippet = build_snippet(text, ("a",), 160)
+        self.assertEqual(snippet["highlights"], [[3, 203]])
+        self.assertEqual(snippet["text"], "..." + "a" * 200)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,117 @@
+"""
+Test Scenarios for the search result cache (ArticleService.search_articles):
+1. Repeating a search is served from the cache.
+2. Queries that differ only in case and whitespace share one cache entry.
+3. Any article write bumps the corpus generation, so the next search sees the change.
+4. Different pages are cached separately.
+5. Updates and deletes invalidate cached results too, even while no in-process index is built.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+
+
+class TestSearchCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+
+        cls.client.post("/api/register", json={
+            "username": "searchcachemod",
+            "email": "searchcachemod@example.com",
+            "password": "password123"
+        })
+        cls.test_db.users.update_one({"username": "searchcachemod"}, {"$set": {"role": "moderator"}})
+        login_resp = cls.client.post(
+            "/api/login",
+            json={"username_or_email": "searchcachemod", "password": "password123"}
+        )
+        if login_resp.status_code != 200:
+            raise Exception(f"Login should succeed for moderator, got {login_resp.status_code}")
+        cls.client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+
+        cls.service = cls.app.article_service
+        for i in range(3):
+            cls.client.post("/api/articles", json={"title": f"Caching Strategies {i}", "content": "Cache all things."})
+
+    def setUp(self):
+        self.assertIsNotNone(self.service.search_cache, "SEARCH_CACHE_ENABLED should default to true")
+        self.service.search_cache.clear()
+
+    def _search(self, query, page=1):
+        resp = self.client.get("/api/articles/search", query_string={"query": query, "limit": 2, "page": page})
+        self.assertEqual(resp.status_code, 200)
+        return resp.get_json()
+
+    def test_repeated_search_hits_cache(self):
+        hits_before = self.service.search_cache.hits
+        first = self._search("caching")
+        second = self._search("caching")
+        self.assertEqual(first, second)
+        self.assertEqual(self.service.search_cache.hits - hits_before, 1)
+
+    def test_normalized_queries_share_entry(self):
+        self._search("caching strategies")
+        hits_before = self.service.search_cache.hits
+        self._search("  CACHING   Strategies ")
+        self.assertEqual(self.service.search_cache.hits - hits_before, 1)
+        self.assertEqual(len(self.service.search_cache), 1)
+
+    def test_write_invalidates_results(self):
+        self.assertEqual(len(self._search("invalidation")), 0)
+        generation = self.service.generation
+        self.client.post("/api/articles", json={"title": "Invalidation Rules", "content": "Bump it."})
+        self.assertGreater(self.service.generation, generation)
+        self.assertEqual([a["title"] for a in self._search("invalidation")], ["Invalidation Rules"])
+
+    def _reset_indexes(self):
+        for index in (self.service._search_index, self.service._suggest_index, self.service._fuzzy_index):
+            index.reset()
+
+    def test_update_invalidates_results(self):
+        resp = self.client.post("/api/articles", json={"title": "Eviction Policies", "content": "Least recently used."})
+        article_id = resp.get_json()["article_id"]
+        self.assertEqual(len(self._search("expiration")), 0)
+        self._reset_indexes()
+        generation = self.service.generation
+        resp = self.client.put(f"/api/articles/{article_id}", json={"title": "Expiration Policies"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertGreater(self.service.generation, generation)
+        self.assertEqual([a["title"] for a in self._search("expiration")], ["Expiration Policies"])
+
+    def test_delete_invalidates_results(self):
+        resp = self.client.post("/api/articles", json={"title": "Stampede Protection", "content": "Lock the rebuild."})
+        article_id = resp.get_json()["article_id"]
+        self.assertEqual([a["title"] for a in self._search("stampede")], ["Stampede Protection"])
+        self._reset_indexes()
+        generation = self.service.generation
+        resp = self.client.delete(f"/api/articles/{article_id}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertGreater(self.service.generation, generation)
+        self.assertEqual(self._search("stampede"), [])
+
+    def test_pages_cached_separately(self):
+        page_one = self._search("caching", page=1)
+        page_two = self._search("caching", page=2)
+        self.assertEqual(len(page_one), 2)
+        self.assertEqual(len(page_two), 1)
+        self.assertEqual(len(self.service.search_cache), 2)
+        self.assertGreater(self.service.search_cache.stats()["misses"], 0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
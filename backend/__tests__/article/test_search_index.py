@@ -0,0 +1,215 @@
+"""
+References: backend/__docs__/useCases/article/UseCase_SearchArticles.md
+
+Test Scenarios for the in-process BM25 index (utilities/search_index.py):
+1. Documents are ranked by BM25, with title matches outranking body-only matches.
+2. Re-indexing a key replaces its old terms; removing a key drops it from results.
+3. skip/limit select the requested slice of the ranking.
+4. Tombstoned postings are compacted once they pass the threshold.
+5. With SEARCH_BACKEND=index, /api/articles/search answers from the index and sees new articles.
+6. TrigramIndex matches misspelled words above the similarity threshold, best first.
+7. RefreshingIndex builds on first use and rebuilds a stale index in the background, serving the old one meanwhile.
+   Writes made during a rebuild are replayed onto the new index; a failed rebuild backs off.
+"""
+
+import threading
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from utilities.search_index import InvertedIndex, PrefixIndex, RefreshingIndex, TrigramIndex, tokenize, trigrams
+
+
+class TestInvertedIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = InvertedIndex()
+        self.index.add("a", "Python Tips", "Short notes about python.")
+        self.index.add("b", "Gardening", "Snakes like the python live in gardens.")
+        self.index.add("c", "Flask Basics", "Routing and blueprints.")
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Hello, World! hello_world 42"), ["hello", "world", "hello_world", "42"])
+
+    def test_title_match_ranks_first(self):
+        keys = [key for key, _ in self.index.search("python")]
+        self.assertEqual(keys, ["a", "b"])
+
+    def test_reindex_and_remove(self):
+        self.index.add("a", "Rust Tips", "Short notes about rust.")
+        self.assertEqual([key for key, _ in self.index.search("python")], ["b"])
+        self.index.remove("b")
+        self.assertEqual(self.index.search("python"), [])
+        self.assertEqual(len(self.index), 2)
+
+    def test_skip_and_limit(self):
+        ranking = self.index.search("python")
+        self.assertEqual(self.index.search("python", limit=1), ranking[:1])
+        self.assertEqual(self.index.search("python", limit=1, skip=1), ranking[1:2])
+        self.assertEqual(self.index.search("python", limit=5, skip=2), [])
+
+    def test_compaction(self):
+        for i in range(200):
+            self.index.add("churn", "Churn", f"revision {i}")
+        stats = self.index.stats()
+        self.assertLess(stats["tombstones"], 100, "Tombstones should be compacted away")
+        self.assertEqual(stats["documents"], 4)
+        self.assertEqual([key for key, _ in self.index.search("python")], ["a", "b"])
+
+
+class TestTrigramIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TrigramIndex()
+        self.index.add("a", "Python Tips")
+        self.index.add("b", "Pythonic Idioms")
+        self.index.add("c", "Flask vs Django")
+
+    def test_trigrams(self):
+        self.assertEqual(trigrams("ab"), {"  a", " ab", "ab "})
+
+    def test_typo_matches_ranked_by_similarity(self):
+        results = self.index.search("pyton")
+        self.assertEqual([key for key, _, _ in results], ["a", "b"])
+        self.assertEqual(results[0][2], ["python"])
+        self.assertEqual([key for key, _, _ in self.index.search("djnago")], ["c"])
+
+    def test_threshold_and_updates(self):
+        self.assertEqual(self.index.search("pyton", threshold=0.9), [])
+        self.assertEqual(self.index.search("zzzz"), [])
+        self.index.remove("a")
+        self.index.add("b", "Rust Idioms")
+        self.assertEqual(self.index.search("pyton"), [])
+
+
+class TestRefreshingIndex(unittest.TestCase):
+
+    def test_stale_index_rebuilt_in_background(self):
+        now = [0.0]
+        release = threading.Event()
+        built = []
+
+        def builder():
+            if built:
+                release.wait(5)
+            built.append(len(built) + 1)
+            return built[-1]
+
+        index = RefreshingIndex(builder, max_age=10, clock=lambda: now[0])
+        self.assertEqual(index.get(), 1)
+        now[0] = 20
+        self.assertEqual(index.get(), 1, "A stale index is served while the rebuild runs")
+        self.assertEqual(index.get(), 1, "Only one rebuild runs at a time")
+        release.set()
+        with index._lock:
+            pass
+        self.assertEqual(index.get(), 2)
+        self.assertEqual(built, [1, 2])
+
+    def test_failed_rebuild_keeps_index_and_backs_off(self):
+        now = [0.0]
+        calls = []
+
+        def builder():
+            calls.append(now[0])
+            if len(calls) == 2:
+                raise RuntimeError("database down")
+            return len(calls)
+
+        index = RefreshingIndex(builder, max_age=10, clock=lambda: now[0], retry_delay=5)
+        index.get()
+        now[0] = 20
+        self.assertEqual(index.get(), 1)
+        with index._lock:
+            pass
+        self.assertEqual(index.get(), 1)
+        self.assertEqual(len(calls), 2, "No retry before retry_delay has passed")
+        now[0] = 26
+        self.assertEqual(index.get(), 1)
+        with index._lock:
+            pass
+        self.assertEqual(index.get(), 3)
+
+    def test_writes_during_rebuild_are_replayed(self):
+        now = [0.0]
+        started = threading.Event()
+        release = threading.Event()
+        corpus = {"a": "Python Tips", "b": "Flask Basics"}
+
+        def builder():
+            snapshot = dict(corpus)
+            if now[0]:
+                started.set()
+                release.wait(5)
+            built = PrefixIndex()
+            built.add_many(snapshot.items())
+            return built
+
+        index = RefreshingIndex(builder, max_age=10, clock=lambda: now[0])
+        index.get()
+        now[0] = 20
+        index.get()
+        self.assertTrue(started.wait(5))
+        # Deleted and retitled after the rebuild took its snapshot.
+        del corpus["a"]
+        index.apply(lambda current: current.remove("a"))
+        corpus["b"] = "Django Basics"
+        index.apply(lambda current: current.add("b", "Django Basics"))
+        self.assertEqual(index.get().suggest("py"), [], "The index in use sees the delete at once")
+        release.set()
+        with index._lock:
+            pass
+        rebuilt = index.get()
+        self.assertEqual(rebuilt.suggest("py"), [], "A delete made mid-rebuild must stay deleted")
+        self.assertEqual(rebuilt.suggest("fla"), [])
+        self.assertEqual(rebuilt.suggest("dja"), [("b", "Django Basics")])
+
+
+class TestIndexBackedSearch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+        cls.test_db.articles.insert_many([
+            {"title": "Python Tips", "content": "Short notes about python.", "author": "a"},
+            {"title": "Gardening", "content": "Snakes like the python live in gardens.", "author": "b"},
+        ])
+
+        cls.client.post("/api/register", json={
+            "username": "indexmod",
+            "email": "indexmod@example.com",
+            "password": "password123"
+        })
+        cls.test_db.users.update_one({"username": "indexmod"}, {"$set": {"role": "moderator"}})
+        login_resp = cls.client.post("/api/login", json={"username_or_email": "indexmod", "password": "password123"})
+        cls.client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+
+        cls.service = cls.app.article_service
+        cls.service.search_backend = "index"
+
+    def test_search_uses_index_and_sees_writes(self):
+        resp = self.client.get("/api/articles/search?query=python")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([a["title"] for a in resp.get_json()], ["Python Tips", "Gardening"])
+        self.assertIsNotNone(self.service._search_index.current, "The first search should build the index")
+
+        self.client.post("/api/articles", json={"title": "Pythonic Code", "content": "Idioms."})
+        resp = self.client.get("/api/articles/search?query=pythonic")
+        self.assertEqual([a["title"] for a in resp.get_json()], ["Pythonic Code"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service.search_backend = Config.SEARCH_BACKEND
+        cls.service._search_index.reset()
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
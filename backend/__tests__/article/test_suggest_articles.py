@@ -0,0 +1,106 @@
+"""
+References: backend/__docs__/useCases/article/UseCase_SuggestArticles.md
+
+Test Scenarios:
+1. PrefixIndex returns titles with a token starting with the prefix, exact tokens first.
+2. Earlier words in the prefix must appear in the title; re-indexing and removal are reflected.
+   A bulk add_many() gives the same index as one add() per title, replacing existing keys.
+3. GET /api/articles/suggest?prefix=... returns only article_id/title pairs, capped at SUGGEST_MAX_RESULTS.
+4. Articles created after the index was built are suggested immediately.
+5. A missing prefix returns a 400 error.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from utilities.search_index import PrefixIndex
+
+
+class TestPrefixIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = PrefixIndex()
+        self.index.add("a", "Pythonic Code")
+        self.index.add("b", "Python Tips")
+        self.index.add("c", "Flask with Python")
+
+    def test_prefix_match_order(self):
+        self.assertEqual(self.index.suggest("pyth"), [("b", "Python Tips"), ("a", "Pythonic Code"), ("c", "Flask with Python")])
+        self.assertEqual(self.index.suggest("python"), [("b", "Python Tips"), ("c", "Flask with Python"), ("a", "Pythonic Code")])
+        self.assertEqual(self.index.suggest("py", limit=1), [("b", "Python Tips")])
+
+    def test_multi_word_and_updates(self):
+        self.assertEqual(self.index.suggest("flask py"), [("c", "Flask with Python")])
+        self.index.add("c", "Django Basics")
+        self.index.remove("b")
+        self.assertEqual(self.index.suggest("py"), [("a", "Pythonic Code")])
+        self.assertEqual(self.index.suggest("dj"), [("c", "Django Basics")])
+
+    def test_add_many_matches_add(self):
+        bulk = PrefixIndex()
+        bulk.add_many([("x", "Python Tips"), ("c", "Old Title")])
+        bulk.add_many([("a", "Pythonic Code"), ("b", "Python Tips"), ("c", "Flask with Python")])
+        bulk.remove("x")
+        self.assertEqual(bulk._entries, self.index._entries)
+        self.assertEqual(bulk.suggest("pyth"), self.index.suggest("pyth"))
+        self.assertEqual(bulk.suggest("old"), [])
+
+    def test_budget_exhausted(self):
+        ticks = iter(range(100))
+        self.assertEqual(self.index.suggest("py", budget=0.5, clock=lambda: next(ticks)), [])
+
+
+class TestSuggestArticles(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.articles.delete_many({})
+        cls.test_db.articles.insert_many([
+            {"title": f"Python Recipe {i}", "content": "Long body " * 50, "author": "cook"}
+            for i in range(20)
+        ])
+        cls.app.article_service._suggest_index.reset()
+
+        cls.client.post("/api/register", json={
+            "username": "suggestmod",
+            "email": "suggestmod@example.com",
+            "password": "password123"
+        })
+        cls.test_db.users.update_one({"username": "suggestmod"}, {"$set": {"role": "moderator"}})
+        login_resp = cls.client.post("/api/login", json={"username_or_email": "suggestmod", "password": "password123"})
+        cls.client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+
+    def test_suggest_returns_title_pairs(self):
+        resp = self.client.get("/api/articles/suggest?prefix=pyt&limit=100")
+        self.assertEqual(resp.status_code, 200)
+        data = resp.get_json()
+        self.assertEqual(len(data), Config.SUGGEST_MAX_RESULTS)
+        self.assertEqual(set(data[0]), {"article_id", "title"})
+
+    def test_suggest_sees_new_articles(self):
+        self.client.get("/api/articles/suggest?prefix=warmup")
+        self.client.post("/api/articles", json={"title": "Zebra Stripes", "content": "Body."})
+        resp = self.client.get("/api/articles/suggest?prefix=zeb")
+        self.assertEqual([s["title"] for s in resp.get_json()], ["Zebra Stripes"])
+
+    def test_suggest_missing_prefix(self):
+        resp = self.client.get("/api/articles/suggest")
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("missing", resp.get_json()["error"].lower())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.app.article_service._suggest_index.reset()
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
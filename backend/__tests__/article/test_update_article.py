@@ -7,6 +7,9 @@ Test Scenarios:
    - Verify that the article's data is updated.
 2. Failure when no update fields are provided.
    - Expect PUT /api/articles/<article_id> with an empty JSON body to return 400 with an appropriate error message.
+3. Failure when the article does not exist.
+   - Expect PUT on an unknown article_id to return 404 for a regular user as well as a moderator.
+4. Warm in-process indexes are updated from the write itself, without re-reading the article.
 """
 
 import unittest
@@ -190,6 +193,39 @@ class TestUpdateArticle(unittest.TestCase):
         self.assertIn("error", data)
         self.assertIn("no data provided for update", data["error"].lower())
 
+    def test_update_article_not_found(self):
+        # The owner-restricted write must still report a missing article as 404, not 403.
+        for token in (self.moderator_token, self.regular_token):
+            self.client.set_cookie("access_token", token, domain="localhost")
+            resp = self.client.put("/api/articles/000000000000000000000000", json={"title": "Nothing"})
+            self.assertEqual(resp.status_code, 404, "Expected 404 status for non-existent article update")
+            self.assertIn("not found", resp.get_json()["error"].lower())
+
+    def test_update_article_refreshes_indexes_without_read(self):
+        self.client.set_cookie("access_token", self.moderator_token, domain="localhost")
+        resp = self.client.post("/api/articles", json={"title": "Indexed Draft", "content": "Placeholder body."})
+        article_id = resp.get_json()["article_id"]
+        service = self.app.article_service
+        search_index = service._search_index.get()
+        suggest_index = service._suggest_index.get()
+        repo = service.repo
+        original_get = repo.get_article_by_id
+
+        def no_read(_article_id):
+            raise AssertionError("update_article should not re-read the article")
+
+        repo.get_article_by_id = no_read
+        try:
+            resp = self.client.put(f"/api/articles/{article_id}", json={"content": "Zeppelin maintenance notes."})
+            self.assertEqual(resp.status_code, 200)
+            resp = self.client.put(f"/api/articles/{article_id}", json={"title": "Indexed Final"})
+            self.assertEqual(resp.status_code, 200)
+        finally:
+            repo.get_article_by_id = original_get
+        self.assertEqual([key for key, _ in search_index.search("zeppelin")], [article_id])
+        self.assertEqual([key for key, _ in search_index.search("final")], [article_id])
+        self.assertEqual(suggest_index.suggest("indexed f"), [(article_id, "Indexed Final")])
+
     @classmethod
     def tearDownClass(cls):
         cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
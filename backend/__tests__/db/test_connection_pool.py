@@ -0,0 +1,91 @@
+"""
+Test Scenarios for the per-process Mongo client (repositories/db.py, repositories/pool_monitor.py):
+1. Concurrent first calls to get_db() build a single client.
+2. Pool events are counted: checkouts, waits and in-use connections, all returned by the end.
+3. MONGO_COMPRESSORS keeps known, installed compressors and drops the rest.
+4. A forked child does not reuse the parent's client.
+"""
+
+import os
+import threading
+import unittest
+from app.config import Config
+from repositories import db
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+
+    def setUp(self):
+        db.close_db()
+
+    def test_concurrent_init_builds_one_client(self):
+        clients = []
+        barrier = threading.Barrier(8)
+
+        def first_use():
+            barrier.wait()
+            db.get_db()
+            clients.append(db._mongo_client)
+
+        threads = [threading.Thread(target=first_use) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(clients), 8)
+        self.assertEqual(len({id(client) for client in clients}), 1)
+
+    def test_pool_events_are_counted(self):
+        database = db.get_db()
+        threads = [threading.Thread(target=database.command, args=("ping",)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        stats = db.pool_stats()
+        self.assertGreaterEqual(stats["checkouts"], 6)
+        self.assertEqual(stats["in_use"], 0)
+        self.assertGreaterEqual(stats["max_in_use"], 1)
+        self.assertLessEqual(stats["max_in_use"], Config.MONGO_MAX_POOL_SIZE)
+        self.assertGreaterEqual(stats["open"], 1)
+        self.assertEqual(sum(stats["wait_buckets"].values()), stats["checkouts"])
+        self.assertEqual(stats["checkout_failures"], {})
+
+    def test_compressor_setting(self):
+        self.assertEqual(db._available_compressors(""), [])
+        self.assertEqual(db._available_compressors("zlib, bogus"), ["zlib"])
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            self.assertEqual(db._available_compressors("zstd,zlib"), ["zlib"])
+        else:
+            self.assertEqual(db._available_compressors("zstd,zlib"), ["zstd", "zlib"])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_forked_child_builds_its_own_client(self):
+        db.get_db()
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            inherited = db._mongo_client is None
+            ok = inherited and db.get_db().command("ping").get("ok") == 1.0
+            os.write(write_end, b"1" if ok else b"0")
+            os._exit(0)
+        os.close(write_end)
+        result = os.read(read_end, 1)
+        os.close(read_end)
+        os.waitpid(pid, 0)
+        self.assertEqual(result, b"1", "The child should start without a client and open its own")
+
+    @classmethod
+    def tearDownClass(cls):
+        db.close_db()
+
+
+if __name__ == "__main__":
+    unittest.main()
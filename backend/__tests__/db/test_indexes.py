@@ -0,0 +1,66 @@
+"""
+Test Scenarios for the index registry (repositories/indexes.py):
+1. Application startup creates every registered index.
+2. ensure_indexes is idempotent: a second run creates nothing.
+3. Unregistered indexes are reported as unknown, and never-used indexes as unused.
+4. The unique username index rejects a duplicate insert with DuplicateRecordError.
+"""
+
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from repositories.db import get_db
+from repositories.indexes import ensure_indexes, get_index_registry, index_usage_report
+from repositories.mongo_user_repository import MongoUserRepository
+from utilities.custom_exceptions import DuplicateRecordError
+
+
+class TestIndexes(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.app = create_app()
+
+    def test_startup_creates_registered_indexes(self):
+        for collection_name, specs in get_index_registry().items():
+            existing = self.test_db[collection_name].index_information()
+            for spec in specs:
+                self.assertIn(spec.document["name"], existing)
+
+    def test_ensure_indexes_is_idempotent(self):
+        report = ensure_indexes(get_db())
+        for entry in report.values():
+            self.assertEqual(entry["created"], [])
+            self.assertEqual(entry["conflicts"], [])
+            self.assertEqual(entry["failed"], [])
+
+    def test_reports_unknown_and_unused_indexes(self):
+        self.test_db.articles.create_index("legacy_field")
+        try:
+            report = ensure_indexes(get_db())
+            self.assertIn("legacy_field_1", report["articles"]["unknown"])
+            usage = index_usage_report(get_db())
+            self.assertIn("legacy_field_1", usage["articles"]["unused"])
+            self.assertEqual(usage["articles"]["missing"], [])
+        finally:
+            self.test_db.articles.drop_index("legacy_field_1")
+
+    def test_unique_username_rejects_duplicates(self):
+        repo = MongoUserRepository()
+        user = {"username": "dupe", "email": "dupe@example.com", "password": b"x", "role": "regular"}
+        repo.create_user(dict(user))
+        with self.assertRaises(DuplicateRecordError):
+            repo.create_user(dict(user, email="other@example.com"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+if __name__ == "__main__":
+    unittest.main()
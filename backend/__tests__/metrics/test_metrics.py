@@ -0,0 +1,154 @@
+"""
+Test Scenarios for the metrics subsystem (utilities/metrics.py, repositories/command_monitor.py):
+1. GET /metrics serves the Prometheus text format with a latency histogram per endpoint.
+2. Listing articles records Mongo commands for the articles collection, and the
+   per-request command count for the endpoint.
+3. Component stats (password hash pool, revocations) are exported as gauges.
+4. Observations from many threads are all counted, with cumulative buckets.
+5. With METRICS_AUTH_TOKEN set, a scrape without the bearer token gets 401.
+6. Shards of exited threads are folded away without losing their counts.
+7. With a shared snapshot directory, a scrape reports the sum over every worker,
+   including workers that have exited, and the worker label is dropped.
+"""
+
+import re
+import tempfile
+import threading
+import unittest
+from app import create_app
+from app.config import Config
+from flask import Flask
+from pymongo import MongoClient
+from repositories.command_monitor import command_collection
+from utilities.metrics import Metrics, MetricsRegistry
+
+
+def sample(text, name, **labels):
+    """Value of the first sample of name whose labels include labels, or None."""
+    for line in text.splitlines():
+        match = re.match(r"^(\w+)\{(.*)\} (\S+)$", line)
+        if not match or match.group(1) != name:
+            continue
+        found = dict(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', match.group(2)))
+        if all(found.get(key) == value for key, value in labels.items()):
+            return float(match.group(3))
+    return None
+
+
+class TestMetrics(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.client = cls.app.test_client()
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.articles.delete_many({})
+        cls.test_db.articles.insert_one({"title": "Metered", "content": "Body", "author": "metrics"})
+
+    def _scrape(self):
+        resp = self.client.get("/metrics")
+        self.assertEqual(resp.status_code, 200)
+        self.assertTrue(resp.content_type.startswith("text/plain; version=0.0.4"))
+        return resp.get_data(as_text=True)
+
+    def test_request_latency_histogram(self):
+        for _ in range(3):
+            self.assertEqual(self.client.get("/").status_code, 200)
+        text = self._scrape()
+        self.assertIn("# TYPE hive_http_request_duration_seconds histogram", text)
+        count = sample(text, "hive_http_request_duration_seconds_count", endpoint="main_routes.home", method="GET")
+        self.assertGreaterEqual(count, 3)
+        inf = sample(text, "hive_http_request_duration_seconds_bucket", endpoint="main_routes.home", le="+Inf")
+        self.assertEqual(inf, count)
+        self.assertGreaterEqual(
+            sample(text, "hive_http_requests_total", endpoint="main_routes.home", status="200"), 3
+        )
+
+    def test_mongo_commands_are_recorded(self):
+        self.assertEqual(self.client.get("/api/articles").status_code, 200)
+        text = self._scrape()
+        finds = sample(text, "hive_mongo_command_duration_seconds_count", collection="articles", operation="find")
+        self.assertGreaterEqual(finds, 1)
+        per_request = sample(text, "hive_http_request_mongo_commands_sum", endpoint="article_routes.get_articles")
+        self.assertGreaterEqual(per_request, 1)
+        self.assertIsNotNone(sample(text, "hive_mongo_pool_checkouts"))
+
+    def test_component_stats_exported(self):
+        text = self._scrape()
+        self.assertIsNotNone(sample(text, "hive_password_hash_pool_workers"))
+        self.assertIsNotNone(sample(text, "hive_revocations_probes"))
+
+    def test_concurrent_observations(self):
+        registry = MetricsRegistry(prefix="test")
+        histogram = registry.histogram("latency_seconds", "Test latency.", ("endpoint",), buckets=(0.1, 1.0))
+
+        def observe():
+            for i in range(1000):
+                histogram.observe(("e",), 0.05 if i % 2 else 0.5)
+
+        threads = [threading.Thread(target=observe) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        text = registry.render()
+        self.assertEqual(sample(text, "test_latency_seconds_count", endpoint="e"), 8000)
+        self.assertEqual(sample(text, "test_latency_seconds_bucket", endpoint="e", le="0.1"), 4000)
+        self.assertEqual(sample(text, "test_latency_seconds_bucket", endpoint="e", le="1"), 8000)
+        self.assertEqual(command_collection("getMore", {"getMore": 1, "collection": "articles"}), "articles")
+        self.assertEqual(command_collection("aggregate", {"aggregate": 1}), "")
+
+    def test_exited_thread_shards_folded(self):
+        registry = MetricsRegistry(prefix="fold")
+        counter = registry.counter("requests_total", "Test requests.", ("endpoint",))
+        for round_number in range(1, 4):
+            # One short-lived thread per request, like the development server.
+            threads = [threading.Thread(target=counter.inc, args=(("e",),)) for _ in range(20)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+            self.assertEqual(sample(registry.render(), "fold_requests_total", endpoint="e"), 20 * round_number)
+            self.assertEqual(counter._shards, [], "Exited threads' shards should be folded at scrape time")
+        counter.inc(("e",))
+        self.assertEqual(len(counter._shards), 1)
+        self.assertEqual(sample(registry.render(), "fold_requests_total", endpoint="e"), 61)
+
+    def test_snapshot_directory_sums_workers(self):
+        def worker(requests):
+            registry = MetricsRegistry(prefix="shared")
+            counter = registry.counter("requests_total", "Test requests.", ("endpoint",))
+            histogram = registry.histogram("latency_seconds", "Test latency.", ("endpoint",), buckets=(0.1,))
+            for _ in range(requests):
+                counter.inc(("e",))
+                histogram.observe(("e",), 0.05)
+            return registry
+
+        with tempfile.TemporaryDirectory() as directory:
+            worker(3).write_snapshot(directory)  # a worker that has since exited
+            text = worker(2).render(directory=directory)
+            self.assertEqual(sample(text, "shared_requests_total", endpoint="e"), 5)
+            self.assertEqual(sample(text, "shared_latency_seconds_bucket", endpoint="e", le="0.1"), 5)
+            self.assertNotIn("worker=", text)
+            # Whichever worker answers, the totals are the same.
+            self.assertEqual(sample(worker(0).render(directory=directory), "shared_requests_total", endpoint="e"), 5)
+
+    def test_auth_token(self):
+        app = Flask(__name__)
+        app.config.update(METRICS_AUTH_TOKEN="scrape-secret")
+        Metrics(app, registry=MetricsRegistry(prefix="auth"))
+        client = app.test_client()
+        self.assertEqual(client.get("/metrics").status_code, 401)
+        resp = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        self.assertEqual(resp.status_code, 200)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Test Scenarios for the password hashing pool (utilities/hash_pool.py):
+1. Hashes computed on the pool verify with bcrypt, and stats count them.
+2. Once workers + queue_size calls are in flight, the next call is rejected at once.
+3. A call that cannot start before its deadline fails with ServiceUnavailableError.
+4. A saturated pool turns POST /api/register into 503 with a Retry-After header.
+"""
+
+import threading
+import unittest
+import bcrypt
+from app import create_app
+from app.config import Config
+from utilities.custom_exceptions import ServiceUnavailableError
+from utilities.hash_pool import HashPool
+
+
+class TestHashPool(unittest.TestCase):
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.pools = []
+
+    def tearDown(self):
+        self.release.set()
+        for pool in self.pools:
+            pool.shutdown()
+
+    def _pool(self, **kwargs):
+        pool = HashPool(**kwargs)
+        self.pools.append(pool)
+        return pool
+
+    def _occupy(self, pool, count):
+        """Start count calls that block until self.release is set."""
+        started = threading.Semaphore(0)
+
+        def blocker():
+            started.release()
+            self.release.wait(5)
+
+        threads = [threading.Thread(target=pool.run, args=(blocker,)) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        return threads, started
+
+    def test_hash_and_check(self):
+        pool = self._pool(workers=1, queue_size=1)
+        hashed = pool.hash_password("password123")
+        self.assertTrue(bcrypt.checkpw(b"password123", hashed))
+        self.assertTrue(pool.check_password("password123", hashed))
+        self.assertFalse(pool.check_password("wrong", hashed.decode("utf-8")))
+        stats = pool.stats()
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["hash_time_total"], 0)
+
+    def test_rejects_when_full(self):
+        pool = self._pool(workers=1, queue_size=1, timeout=5, retry_after=3)
+        threads, started = self._occupy(pool, 2)
+        self.assertTrue(started.acquire(timeout=2), "First call should be running")
+        while pool.stats()["in_flight"] < 2:
+            pass
+        with self.assertRaises(ServiceUnavailableError) as ctx:
+            pool.run(lambda: None)
+        self.assertEqual(ctx.exception.retry_after, 3)
+        self.assertEqual(pool.stats()["rejected"], 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(pool.stats()["in_flight"], 0)
+        self.assertIsNone(pool.run(lambda: None), "Slots should be released once calls finish")
+
+    def test_deadline(self):
+        pool = self._pool(workers=1, queue_size=1, timeout=0.05)
+        threads, started = self._occupy(pool, 1)
+        self.assertTrue(started.acquire(timeout=2))
+        with self.assertRaises(ServiceUnavailableError):
+            pool.run(lambda: "late")
+        self.assertGreaterEqual(pool.stats()["timed_out"], 1)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+
+    def test_register_returns_503_when_saturated(self):
+        Config.TESTING = True
+        app = create_app()
+        client = app.test_client()
+        service = app.user_service
+        original = service.hash_pool
+        service.hash_pool = self._pool(workers=1, queue_size=0, timeout=5, retry_after=4)
+        try:
+            threads, started = self._occupy(service.hash_pool, 1)
+            self.assertTrue(started.acquire(timeout=2))
+            resp = client.post("/api/register", json={
+                "username": "busyuser",
+                "email": "busyuser@example.com",
+                "password": "password123"
+            })
+            self.assertEqual(resp.status_code, 503)
+            self.assertEqual(resp.headers.get("Retry-After"), "4")
+            self.assertIn("error", resp.get_json())
+        finally:
+            self.release.set()
+            service.hash_pool = original
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,11 @@ Test Scenarios for Listing Users with Pagination:
    - Expect GET /api/users to return a list of users equal to the default size.
 2. When valid pagination parameters are provided (e.g., page and size), the correct subset of users is returned.
 3. When invalid pagination parameters are provided (non-numeric or negative), expect a 400 Bad Request.
+4. Cursor pagination walks every user exactly once in username order.
+5. Password hashes and refresh tokens are never returned.
+6. role and prefix filters narrow the listing; an unknown role or malformed cursor
+   (including a well-formed one with an invalid user id, or a forged one carrying
+   query operators) is a 400.
 """
 
 import unittest
@@ -14,6 +19,7 @@ import json
 from app import create_app
 from app.config import Config
 from pymongo import MongoClient
+from utilities.pagination import encode_cursor
 
 class TestListUsers(unittest.TestCase):
 
@@ -84,6 +90,49 @@ class TestListUsers(unittest.TestCase):
         resp = self.client.get("/api/users?page=abc&size=-5")
         self.assertEqual(resp.status_code, 400, "Expected 400 status for invalid pagination parameters")
 
+    def test_list_users_cursor_pagination(self):
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            resp = self.client.get(f"/api/users?size=4&cursor={cursor}")
+            self.assertEqual(resp.status_code, 200)
+            data = resp.get_json()
+            self.assertLessEqual(len(data["users"]), 4)
+            seen.extend(user["username"] for user in data["users"])
+            cursor = data["next_cursor"]
+        self.assertEqual(len(seen), self.total_users + 1, "Every user (including the admin) exactly once")
+        self.assertEqual(seen, sorted(seen))
+
+    def test_list_users_omits_sensitive_fields(self):
+        resp = self.client.get("/api/users?size=100")
+        for user in resp.get_json():
+            self.assertNotIn("password", user)
+            self.assertNotIn("refresh_token", user)
+            self.assertIn("username", user)
+            self.assertIn("_id", user)
+
+    def test_list_users_filters(self):
+        resp = self.client.get("/api/users?size=100&role=admin")
+        self.assertEqual([user["username"] for user in resp.get_json()], ["adminuser"])
+        resp = self.client.get("/api/users?size=100&prefix=user1")
+        self.assertEqual(
+            [user["username"] for user in resp.get_json()],
+            ["user1", "user10", "user11", "user12", "user13", "user14"]
+        )
+        self.assertEqual(self.client.get("/api/users?role=root").status_code, 400)
+        self.assertEqual(self.client.get("/api/users?cursor=not-a-cursor").status_code, 400)
+        bad_id = encode_cursor(["user1", "not-an-object-id"])
+        self.assertEqual(self.client.get(f"/api/users?cursor={bad_id}").status_code, 400)
+        # Forged cursors carrying query operators instead of plain values.
+        for forged in (
+            [{"$ne": None}, "0123456789abcdef01234567"],
+            ["user1", {"$gt": ""}],
+            ["user1", "abcdefghijkl"],
+        ):
+            resp = self.client.get(f"/api/users?cursor={encode_cursor(forged)}")
+            self.assertEqual(resp.status_code, 400, f"Expected 400 for forged cursor {forged}")
+            self.assertEqual(resp.get_json()["error"], "Invalid cursor")
+
     @classmethod
     def tearDownClass(cls):
         cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
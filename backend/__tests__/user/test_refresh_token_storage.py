@@ -0,0 +1,142 @@
+"""
+References: backend/__docs__/useCases/user/UseCase_RefreshToken.md
+
+Test Scenarios for refresh token storage (utilities/auth_utils.py, UserService, sessions collection):
+1. Login opens a session keyed by the token's jti that stores an HMAC fingerprint, not the token.
+2. Refreshing rotates the session; the old refresh token is rejected afterwards.
+3. Logging in on a second device keeps the first device's session valid.
+4. A legacy refresh token (no jti) stored as a bcrypt hash on the user still refreshes,
+   and is moved into a session.
+5. Logout ends one session; logout-all ends every session of the user.
+6. verify_refresh_token rejects other tokens, other keys and unrecognised stored values.
+7. Login and refresh return the claims they signed, identical to decoding the access token.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+import bcrypt
+import jwt
+from app.config import Config
+from pymongo import MongoClient
+from services.user_service import UserService
+from utilities.auth_utils import (
+    REFRESH_FINGERPRINT_PREFIX,
+    refresh_token_fingerprint,
+    verify_refresh_token,
+)
+from utilities.custom_exceptions import UnauthorizedError
+
+
+class StorageTestConfig(Config):
+    # test_refresh_token.py forces expired refresh tokens through the environment.
+    JWT_REFRESH_TOKEN_EXPIRES = 60
+
+
+class TestRefreshTokenStorage(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.sessions.delete_many({})
+
+        cls.user_service = UserService(StorageTestConfig)
+        cls.user_service.register_user(
+            username="fingerprinter",
+            email="fingerprinter@example.com",
+            password="password123"
+        )
+
+    def setUp(self):
+        self.test_db.sessions.delete_many({})
+
+    def _session(self, token):
+        return self.test_db.sessions.find_one({"_id": jwt.decode(token, options={"verify_signature": False})["jti"]})
+
+    def test_login_opens_session_with_fingerprint(self):
+        token = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        session = self._session(token)
+        self.assertIsNotNone(session)
+        self.assertEqual(session["username"], "fingerprinter")
+        self.assertTrue(session["fingerprint"].startswith(REFRESH_FINGERPRINT_PREFIX))
+        self.assertEqual(
+            session["fingerprint"],
+            refresh_token_fingerprint(token, StorageTestConfig.REFRESH_TOKEN_FINGERPRINT_KEY)
+        )
+        self.assertIsInstance(session["expires_at"], datetime)
+        self.assertNotIn("refresh_token", self.test_db.users.find_one({"username": "fingerprinter"}))
+
+    def test_refresh_rotates_session(self):
+        old_token = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        result = self.user_service.refresh_access_token(old_token)
+        self.assertEqual(result["message"], "Token refreshed successfully")
+        self.assertIsNone(self._session(old_token))
+        self.assertIsNotNone(self._session(result["refresh_token"]))
+        with self.assertRaises(UnauthorizedError):
+            self.user_service.refresh_access_token(old_token)
+
+    def test_second_device_keeps_first_session(self):
+        first = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        second = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        self.assertEqual(self.test_db.sessions.count_documents({"username": "fingerprinter"}), 2)
+        self.user_service.refresh_access_token(first)
+        self.user_service.refresh_access_token(second)
+
+    def test_legacy_bcrypt_hash_still_refreshes(self):
+        now = datetime.now(timezone.utc)
+        legacy_token = jwt.encode({
+            "sub": "fingerprinter",
+            "email": "fingerprinter@example.com",
+            "iat": now.timestamp(),
+            "exp": (now + timedelta(seconds=60)).timestamp(),
+        }, Config.JWT_SECRET_KEY, algorithm=Config.JWT_ALGORITHM)
+        legacy_hash = bcrypt.hashpw(legacy_token.encode("utf-8"), bcrypt.gensalt())
+        self.test_db.users.update_one({"username": "fingerprinter"}, {"$set": {"refresh_token": legacy_hash}})
+
+        result = self.user_service.refresh_access_token(legacy_token)
+        self.assertEqual(result["message"], "Token refreshed successfully")
+        self.assertIsNotNone(self._session(result["refresh_token"]))
+        self.assertNotIn("refresh_token", self.test_db.users.find_one({"username": "fingerprinter"}))
+        with self.assertRaises(UnauthorizedError):
+            self.user_service.refresh_access_token(legacy_token)
+
+    def test_logout_and_logout_all(self):
+        first = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        second = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        third = self.user_service.login_user("fingerprinter", "password123")["refresh_token"]
+        self.user_service.logout_user(first)
+        self.assertIsNone(self._session(first))
+        self.assertIsNotNone(self._session(second))
+
+        result = self.user_service.logout_all_sessions("fingerprinter")
+        self.assertEqual(result["sessions_revoked"], 2)
+        for token in (second, third):
+            with self.assertRaises(UnauthorizedError):
+                self.user_service.refresh_access_token(token)
+
+    def test_returned_claims_match_signed_token(self):
+        login = self.user_service.login_user("fingerprinter", "password123")
+        refreshed = self.user_service.refresh_access_token(login["refresh_token"])
+        for result in (login, refreshed):
+            decoded = jwt.decode(result["access_token"], Config.JWT_SECRET_KEY, algorithms=[Config.JWT_ALGORITHM])
+            self.assertEqual(result["claims"], decoded)
+            self.assertNotIn("password", result["user"])
+
+    def test_verify_rejects_mismatches(self):
+        stored = refresh_token_fingerprint("token-a", "key-1")
+        self.assertTrue(verify_refresh_token("token-a", stored, "key-1"))
+        self.assertFalse(verify_refresh_token("token-b", stored, "key-1"))
+        self.assertFalse(verify_refresh_token("token-a", stored, "key-2"))
+        self.assertFalse(verify_refresh_token("token-a", None, "key-1"))
+        self.assertFalse(verify_refresh_token("token-a", "not-a-hash", "key-1"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
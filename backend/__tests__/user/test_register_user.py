@@ -5,12 +5,15 @@ This TDD test checks:
 1. Successful registration with valid data
 2. Failure if required fields are missing
 3. Failure if user (email or username) already exists
+4. Missing unique username/email indexes are created before the first registration
+5. Registration is refused (503) while the unique indexes can't be built
 """
 
 import unittest
 from app import create_app
 from app.config import Config
 from services.user_service import UserService
+from utilities.custom_exceptions import ServiceUnavailableError, ValidationError
 from pymongo import MongoClient
 
 class TestRegisterUser(unittest.TestCase):
@@ -100,6 +103,30 @@ class TestRegisterUser(unittest.TestCase):
         self.assertIn("error", data)
         self.assertIn("User already exists", data["error"])
 
+    def test_register_recreates_missing_unique_indexes(self):
+        # e.g. MONGO_ENSURE_INDEXES=false, or the startup bootstrap failed
+        self.test_db.users.drop_indexes()
+        service = UserService(Config)
+        service.register_user("indexuser", "indexuser@example.com", "password123")
+        with self.assertRaises(ValidationError):
+            service.register_user("indexuser", "indexuser@example.com", "password123")
+        self.assertEqual(self.test_db.users.count_documents({"username": "indexuser"}), 1)
+
+    def test_register_refused_without_unique_indexes(self):
+        self.test_db.users.drop_indexes()
+        self.test_db.users.insert_many([
+            {"username": "twin", "email": "twin@example.com"},
+            {"username": "twin", "email": "twin@example.com"},
+        ])
+        service = UserService(Config)
+        try:
+            with self.assertRaises(ServiceUnavailableError):
+                service.register_user("someone", "someone@example.com", "password123")
+            self.assertIsNone(self.test_db.users.find_one({"username": "someone"}))
+        finally:
+            self.test_db.users.delete_many({})
+            service.repo.ensure_unique_indexes()
+
     @classmethod
     def tearDownClass(cls):
         # Drop the entire test DB (optional)
@@ -0,0 +1,134 @@
+"""
+Test Scenarios for access-token revocation (services/revocation_service.py):
+1. Deleting a user revokes their outstanding access tokens (401 on a protected route).
+2. Changing a user's role revokes their tokens; a token from a fresh login is accepted.
+3. Logout revokes the presented access token.
+4. A revocation made by one worker reaches another worker's mirror on its next sync.
+5. The Bloom filter never misses an added item and stays near its false-positive rate.
+6. Live revocations beyond REVOCATION_BLOOM_CAPACITY grow the filter in a few rebuilds, not one per revocation.
+"""
+
+import time
+import unittest
+from app import create_app
+from app.config import Config
+from pymongo import MongoClient
+from services.revocation_service import RevocationService
+from utilities.bloom_filter import BloomFilter
+
+
+class TestTokenRevocation(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        Config.TESTING = True
+        cls.app = create_app()
+        cls.admin_client = cls.app.test_client()
+
+        cls.mongo_client = MongoClient(Config.MONGO_URI)
+        cls.test_db = cls.mongo_client[Config.MONGO_DB_NAME]
+        cls.test_db.users.delete_many({})
+        cls.test_db.revocations.delete_many({})
+
+        cls.admin_client.post("/api/register", json={
+            "username": "revokeadmin",
+            "email": "revokeadmin@example.com",
+            "password": "adminpass"
+        })
+        cls.test_db.users.update_one({"username": "revokeadmin"}, {"$set": {"role": "admin"}})
+        login_resp = cls.admin_client.post(
+            "/api/login",
+            json={"username_or_email": "revokeadmin", "password": "adminpass"}
+        )
+        if login_resp.status_code != 200:
+            raise Exception(f"Admin login failed with status {login_resp.status_code}")
+        cls.admin_client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+
+    def _login(self, username):
+        client = self.app.test_client()
+        client.post("/api/register", json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "password123"
+        })
+        login_resp = client.post("/api/login", json={"username_or_email": username, "password": "password123"})
+        self.assertEqual(login_resp.status_code, 200)
+        client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+        self.assertEqual(client.get("/api/protected").status_code, 200)
+        user_id = str(self.test_db.users.find_one({"username": username})["_id"])
+        return client, user_id
+
+    def test_delete_user_revokes_tokens(self):
+        client, user_id = self._login("revokedelete")
+        resp = self.admin_client.delete(f"/api/users/{user_id}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(client.get("/api/protected").status_code, 401)
+
+    def test_role_change_revokes_tokens(self):
+        client, user_id = self._login("revokerole")
+        resp = self.admin_client.put(f"/api/users/{user_id}", json={"role": "moderator"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(client.get("/api/protected").status_code, 401)
+
+        time.sleep(0.01)
+        login_resp = client.post("/api/login", json={"username_or_email": "revokerole", "password": "password123"})
+        client.set_cookie("access_token", login_resp.get_json()["access_token"], domain="localhost")
+        resp = client.get("/api/protected")
+        self.assertEqual(resp.status_code, 200, "A token issued after the revocation should be accepted")
+        self.assertEqual(resp.get_json()["claims"]["role"], "moderator")
+
+    def test_logout_revokes_access_token(self):
+        client, _ = self._login("revokelogout")
+        token = client.get_cookie("access_token").value
+        client.post("/api/logout")
+        client.set_cookie("access_token", token, domain="localhost")
+        self.assertEqual(client.get("/api/protected").status_code, 401)
+
+    def test_other_worker_syncs(self):
+        now = [0.0]
+        worker_a = RevocationService(Config, clock=lambda: now[0])
+        worker_b = RevocationService(Config, clock=lambda: now[0])
+        payload = {"sub": "otherworker", "jti": "abc", "iat": time.time() - 1}
+        self.assertFalse(worker_b.is_revoked(payload))
+        worker_a.revoke_user("otherworker")
+        self.assertTrue(worker_a.is_revoked(payload))
+        self.assertFalse(worker_b.is_revoked(payload), "Worker B only sees it after its sync interval")
+        now[0] += Config.REVOCATION_SYNC_INTERVAL
+        self.assertTrue(worker_b.is_revoked(payload))
+
+    def test_bloom_filter(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"member-{i}")
+        self.assertTrue(all(f"member-{i}" in bloom for i in range(1000)))
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+    def test_bloom_grows_past_capacity(self):
+        class SmallBloomConfig(Config):
+            REVOCATION_BLOOM_CAPACITY = 10
+
+        service = RevocationService(SmallBloomConfig)
+        rebuilds = []
+        rebuild = service._rebuild_locked
+
+        def counting_rebuild():
+            rebuilds.append(len(service._tokens))
+            rebuild()
+
+        service._rebuild_locked = counting_rebuild
+        expires_at = time.time() + 600
+        for i in range(100):
+            service.revoke_token(f"overflow-{i}", expires_at)
+        self.assertLessEqual(len(rebuilds), 4, "Each rebuild should double the room for live entries")
+        self.assertGreaterEqual(service._bloom.capacity, 100)
+        self.assertTrue(all(service.is_revoked({"jti": f"overflow-{i}"}) for i in range(100)))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mongo_client.drop_database(Config.MONGO_DB_NAME)
+        cls.mongo_client.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
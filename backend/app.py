@@ -1,6 +1,8 @@
+# Development server. Production serving goes through wsgi.py and gunicorn.conf.py.
 from app import create_app
+from app.config import Config
 
 application = create_app()
 
 if __name__ == "__main__":
-    application.run(debug=True, host="0.0.0.0", port=5000, use_reloader=False)
+    application.run(debug=Config.DEBUG, host="0.0.0.0", port=5000, use_reloader=False)
@@ -1,7 +1,5 @@
 # app/__init__.py
-import signal
-import sys
-from flask import Flask, request
+from flask import Flask, current_app, request
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_swagger_ui import get_swaggerui_blueprint
@@ -10,6 +8,8 @@ from flask_limiter.util import get_remote_address
 from app.config import Config
 from app.error_handlers import register_error_handlers
 from app.routes import init_app  # Use our routes initializer
+from utilities.compression import Compressor
+from utilities.metrics import Metrics
 
 jwt = JWTManager()
 limiter = Limiter(
@@ -17,6 +17,8 @@ limiter = Limiter(
     default_limits=[Config.RATELIMIT_DEFAULT],
     storage_uri=Config.RATELIMIT_STORAGE_URL,
 )
+compressor = Compressor()
+metrics = Metrics()
 
 def create_app():
     app = Flask(__name__)
@@ -25,6 +27,8 @@ def create_app():
     cors_origins = Config.CORS_ORIGINS.split(',') if isinstance(Config.CORS_ORIGINS, str) else Config.CORS_ORIGINS
     CORS(app, supports_credentials=True, resources={r"/*": {"origins": cors_origins}})
     jwt.init_app(app)
+    # Before the limiter and the other hooks, so request timings include them.
+    metrics.init_app(app)
     limiter.init_app(app)
 
     # Swagger UI setup.
@@ -41,11 +45,45 @@ def create_app():
     # decorator application at route definition time for full functionality.
     # Global default limit (100/min) provides base protection for all endpoints.
 
+    # Services are built per app rather than at import time. Their repositories resolve
+    # the Mongo client on first use, so an app preloaded in a gunicorn master opens no
+    # connections until each forked worker needs one (see repositories/db.py).
+    from services.user_service import UserService
+    app.user_service = UserService(Config)
+
+    # Revoked access tokens (deleted/demoted users, logouts) are rejected with 401. The
+    # check is a Bloom filter probe against the user service's per-process mirror.
+    app.revocation_service = app.user_service.revocations
+
+    @jwt.token_in_blocklist_loader
+    def is_token_revoked(_jwt_header, jwt_payload):
+        return current_app.revocation_service.is_revoked(jwt_payload)
+
     # Instantiate ArticleService after routes have been registered.
     from services.article_service import ArticleService  # Now safe to import
     app.article_service = ArticleService()
 
+    # Component counters exported as gauges on /metrics, read at scrape time.
+    from repositories.db import pool_stats
+    metrics.add_collector(app, lambda: {
+        "password_hash_pool": app.user_service.hash_pool.stats(),
+        "revocations": app.revocation_service.stats(),
+        "mongo_pool": pool_stats() or {},
+    })
+    metrics.add_collector(app, app.article_service.stats)
+
+    if Config.MONGO_ENSURE_INDEXES:
+        from repositories.db import get_db
+        from repositories.indexes import ensure_indexes
+        from utilities.custom_exceptions import RepositoryError
+        try:
+            ensure_indexes(get_db())
+        except RepositoryError as e:
+            # Serving without indexes is slow but correct; don't block startup on it.
+            app.logger.error("Index bootstrap failed: %s", str(e))
+
     register_error_handlers(app)
+    compressor.init_app(app)
 
     @app.after_request
     def set_security_headers(response):
@@ -61,11 +99,7 @@ def create_app():
         response.headers["X-Content-Type-Options"] = "nosniff"
         return response
 
-    def shutdown_handler(signum, _):
-        app.logger.info("Shutdown initiated...", extra={"extra_data": {"signal": signum}})
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, shutdown_handler)
-    signal.signal(signal.SIGTERM, shutdown_handler)
+    # No signal handlers here: under gunicorn (gunicorn.conf.py) the master and workers
+    # own SIGTERM and drain in-flight requests before exiting.
 
     return app
@@ -24,6 +24,20 @@ class Config:
         MONGO_URI = os.getenv("MONGO_URI", "mongodb://atlas:27017/")
         MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "hive_db")
 
+    # Connection pool per process (so per gunicorn worker): MAX_POOL_SIZE x workers must fit
+    # the server's connection limit. WAIT_QUEUE_TIMEOUT_MS bounds how long a request waits
+    # for a free connection; checkouts slower than SLOW_CHECKOUT_MS are logged.
+    MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+    MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+    MONGO_POOL_SLOW_CHECKOUT_MS = float(os.getenv("MONGO_POOL_SLOW_CHECKOUT_MS", "100"))
+    # Wire compression, in preference order (zstd needs 'zstandard', snappy 'python-snappy');
+    # empty disables it. Worth it when the server is across a network, not on localhost.
+    MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "")
+
+    # Reconcile the declarative index registry (repositories/indexes.py) on startup
+    MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true"
+
     # Secret Keys - REQUIRED: Must be set via environment variables
     SECRET_KEY = os.getenv("SECRET_KEY")
     if not SECRET_KEY:
@@ -68,6 +82,16 @@ class Config:
         JWT_COOKIE_SECURE = False
         JWT_COOKIE_CSRF_PROTECT = False
 
+    # Key for the HMAC-SHA256 fingerprints of refresh tokens stored on user documents
+    # (defaults to JWT_SECRET_KEY). Changing it invalidates every outstanding refresh token.
+    REFRESH_TOKEN_FINGERPRINT_KEY = os.getenv("REFRESH_TOKEN_FINGERPRINT_KEY") or JWT_SECRET_KEY
+
+    # Access-token revocation: each worker mirrors the revocations collection behind a
+    # Bloom filter and pulls new entries at most every REVOCATION_SYNC_INTERVAL seconds
+    REVOCATION_SYNC_INTERVAL = float(os.getenv("REVOCATION_SYNC_INTERVAL", "5"))
+    REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "10000"))
+    REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.01"))
+
     JWT_ACCESS_COOKIE_NAME = "access_token"
     JWT_REFRESH_COOKIE_NAME = "refresh_token"
     
@@ -75,11 +99,93 @@ class Config:
     COOKIE_SAMESITE = os.getenv("COOKIE_SAMESITE", "Lax" if FLASK_ENV == "development" else "None")
 
     # Rate Limiting Configuration
+    # memory:// keeps counters per process, so with N gunicorn workers every limit is
+    # effectively N times higher. Production must use shared storage: mongodb:// (the
+    # app's own Mongo, no extra dependency) or redis:// (needs the redis package).
     RATELIMIT_STORAGE_URL = os.getenv("RATELIMIT_STORAGE_URL", "memory://")
+    if FLASK_ENV == "production" and not TESTING and RATELIMIT_STORAGE_URL.startswith("memory://"):
+        raise ValueError(
+            "RATELIMIT_STORAGE_URL must point at shared storage in production "
+            "(e.g. mongodb://host:27017/ or redis://host:6379); memory:// is per worker."
+        )
     RATELIMIT_DEFAULT = os.getenv("RATELIMIT_DEFAULT", "100 per minute")
     RATELIMIT_AUTH = os.getenv("RATELIMIT_AUTH", "5 per minute")
     RATELIMIT_WRITE = os.getenv("RATELIMIT_WRITE", "20 per minute")
 
+    # Password hashing runs on a bounded per-process pool: at most WORKERS hashes run and
+    # QUEUE_SIZE wait; beyond that, or past TIMEOUT seconds, requests get 503 + Retry-After
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", "8"))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", "5"))
+    PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "2"))
+
+    # Pagination: hard cap on page size so a single request cannot pull a whole collection
+    ARTICLES_MAX_PAGE_SIZE = int(os.getenv("ARTICLES_MAX_PAGE_SIZE", "100"))
+
+    # Same cap for the admin user listing (GET /api/users)
+    USERS_MAX_PAGE_SIZE = int(os.getenv("USERS_MAX_PAGE_SIZE", "100"))
+
+    # Article summaries precomputed on write so listings can skip the full body
+    ARTICLE_EXCERPT_LENGTH = int(os.getenv("ARTICLE_EXCERPT_LENGTH", "200"))
+    ARTICLE_WORDS_PER_MINUTE = int(os.getenv("ARTICLE_WORDS_PER_MINUTE", "200"))
+
+    # NDJSON export: documents fetched per cursor round trip (and per streamed chunk)
+    ARTICLE_EXPORT_BATCH_SIZE = int(os.getenv("ARTICLE_EXPORT_BATCH_SIZE", "500"))
+
+    # Bulk ingestion: items validated and written per insert_many round trip
+    ARTICLE_BULK_BATCH_SIZE = int(os.getenv("ARTICLE_BULK_BATCH_SIZE", "500"))
+
+    # Facets: buckets returned per facet (authors by count, months newest first)
+    ARTICLE_FACET_SIZE = int(os.getenv("ARTICLE_FACET_SIZE", "10"))
+
+    # Search: results per page by default, total results reachable through paging, and
+    # the query length below which an anchored title-prefix match replaces $text
+    SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "20"))
+    SEARCH_MAX_RESULTS = int(os.getenv("SEARCH_MAX_RESULTS", "100"))
+    SEARCH_MIN_TEXT_LENGTH = int(os.getenv("SEARCH_MIN_TEXT_LENGTH", "3"))
+    # Characters of body text returned around the best match in each search result
+    SEARCH_SNIPPET_LENGTH = int(os.getenv("SEARCH_SNIPPET_LENGTH", "160"))
+    # "mongo" uses the $text index; "index" ranks with an in-process BM25 inverted index
+    # that is updated on writes and rebuilt once older than SEARCH_INDEX_MAX_AGE seconds
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "mongo").lower()
+    SEARCH_INDEX_MAX_AGE = float(os.getenv("SEARCH_INDEX_MAX_AGE", "300"))
+    # mode=fuzzy search: minimum trigram (Jaccard) similarity between a query word and a title word
+    SEARCH_FUZZY_THRESHOLD = float(os.getenv("SEARCH_FUZZY_THRESHOLD", "0.25"))
+    # Search result cache keyed by normalized query + page, invalidated by a write generation
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_MAX_SIZE = int(os.getenv("SEARCH_CACHE_MAX_SIZE", "512"))
+    SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "30"))
+    # Title autocomplete (/api/articles/suggest): result cap and per-lookup time budget
+    SUGGEST_MAX_RESULTS = int(os.getenv("SUGGEST_MAX_RESULTS", "8"))
+    SUGGEST_TIME_BUDGET_MS = float(os.getenv("SUGGEST_TIME_BUDGET_MS", "20"))
+
+    # Read-through article cache (per process; TTL bounds staleness across workers)
+    ARTICLE_CACHE_ENABLED = os.getenv("ARTICLE_CACHE_ENABLED", "true").lower() == "true"
+    ARTICLE_CACHE_MAX_SIZE = int(os.getenv("ARTICLE_CACHE_MAX_SIZE", "1024"))
+    ARTICLE_CACHE_TTL = float(os.getenv("ARTICLE_CACHE_TTL", "30"))
+
+    # Response compression (gzip always; br/zstd when brotli/zstandard are installed)
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+    COMPRESS_BR_LEVEL = int(os.getenv("COMPRESS_BR_LEVEL", "4"))
+    COMPRESS_ZSTD_LEVEL = int(os.getenv("COMPRESS_ZSTD_LEVEL", "3"))
+
+    # Metrics: Prometheus text at METRICS_PATH (request latency per endpoint, Mongo command
+    # latency per collection/operation, component stats). When METRICS_AUTH_TOKEN is
+    # set, scrapes must send "Authorization: Bearer <token>". Off by default in
+    # production, where the endpoint would otherwise be public.
+    METRICS_ENABLED = os.getenv(
+        "METRICS_ENABLED", "false" if FLASK_ENV == "production" else "true"
+    ).lower() == "true"
+    METRICS_PATH = os.getenv("METRICS_PATH", "/metrics")
+    METRICS_AUTH_TOKEN = os.getenv("METRICS_AUTH_TOKEN", "")
+    # Recording is per process. With several workers (gunicorn.conf.py sets this), each
+    # writes its series here every METRICS_FLUSH_INTERVAL seconds and a scrape sums
+    # them all; otherwise a scrape only sees the worker that answered it.
+    METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")
+    METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
     DEBUG = FLASK_ENV != "production"
 
     def as_dict(self):
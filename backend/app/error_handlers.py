@@ -5,6 +5,8 @@ from utilities.custom_exceptions import (
     UserNotFoundError,
     ValidationError,
     UnauthorizedError,
+    ForbiddenError,
+    ServiceUnavailableError,
     RepositoryError,
     ServiceError,
 )
@@ -61,6 +63,21 @@ def register_error_handlers(app):
         error_msg = str(e) if str(e) else "Unauthorized"
         return jsonify({"error": error_msg, "message": error_msg}), 401
 
+    @app.errorhandler(ForbiddenError)
+    def handle_forbidden_error(e):
+        app.logger.warning("Forbidden: %s", str(e))
+        error_msg = str(e) if str(e) else "Forbidden"
+        return jsonify({"error": error_msg, "message": error_msg}), 403
+
+    @app.errorhandler(ServiceUnavailableError)
+    def handle_service_unavailable_error(e):
+        app.logger.warning("Service unavailable: %s", str(e))
+        error_msg = str(e) if str(e) else "Service unavailable"
+        response = jsonify({"error": error_msg, "message": error_msg})
+        if e.retry_after is not None:
+            response.headers["Retry-After"] = str(int(e.retry_after))
+        return response, 503
+
     @app.errorhandler(RepositoryError)
     def handle_repository_error(e):
         app.logger.error("Repository error: %s", str(e), exc_info=True)
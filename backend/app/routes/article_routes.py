@@ -1,12 +1,67 @@
 # app/routes/article_routes.py
-from flask import Blueprint, request, jsonify, current_app
+import json
+from datetime import datetime, timezone
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from app.schemas import ArticleCreateSchema, ArticleUpdateSchema
 from utilities.custom_exceptions import ValidationError
 from utilities.decorators import validate_request
+from utilities.http_cache import (
+    make_etag,
+    to_datetime,
+    is_not_modified,
+    not_modified_response,
+    conditional_json,
+)
 
 article_routes = Blueprint("article_routes", __name__)
 
+
+def _list_etag(articles):
+    """ETag for a list/search page: the request (page, fields, ...) plus each item's version."""
+    return make_etag(
+        request.full_path,
+        *(f"{article['article_id']}:{article.get('updated_at')}" for article in articles),
+    )
+
+
+def _page_etag(result):
+    """ETag for a list/search response, which is either a list or a dict with articles."""
+    if not isinstance(result, dict):
+        return _list_etag(result)
+    # Everything next to the page is part of the version too: facet counts and the
+    # total cover every match, and next_cursor changes once a later article appears.
+    extra = {key: value for key, value in result.items() if key != "articles"}
+    return make_etag(_list_etag(result["articles"]), json.dumps(extra, sort_keys=True, default=str))
+
+
+def _parse_filters():
+    """
+    Read the author=, month=YYYY-MM, from= and to= filters (dates in ISO 8601 or
+    RFC 1123; to is exclusive). month is shorthand for from/to covering that month.
+    """
+    filters = {"author": request.args.get("author") or None}
+    month = request.args.get("month")
+    if month:
+        try:
+            start = datetime.strptime(month, "%Y-%m").replace(tzinfo=timezone.utc)
+        except ValueError:
+            raise ValidationError("Invalid month filter") from None
+        filters["date_from"] = start
+        filters["date_to"] = start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    for param, name in (("from", "date_from"), ("to", "date_to")):
+        value = request.args.get(param)
+        if value:
+            filters[name] = to_datetime(value)
+            if filters[name] is None:
+                raise ValidationError(f"Invalid {param} filter")
+    return filters
+
+
+def _wants_facets():
+    return request.args.get("facets", "").lower() in ("1", "true", "yes")
+
+
 @article_routes.route("/api/articles", methods=["GET"])
 def get_articles():
     try:
@@ -14,10 +69,21 @@ def get_articles():
         limit = int(request.args.get("limit", 2))
     except ValueError:
         return jsonify({"error": "Invalid pagination parameters"}), 400
+    # Presence of cursor (or its alias after) switches to keyset pagination; empty starts at the top.
+    cursor = request.args.get("cursor", request.args.get("after"))
+    # Optional sparse fieldset, e.g. fields=title,author,excerpt,created_at
+    fields = request.args.get("fields")
 
     # Call the service method with page and limit.
-    articles = current_app.article_service.get_all_articles(page=page, limit=limit)
-    return jsonify(articles)
+    articles = current_app.article_service.get_all_articles(
+        page=page,
+        limit=limit,
+        cursor=cursor,
+        fields=fields,
+        filters=_parse_filters(),
+        facets=_wants_facets(),
+    )
+    return conditional_json(articles, _page_etag(articles))
 
 @article_routes.route("/api/articles", methods=["POST"])
 @jwt_required()
@@ -38,61 +104,145 @@ def create_article(validated_data):
     )
     return jsonify(result), 201
 
+def _iter_ndjson(stream):
+    """Lazily parse one JSON value per line; malformed lines yield None (reported per item)."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+@article_routes.route("/api/articles/bulk", methods=["POST"])
+@jwt_required()
+def bulk_create_articles():
+    claims = get_jwt()
+    if claims.get("role", "regular") not in ["moderator", "admin"]:
+        return jsonify({"error": "User not authorized to create articles", "message": "User not authorized to create articles"}), 403
+
+    if request.mimetype == "application/x-ndjson":
+        # Read the body line by line so large imports are never held in memory at once.
+        items = _iter_ndjson(request.stream)
+    else:
+        items = request.get_json(silent=True)
+        if not isinstance(items, list):
+            return jsonify({"error": "Expected a JSON array of articles", "message": "Expected a JSON array of articles"}), 400
+
+    result = current_app.article_service.bulk_create_articles(items, author=get_jwt_identity())
+    if result["inserted"] == 0 and result["failed"] == 0:
+        return jsonify({"error": "No articles provided", "message": "No articles provided"}), 400
+    # 207 Multi-Status when only part of the batch was stored.
+    return jsonify(result), 201 if result["failed"] == 0 else 207
+
+@article_routes.route("/api/articles/export", methods=["GET"])
+@jwt_required()
+def export_articles():
+    claims = get_jwt()
+    if claims.get("role", "").lower() != "admin":
+        return jsonify({"error": "User not authorized to export articles", "message": "User not authorized to export articles"}), 403
+    since = request.args.get("since")
+    if since:
+        since = to_datetime(since)
+        if since is None:
+            return jsonify({"error": "Invalid since parameter", "message": "Invalid since parameter"}), 400
+    service = current_app.article_service
+    # Validate fields before the response starts streaming so errors still map to 400.
+    articles = service.export_articles(since=since, fields=request.args.get("fields"))
+    batch_size = service.export_batch_size
+    dumps = current_app.json.dumps
+
+    def generate():
+        lines = []
+        for article in articles:
+            lines.append(dumps(article))
+            if len(lines) >= batch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
 @article_routes.route("/api/articles/<article_id>", methods=["GET"])
 def get_article(article_id):
+    if request.if_none_match:
+        # Revalidation: compare against the version (cache or updated_at-only projection)
+        # before fetching the body.
+        version = current_app.article_service.get_article_version(article_id)
+        etag = make_etag(article_id, version)
+        if is_not_modified(etag):
+            return not_modified_response(etag, to_datetime(version))
     result = current_app.article_service.get_article_by_id(article_id)
     # Rename _id to article_id in the response
     if "_id" in result:
         result["article_id"] = result.pop("_id")
-    return jsonify(result)
+    version = result.get("updated_at")
+    return conditional_json(result, make_etag(article_id, version), to_datetime(version))
+
+def _owner_filter():
+    """Author the write must be restricted to: None for moderators/admins, else the caller."""
+    if get_jwt().get("role", "regular") in ["admin", "moderator"]:
+        return None
+    return get_jwt_identity()
 
 @article_routes.route("/api/articles/<article_id>", methods=["PUT"])
 @jwt_required()
 @validate_request(ArticleUpdateSchema)
 def update_article(article_id, validated_data):
-    # Retrieve the JWT claims and identity
-    claims = get_jwt()
-    user_role = claims.get("role", "regular")
-    username = get_jwt_identity()
-    
-    # Get the article to check author
-    article = current_app.article_service.get_article_by_id(article_id)
-    
-    # Check authorization: admin/moderator can update any article, author can update their own
-    article_author = article.get("author")
-    if user_role not in ["admin", "moderator"] and username != article_author:
-        return jsonify({"error": "User not authorized to update this article", "message": "User not authorized to update this article"}), 403
-    
     # Check if validated_data is empty (all fields are optional, so empty dict means no update data)
     if not validated_data or (isinstance(validated_data, dict) and len(validated_data) == 0):
         return jsonify({"error": "No data provided for update", "message": "No data provided for update"}), 400
+    # Admin/moderator can update any article, authors only their own. The ownership check
+    # is part of the write filter; the service raises 403 or 404 when nothing matched.
     result = current_app.article_service.update_article(
-        article_id, title=validated_data.get("title"), content=validated_data.get("content")
+        article_id,
+        title=validated_data.get("title"),
+        content=validated_data.get("content"),
+        author=_owner_filter(),
     )
     return jsonify(result), 200
 
 @article_routes.route("/api/articles/<article_id>", methods=["DELETE"])
 @jwt_required()
 def delete_article(article_id):
-    # Retrieve the JWT claims and identity
-    claims = get_jwt()
-    user_role = claims.get("role", "regular")
-    username = get_jwt_identity()
-    
-    # Get the article to check author
-    article = current_app.article_service.get_article_by_id(article_id)
-    
-    # Check authorization: admin/moderator can delete any article, author can delete their own
-    article_author = article.get("author")
-    if user_role not in ["admin", "moderator"] and username != article_author:
-        return jsonify({"error": "User not authorized to delete this article", "message": "User not authorized to delete this article"}), 403
-    
-    result = current_app.article_service.delete_article(article_id)
+    # Admin/moderator can delete any article, authors only their own (checked in the write filter).
+    result = current_app.article_service.delete_article(article_id, author=_owner_filter())
     return jsonify(result), 200
 
+@article_routes.route("/api/articles/suggest", methods=["GET"])
+def suggest_articles():
+    prefix = request.args.get("prefix", "")
+    try:
+        limit = request.args.get("limit")
+        limit = int(limit) if limit is not None else None
+    except ValueError:
+        return jsonify({"error": "Invalid limit parameter"}), 400
+    # Service will raise ValidationError if prefix is empty
+    suggestions = current_app.article_service.suggest_titles(prefix, limit=limit)
+    etag = make_etag(request.full_path, *(f"{s['article_id']}:{s['title']}" for s in suggestions))
+    return conditional_json(suggestions, etag)
+
 @article_routes.route("/api/articles/search", methods=["GET"])
 def search_articles():
     query = request.args.get("query", "")
+    fields = request.args.get("fields")
+    try:
+        page = int(request.args.get("page", 1))
+        limit = request.args.get("limit")
+        limit = int(limit) if limit is not None else None
+    except ValueError:
+        return jsonify({"error": "Invalid pagination parameters"}), 400
     # Service will raise ValidationError if query is empty
-    results = current_app.article_service.search_articles(query)
-    return jsonify(results), 200
+    # mode=fuzzy tolerates typos by matching title words on trigram similarity
+    results = current_app.article_service.search_articles(
+        query,
+        fields=fields,
+        page=page,
+        limit=limit,
+        mode=request.args.get("mode") or None,
+        filters=_parse_filters(),
+        facets=_wants_facets(),
+    )
+    return conditional_json(results, _page_etag(results))
@@ -1,16 +1,13 @@
 # backend/app/routes/user_routes.py
-import jwt
 from flask import Blueprint, request, jsonify, make_response, current_app
 from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from bson import ObjectId
-from services.user_service import UserService
 from app.config import Config
 from app.schemas import UserRegisterSchema, UserLoginSchema, UserUpdateSchema
 from utilities.decorators import validate_request
 from utilities.auth_utils import set_auth_cookies, delete_auth_cookies
 
 user_routes = Blueprint("user_routes", __name__)
-user_service = UserService(Config)
 
 def get_limiter():
     """Get limiter instance from app context."""
@@ -22,7 +19,7 @@ def get_limiter():
 @validate_request(UserRegisterSchema)
 def register(validated_data):
     # Rate limiting applied via limiter decorator in __init__.py
-    result = user_service.register_user(
+    result = current_app.user_service.register_user(
         validated_data["username"], validated_data["email"], validated_data["password"]
     )
     return jsonify(result), 201
@@ -31,22 +28,15 @@ def register(validated_data):
 @validate_request(UserLoginSchema)
 def login(validated_data):
     # Rate limiting applied via limiter decorator in __init__.py
-    result = user_service.login_user(
+    result = current_app.user_service.login_user(
         validated_data["username_or_email"], validated_data["password"]
     )
-    
-    # Decode JWT to get claims for response (same format as /protected endpoint)
-    decoded_token = jwt.decode(
-        result["access_token"],
-        Config.JWT_SECRET_KEY,
-        algorithms=["HS256"],
-        options={"verify_signature": True}
-    )
-    
+
+    # Claims (same format as /protected) come from the service that signed them.
     response_data = {
         "message": result["message"],
         "username": result["user"]["username"],
-        "claims": decoded_token
+        "claims": result["claims"]
     }
     if Config.TESTING:
         response_data["access_token"] = result["access_token"]
@@ -57,27 +47,31 @@ def login(validated_data):
 
 @user_routes.route("/api/logout", methods=["POST"])
 def logout():
-    response = make_response(jsonify({"message": "Logged out successfully"}))
+    result = current_app.user_service.logout_user(
+        request.cookies.get("refresh_token", ""), request.cookies.get("access_token", "")
+    )
+    response = make_response(jsonify(result))
+    delete_auth_cookies(response, Config)
+    return response
+
+@user_routes.route("/api/logout/all", methods=["POST"])
+@jwt_required()
+def logout_all():
+    result = current_app.user_service.logout_all_sessions(get_jwt_identity())
+    response = make_response(jsonify(result))
     delete_auth_cookies(response, Config)
     return response
 
 @user_routes.route("/api/refresh", methods=["POST"])
 def refresh():
     refresh_token = request.cookies.get("refresh_token", "")
-    result = user_service.refresh_access_token(refresh_token)
-    
-    # Decode new access token to get claims/exp for frontend
-    decoded_token = jwt.decode(
-        result["access_token"],
-        Config.JWT_SECRET_KEY,
-        algorithms=["HS256"],
-        options={"verify_signature": True}
-    )
-    
+    result = current_app.user_service.refresh_access_token(refresh_token)
+
+    # Claims (same format as /protected) come from the service that signed them.
     response_data = {
         "message": result["message"],
         "username": result["user"]["username"],
-        "claims": decoded_token
+        "claims": result["claims"]
     }
     if Config.TESTING:
         response_data["access_token"] = result["access_token"]
@@ -102,7 +96,7 @@ def create_user_admin(validated_data):
     claims = get_jwt()
     if claims.get("role", "").lower() != "admin":
         return jsonify({"error": "User not authorized to create users", "message": "User not authorized to create users"}), 403
-    result = user_service.register_user(
+    result = current_app.user_service.register_user(
         validated_data["username"], validated_data["email"], validated_data["password"]
     )
     return jsonify(result), 201
@@ -121,7 +115,7 @@ def update_user(user_id, validated_data):
     claims = get_jwt()
     if claims.get("role", "").lower() != "admin":
         return jsonify({"error": "User not authorized to update users", "message": "User not authorized to update users"}), 403
-    result = user_service.update_user(user_id, validated_data)
+    result = current_app.user_service.update_user(user_id, validated_data)
     return jsonify(result), 200
 
 @user_routes.route("/api/users/<string:user_id>", methods=["DELETE"])
@@ -134,7 +128,7 @@ def delete_user(user_id):
     claims = get_jwt()
     if claims.get("role", "").lower() != "admin":
         return jsonify({"error": "User not authorized to delete users", "message": "User not authorized to delete users"}), 403
-    result = user_service.delete_user(user_id)
+    result = current_app.user_service.delete_user(user_id)
     return jsonify(result), 200
 
 # New Route: List Users with Pagination
@@ -151,15 +145,12 @@ def list_users():
             raise ValueError("Pagination parameters must be positive integers")
     except ValueError:
         return jsonify({"error": "Invalid pagination parameters"}), 400
-    skip = (page - 1) * size
-    cursor = user_service.repo.users.find({}).sort("username", 1).skip(skip).limit(size)
-    users = []
-    for user in cursor:
-        # Remove sensitive fields and convert ObjectId to string.
-        user["_id"] = str(user["_id"])
-        if "password" in user:
-            user.pop("password")
-        if "refresh_token" in user:
-            user.pop("refresh_token")
-        users.append(user)
-    return jsonify(users), 200
+    # Presence of cursor switches to keyset pagination; empty starts at the top.
+    result = current_app.user_service.list_users(
+        page=page,
+        size=size,
+        cursor=request.args.get("cursor"),
+        role=request.args.get("role") or None,
+        username_prefix=request.args.get("prefix") or None,
+    )
+    return jsonify(result), 200
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Script to precompute excerpt, word_count and reading_time for existing articles,
+and the case-folded title_lower that title prefix search runs on.
+Run from backend directory: python backfill_article_summaries.py
+
+Articles created or updated through the API already carry these fields; this is
+only needed once for documents stored before they were introduced. Until then,
+prefix search does not find articles that lack title_lower.
+"""
+
+from dotenv import load_dotenv
+
+# Load .env file explicitly to ensure it's read
+load_dotenv()
+
+from app.config import Config
+from services.article_service import ArticleService
+
+
+if __name__ == "__main__":
+    print("Backfilling article summaries...")
+    print(f"Database: {Config.MONGO_DB_NAME}")
+    service = ArticleService()
+    count = service.backfill_summaries()
+    print(f"Updated {count} articles.")
+    print("Backfilling title_lower for prefix search...")
+    count = service.backfill_title_lower()
+    print(f"Updated {count} articles.")
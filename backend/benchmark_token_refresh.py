@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the CPU side of POST /api/refresh.
+Run from backend directory:
+
+    python benchmark_token_refresh.py              # 5000 refreshes per variant
+    python benchmark_token_refresh.py -n 20000
+
+Repositories are in-memory, so only token work is timed (decoding, signing,
+fingerprinting); Mongo round trips are not included. Two pipelines are compared:
+
+    before: unverified decode + verified decode + signing + route re-decode of the
+            new access token (what refresh used to do)
+    after:  UserService.refresh_access_token as it is now: one verified decode,
+            and the route echoes the claims the service signed
+
+Requires SECRET_KEY and JWT_SECRET_KEY like the application itself.
+"""
+
+import argparse
+import time
+from dotenv import load_dotenv
+
+load_dotenv()
+
+import jwt
+from app.config import Config
+from services.user_service import UserService
+
+
+class InMemoryUserRepository:
+    def __init__(self, user):
+        self.user = user
+
+    def find_by_username(self, username, fields=None):
+        if username != self.user["username"]:
+            return None
+        if fields is None:
+            return dict(self.user)
+        return {field: self.user[field] for field in fields if field in self.user}
+
+    find_by_email = find_by_username
+
+    def clear_refresh_token(self, username):
+        return self.user.pop("refresh_token", None) is not None
+
+
+class InMemorySessionRepository:
+    def __init__(self):
+        self.sessions = {}
+
+    def create_session(self, session_data):
+        self.sessions[session_data["_id"]] = session_data
+        return session_data["_id"]
+
+    def claim_session(self, session_id, username):
+        session = self.sessions.get(session_id)
+        if session is None or session["username"] != username:
+            return None
+        return self.sessions.pop(session_id)
+
+    def delete_session(self, session_id):
+        return self.sessions.pop(session_id, None) is not None
+
+    def delete_user_sessions(self, username):
+        doomed = [key for key, session in self.sessions.items() if session["username"] == username]
+        for key in doomed:
+            del self.sessions[key]
+        return len(doomed)
+
+
+class BenchConfig(Config):
+    # test_refresh_token.py and friends may shorten this through the environment.
+    JWT_REFRESH_TOKEN_EXPIRES = 3600
+
+
+def build_service():
+    user = {"username": "bench", "email": "bench@example.com", "role": "regular", "password": b""}
+    # Revocations and hashing are not on the refresh path, so no database is touched.
+    return UserService(
+        BenchConfig,
+        repository=InMemoryUserRepository(user),
+        session_repository=InMemorySessionRepository(),
+        revocations=object(),
+        hash_pool=object(),
+    )
+
+
+def refresh_before(service, token):
+    # The extra work the previous pipeline did around today's service call.
+    jwt.decode(token, options={"verify_signature": False, "verify_exp": False})
+    result = service.refresh_access_token(token)
+    jwt.decode(result["access_token"], Config.JWT_SECRET_KEY, algorithms=["HS256"])
+    return result
+
+
+def refresh_after(service, token):
+    result = service.refresh_access_token(token)
+    _ = result["claims"]
+    return result
+
+
+def run(variant, iterations):
+    service = build_service()
+    _, token, _ = service._issue_tokens(service.repo.user)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        token = variant(service, token)["refresh_token"]
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark refresh-token handling")
+    parser.add_argument("-n", "--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    run(refresh_after, min(200, args.iterations))  # warm up imports and caches
+    before = run(refresh_before, args.iterations)
+    after = run(refresh_after, args.iterations)
+    print(f"before: {before * 1e6:8.1f} us/refresh")
+    print(f"after:  {after * 1e6:8.1f} us/refresh")
+    print(f"saved:  {(before - after) * 1e6:8.1f} us/refresh ({(1 - after / before) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# backend/gunicorn.conf.py
+"""
+Gunicorn settings for production serving (see wsgi.py).
+
+Every value can be overridden through the environment, e.g. in docker-compose.
+Workers are preforked from a master that loads the app once (preload_app), so
+startup work such as the index bootstrap runs a single time. The Mongo client is
+per process: repositories/db.py drops the parent's client in each forked worker,
+and the master closes its own before spawning.
+
+Metrics are recorded per worker. METRICS_MULTIPROC_DIR (defaulted below, emptied
+when the server starts) is where workers write their snapshots, so whichever
+worker answers /metrics reports totals for the whole server.
+
+On SIGTERM the master stops accepting connections and gives workers up to
+graceful_timeout seconds to finish in-flight requests before killing them.
+"""
+
+import glob
+import multiprocessing
+import os
+import tempfile
+
+from dotenv import load_dotenv
+
+# Read .env first so a METRICS_MULTIPROC_DIR set there wins over the default below.
+load_dotenv()
+os.environ.setdefault("METRICS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "hive-metrics"))
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+# Threads per worker. bcrypt runs on the password hashing pool and pymongo releases
+# the GIL on I/O, so a few threads per process keep the CPU busy between waits.
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread" if threads > 1 else "sync"
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# Recycle workers after this many requests (plus jitter) to bound slow leaks; 0 disables.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+# Code reloading needs the app imported per worker, so it disables preloading.
+reload = os.getenv("GUNICORN_RELOAD", "false").lower() == "true"
+preload_app = not reload
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-")
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "info")
+
+
+def on_starting(server):
+    # Snapshots left by a previous run would be added to this one's totals.
+    directory = os.environ["METRICS_MULTIPROC_DIR"]
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.json")):
+            os.remove(path)
+
+
+def worker_exit(server, worker):
+    # Runs in the exiting worker: its last requests stay in the totals after it is gone.
+    from app.config import Config
+    from utilities.metrics import REGISTRY
+
+    if Config.METRICS_ENABLED and Config.METRICS_MULTIPROC_DIR:
+        REGISTRY.write_snapshot(Config.METRICS_MULTIPROC_DIR)
+
+
+def when_ready(server):
+    # Config is loaded here (with .env), after the app was preloaded.
+    from app.config import Config
+    from repositories.db import close_db
+
+    # Production refuses memory:// at config load; elsewhere, say what it means.
+    if workers > 1 and Config.RATELIMIT_STORAGE_URL.startswith("memory://"):
+        server.log.warning(
+            "RATELIMIT_STORAGE_URL is memory:// with %d workers: each worker counts on its own, "
+            "so rate limits are effectively %d times higher. Use mongodb:// or redis://.",
+            workers, workers,
+        )
+    # The preloaded app may have opened a client (index bootstrap); workers must not
+    # inherit it, and the master has no further use for it.
+    close_db()
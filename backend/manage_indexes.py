@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Script to reconcile and inspect MongoDB indexes declared by the repositories.
+Run from backend directory:
+
+    python manage_indexes.py ensure            # create missing indexes
+    python manage_indexes.py ensure --rebuild  # also recreate indexes whose definition changed
+    python manage_indexes.py report            # list missing and unused indexes
+
+The script reads MONGO_URI from .env file or environment variables.
+"""
+
+import argparse
+import json
+from dotenv import load_dotenv
+
+# Load .env file explicitly to ensure it's read
+load_dotenv()
+
+from app.config import Config
+from repositories.db import get_db
+from repositories.indexes import ensure_indexes, index_usage_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage Hive MongoDB indexes")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    ensure_parser = subparsers.add_parser("ensure", help="Create missing registered indexes")
+    ensure_parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Drop and recreate indexes whose definition differs from the registry",
+    )
+    subparsers.add_parser("report", help="Show missing and unused indexes")
+    args = parser.parse_args()
+
+    print(f"Database: {Config.MONGO_DB_NAME}")
+    db = get_db()
+    if args.command == "ensure":
+        report = ensure_indexes(db, rebuild=args.rebuild)
+    else:
+        report = index_usage_report(db)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,21 +7,79 @@ class BaseArticleRepository(ABC):
         """Create a new article document with the provided data."""
 
     @abstractmethod
-    def get_all_articles(self, skip=0, limit=2):
-        """Retrieve a list of article documents with pagination."""
+    def create_articles(self, articles):
+        """
+        Insert many article documents without stopping at the first failure.
+        Returns one (article_id, error) pair per document, in input order.
+        """
+
+    @abstractmethod
+    def get_all_articles(self, skip=0, limit=2, fields=None, filters=None):
+        """
+        Retrieve a list of article documents with pagination, optionally projected to fields.
+        filters may hold author, date_from and date_to (created_at range, end exclusive).
+        """
+
+    @abstractmethod
+    def get_articles_after(self, after_id=None, limit=2, fields=None, filters=None):
+        """Retrieve up to limit article documents matching filters whose _id sorts after after_id."""
+
+    @abstractmethod
+    def iter_articles(self, since=None, fields=None, batch_size=500):
+        """Yield every article (optionally updated at or after since) from one server-side cursor."""
 
     @abstractmethod
     def get_article_by_id(self, article_id):
         """Retrieve a single article document by its unique identifier."""
 
     @abstractmethod
-    def update_article(self, article_id, update_data):
-        """Update the article document identified by article_id with the given data."""
+    def get_articles_by_ids(self, article_ids, fields=None):
+        """Retrieve the given articles in the order of article_ids, skipping missing ones."""
+
+    @abstractmethod
+    def get_article_version(self, article_id):
+        """Return {"updated_at": ...} for the article without its body, or None if missing."""
+
+    @abstractmethod
+    def update_article(self, article_id, update_data, author=None, fields=None):
+        """
+        Update the article document identified by article_id with the given data.
+        When author is given, only an article owned by that author is updated.
+        Returns whether an article matched; with fields, the updated article limited
+        to those fields, or None when none matched.
+        """
+
+    @abstractmethod
+    def delete_article(self, article_id, author=None):
+        """
+        Delete the article document identified by article_id, restricted to author when given.
+        Returns whether an article matched.
+        """
+
+    @abstractmethod
+    def article_exists(self, article_id):
+        """Return whether an article with article_id exists."""
+
+    @abstractmethod
+    def search_articles(self, query, fields=None, skip=0, limit=20, prefix=False, filters=None):
+        """
+        Retrieve one page of article documents matching query and filters, best match
+        first, optionally projected to fields. prefix=True matches titles starting with query.
+        """
+
+    @abstractmethod
+    def get_articles_with_facets(
+        self, skip=0, limit=20, fields=None, filters=None, text=None, prefix=False, facet_size=10
+    ):
+        """
+        Return {"articles": page, "facets": {"author": [...], "month": [...]}, "total": n}
+        for the articles matching filters (and the search text, when given).
+        """
 
     @abstractmethod
-    def delete_article(self, article_id):
-        """Delete the article document identified by article_id."""
+    def get_articles_missing_title_lower(self, limit=100):
+        """Retrieve article_id and title of articles stored before title prefix search was indexed."""
 
     @abstractmethod
-    def search_articles(self, query):
-        """Retrieve a list of article documents by query."""
\ No newline at end of file
+    def get_articles_missing_summary(self, limit=100):
+        """Retrieve article_id and content of articles that have no precomputed excerpt yet."""
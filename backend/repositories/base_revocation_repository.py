@@ -0,0 +1,11 @@
+# backend/repositories/base_revocation_repository.py
+from abc import ABC, abstractmethod
+
+class BaseRevocationRepository(ABC):
+    @abstractmethod
+    def add_revocation(self, revocation):
+        """Record a revoked token id or a user revocation cutoff."""
+
+    @abstractmethod
+    def get_revocations_since(self, since=None):
+        """Return unexpired revocations created at or after since (all of them when None), oldest first."""
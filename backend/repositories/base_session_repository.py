@@ -0,0 +1,19 @@
+# backend/repositories/base_session_repository.py
+from abc import ABC, abstractmethod
+
+class BaseSessionRepository(ABC):
+    @abstractmethod
+    def create_session(self, session_data):
+        """Store a refresh-token session document keyed by its token id (_id)."""
+
+    @abstractmethod
+    def claim_session(self, session_id, username):
+        """Atomically remove and return the user's session with this token id, or None."""
+
+    @abstractmethod
+    def delete_session(self, session_id):
+        """Delete the session with this token id."""
+
+    @abstractmethod
+    def delete_user_sessions(self, username):
+        """Delete every session of the user and return how many were removed."""
@@ -3,12 +3,16 @@ from abc import ABC, abstractmethod
 
 class BaseUserRepository(ABC):
     @abstractmethod
-    def find_by_email(self, email):
-        """Find and return a user document by email."""
+    def find_by_email(self, email, fields=None):
+        """Find and return a user document by email, limited to fields when given."""
     
     @abstractmethod
-    def find_by_username(self, username):
-        """Find and return a user document by username."""
+    def find_by_username(self, username, fields=None):
+        """Find and return a user document by username, limited to fields when given."""
+    
+    @abstractmethod
+    def list_users(self, after=None, limit=10, skip=0, role=None, username_prefix=None):
+        """Return a page of users ordered by (username, _id), without sensitive fields."""
     
     @abstractmethod
     def create_user(self, user_data):
@@ -20,12 +24,8 @@ class BaseUserRepository(ABC):
     
     @abstractmethod
     def delete_user(self, user_id):
-        """Delete the user document identified by user_id."""
-    
-    @abstractmethod
-    def store_refresh_token(self, username, hashed_refresh):
-        """Store the hashed refresh token for the specified user."""
+        """Delete the user document identified by user_id; return the deleted document or None."""
     
     @abstractmethod
-    def get_refresh_token(self, username):
-        """Retrieve the stored refresh token for the specified user."""
+    def clear_refresh_token(self, username):
+        """Remove the legacy refresh token stored on the user document, if any."""
@@ -0,0 +1,91 @@
+# backend/repositories/cached_article_repository.py
+from utilities.logger import get_logger
+from utilities.lru_cache import TTLCache
+from .base_article_repository import BaseArticleRepository
+
+logger = get_logger(__name__)
+
+
+class CachedArticleRepository(BaseArticleRepository):
+    """
+    Read-through cache in front of another article repository.
+
+    Single-article lookups are served from an in-process TTLCache; update_article and
+    delete_article invalidate the entry. Every other call passes straight through.
+    The cache is per process, so writes made by other workers become visible here
+    after at most ttl seconds.
+    """
+
+    def __init__(self, repository, max_size=1024, ttl=30.0):
+        self.inner = repository
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def create_article(self, article_data):
+        return self.inner.create_article(article_data)
+
+    def create_articles(self, articles):
+        return self.inner.create_articles(articles)
+
+    def get_all_articles(self, skip=0, limit=2, fields=None, filters=None):
+        return self.inner.get_all_articles(skip=skip, limit=limit, fields=fields, filters=filters)
+
+    def get_articles_after(self, after_id=None, limit=2, fields=None, filters=None):
+        return self.inner.get_articles_after(
+            after_id=after_id, limit=limit, fields=fields, filters=filters
+        )
+
+    def iter_articles(self, since=None, fields=None, batch_size=500):
+        return self.inner.iter_articles(since=since, fields=fields, batch_size=batch_size)
+
+    def get_article_by_id(self, article_id):
+        article = self.cache.get(article_id)
+        if article is None:
+            article = self.inner.get_article_by_id(article_id)
+            if article is None:
+                return None
+            self.cache.set(article_id, article)
+        # Callers mutate the returned dict (e.g. renaming _id), so never hand out the cached one.
+        return dict(article)
+
+    def get_articles_by_ids(self, article_ids, fields=None):
+        return self.inner.get_articles_by_ids(article_ids, fields=fields)
+
+    def get_article_version(self, article_id):
+        article = self.cache.get(article_id)
+        if article is not None:
+            return {"updated_at": article.get("updated_at")}
+        return self.inner.get_article_version(article_id)
+
+    def update_article(self, article_id, update_data, author=None, fields=None):
+        try:
+            return self.inner.update_article(article_id, update_data, author=author, fields=fields)
+        finally:
+            self.cache.delete(article_id)
+
+    def delete_article(self, article_id, author=None):
+        try:
+            return self.inner.delete_article(article_id, author=author)
+        finally:
+            self.cache.delete(article_id)
+
+    def article_exists(self, article_id):
+        return self.inner.article_exists(article_id)
+
+    def search_articles(self, query, fields=None, skip=0, limit=20, prefix=False, filters=None):
+        return self.inner.search_articles(
+            query, fields=fields, skip=skip, limit=limit, prefix=prefix, filters=filters
+        )
+
+    def get_articles_with_facets(
+        self, skip=0, limit=20, fields=None, filters=None, text=None, prefix=False, facet_size=10
+    ):
+        return self.inner.get_articles_with_facets(
+            skip=skip, limit=limit, fields=fields, filters=filters,
+            text=text, prefix=prefix, facet_size=facet_size,
+        )
+
+    def get_articles_missing_title_lower(self, limit=100):
+        return self.inner.get_articles_missing_title_lower(limit=limit)
+
+    def get_articles_missing_summary(self, limit=100):
+        return self.inner.get_articles_missing_summary(limit=limit)
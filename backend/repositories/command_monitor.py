@@ -0,0 +1,59 @@
+# backend/repositories/command_monitor.py
+"""
+Mongo command metrics from pymongo's command events.
+
+Registered on the process's MongoClient by repositories/db.py next to PoolMonitor.
+Every command is timed into a histogram labelled by collection and operation (the
+command name: find, insert, aggregate, getMore, ...), and counted against the
+current request so /metrics shows how many commands each endpoint issues.
+"""
+from pymongo import monitoring
+from utilities.metrics import COMMAND_BUCKETS, REGISTRY, count_request_command
+
+
+def command_collection(command_name, command):
+    """Collection a command targets, or "" for database-level commands (ping, aggregate: 1, ...)."""
+    if command_name == "getMore":
+        target = command.get("collection")
+    else:
+        target = command.get(command_name)
+    return target if isinstance(target, str) else ""
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Records command durations and failures.
+
+    The collection is only on the started event, so it is parked by request_id until
+    the command finishes; dict set/pop are atomic, so no lock is needed.
+    """
+
+    def __init__(self, registry=REGISTRY):
+        self.duration = registry.histogram(
+            "mongo_command_duration_seconds",
+            "Mongo command latency by collection and operation.",
+            ("collection", "operation"),
+            COMMAND_BUCKETS,
+        )
+        self.failures = registry.counter(
+            "mongo_command_failures_total",
+            "Failed Mongo commands by collection and operation.",
+            ("collection", "operation"),
+        )
+        self._pending = {}
+
+    def started(self, event):
+        self._pending[event.request_id] = command_collection(event.command_name, event.command)
+
+    def _finish(self, event):
+        count_request_command()
+        collection = self._pending.pop(event.request_id, "")
+        labels = (collection, event.command_name)
+        self.duration.observe(labels, event.duration_micros / 1e6)
+        return labels
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self.failures.inc(self._finish(event))
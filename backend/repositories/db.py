@@ -1,26 +1,117 @@
+import os
+import threading
 from pymongo import MongoClient
+from repositories.command_monitor import CommandMonitor
+from repositories.pool_monitor import PoolMonitor
 from utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
 _mongo_client = None
 _db = None
+_pool_monitor = None
+_init_lock = threading.Lock()
+
+# Wire compressors pymongo supports, with the optional module each one needs.
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+def _available_compressors(setting):
+    """Parse MONGO_COMPRESSORS, dropping unknown names and ones whose module is missing."""
+    compressors = []
+    for name in (part.strip().lower() for part in setting.split(",")):
+        if not name:
+            continue
+        module = COMPRESSOR_MODULES.get(name)
+        if module is None:
+            logger.warning("Unknown Mongo compressor ignored", extra={"compressor": name})
+            continue
+        try:
+            __import__(module)
+        except ImportError:
+            logger.warning("Mongo compressor unavailable", extra={"compressor": name, "package": module})
+            continue
+        compressors.append(name)
+    return compressors
+
+def _client_options(config, pool_monitor):
+    options = {
+        "maxPoolSize": config.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": config.MONGO_MIN_POOL_SIZE,
+        "event_listeners": [pool_monitor],
+    }
+    if config.METRICS_ENABLED:
+        options["event_listeners"].append(CommandMonitor())
+    if config.MONGO_WAIT_QUEUE_TIMEOUT_MS > 0:
+        options["waitQueueTimeoutMS"] = config.MONGO_WAIT_QUEUE_TIMEOUT_MS
+    compressors = _available_compressors(config.MONGO_COMPRESSORS)
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
 
 def init_db():
-    """Initialize the MongoDB client and database only once."""
-    global _mongo_client, _db
+    """Initialize the MongoDB client and database once per process."""
+    global _mongo_client, _db, _pool_monitor
     if _mongo_client is None:
-        # Lazy import of Config to break circular dependency
-        from app.config import Config
-        _mongo_client = MongoClient(Config.MONGO_URI)
-        _db = _mongo_client[Config.MONGO_DB_NAME]
-        logger.info("Connected to database: %s", _db.name)
-        print(f"Connected to database: {_db.name}")
+        with _init_lock:
+            # Another request thread may have finished initializing while we waited.
+            if _mongo_client is None:
+                # Lazy import of Config to break circular dependency
+                from app.config import Config
+                pool_monitor = PoolMonitor(slow_checkout=Config.MONGO_POOL_SLOW_CHECKOUT_MS / 1000)
+                options = _client_options(Config, pool_monitor)
+                client = MongoClient(Config.MONGO_URI, **options)
+                _db = client[Config.MONGO_DB_NAME]
+                _pool_monitor = pool_monitor
+                # Published last: get_db() callers skip the lock once this is set.
+                _mongo_client = client
+                logger.info(
+                    "Connected to database: %s", _db.name,
+                    extra={
+                        "pid": os.getpid(),
+                        "max_pool_size": options["maxPoolSize"],
+                        "compressors": options.get("compressors", ""),
+                    },
+                )
+                print(f"Connected to database: {_db.name}")
     return _mongo_client, _db
 
 def get_db():
     """Return the initialized database instance."""
-    global _db
-    if _db is None:
-        init_db()
-    return _db
+    db = _db
+    if db is None or _mongo_client is None:
+        db = init_db()[1]
+    return db
+
+def pool_stats():
+    """Connection pool counters for this process (see PoolMonitor.stats), or None before first use."""
+    monitor = _pool_monitor
+    return monitor.stats() if monitor is not None else None
+
+def _forget_client_after_fork():
+    """
+    Drop the parent's client in a forked child (e.g. a gunicorn worker).
+
+    A MongoClient is not fork-safe: its pooled sockets and monitor threads belong
+    to the parent. The child must not close it either, as that would act on the
+    parent's connections; it simply builds its own on the next get_db().
+    """
+    global _mongo_client, _db, _pool_monitor, _init_lock
+    _mongo_client = None
+    _db = None
+    _pool_monitor = None
+    # The parent may have forked while another thread held the lock.
+    _init_lock = threading.Lock()
+
+def close_db():
+    """Close this process's client; the next get_db() opens a new one."""
+    global _mongo_client, _db, _pool_monitor
+    with _init_lock:
+        client = _mongo_client
+        _mongo_client = None
+        _db = None
+        _pool_monitor = None
+    if client is not None:
+        client.close()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_client_after_fork)
@@ -0,0 +1,127 @@
+# backend/repositories/indexes.py
+"""
+Declarative index registry.
+
+Each Mongo repository declares COLLECTION and INDEXES (a list of pymongo IndexModel).
+ensure_indexes() reconciles the database against that registry idempotently; it is run
+at application startup (MONGO_ENSURE_INDEXES) and by manage_indexes.py.
+"""
+from pymongo import errors
+from utilities.logger import get_logger
+from utilities.custom_exceptions import RepositoryError
+from .mongo_article_repository import MongoArticleRepository
+from .mongo_revocation_repository import MongoRevocationRepository
+from .mongo_session_repository import MongoSessionRepository
+from .mongo_user_repository import MongoUserRepository
+
+logger = get_logger(__name__)
+
+REGISTERED_REPOSITORIES = [
+    MongoUserRepository,
+    MongoArticleRepository,
+    MongoSessionRepository,
+    MongoRevocationRepository,
+]
+
+
+def get_index_registry():
+    """Return {collection_name: [IndexModel, ...]} for every registered repository."""
+    registry = {}
+    for repository in REGISTERED_REPOSITORIES:
+        registry.setdefault(repository.COLLECTION, []).extend(repository.INDEXES)
+    return registry
+
+
+def _spec_matches(spec, info):
+    """Compare a registered IndexModel document with an entry from index_information()."""
+    keys = list(spec["key"].items())
+    text_fields = {field for field, kind in keys if kind == "text"}
+    if text_fields:
+        return ("_fts", "text") in info["key"] and set(info.get("weights", {})) == text_fields
+    return (
+        [(field, direction) for field, direction in info["key"]] == keys
+        and bool(info.get("unique")) == bool(spec.get("unique"))
+        and info.get("expireAfterSeconds") == spec.get("expireAfterSeconds")
+    )
+
+
+def ensure_indexes(db, rebuild=False):
+    """
+    Create every registered index that is missing.
+
+    Args:
+        db: pymongo Database
+        rebuild: Drop and recreate indexes whose definition differs from the registry
+
+    Returns:
+        Dict per collection with 'created', 'existing', 'conflicts', 'failed' and 'unknown'
+        (indexes present in the database but not in the registry) name lists
+    """
+    report = {}
+    for collection_name, specs in get_index_registry().items():
+        collection = db[collection_name]
+        entry = {"created": [], "existing": [], "conflicts": [], "failed": [], "unknown": []}
+        try:
+            existing = collection.index_information()
+        except errors.PyMongoError as e:
+            logger.error("Error reading indexes", extra={"collection": collection_name, "error": str(e)})
+            raise RepositoryError(f"Error reading indexes: {str(e)}") from e
+        registered_names = set()
+        for spec in specs:
+            name = spec.document["name"]
+            registered_names.add(name)
+            info = existing.get(name)
+            if info is not None and _spec_matches(spec.document, info):
+                entry["existing"].append(name)
+                continue
+            if info is not None and not rebuild:
+                logger.warning(
+                    "Index definition differs from registry",
+                    extra={"collection": collection_name, "index": name},
+                )
+                entry["conflicts"].append(name)
+                continue
+            try:
+                if info is not None:
+                    collection.drop_index(name)
+                collection.create_indexes([spec])
+                entry["created"].append(name)
+                logger.info("Index created", extra={"collection": collection_name, "index": name})
+            except errors.PyMongoError as e:
+                # e.g. duplicate values blocking a unique index; keep reconciling the rest.
+                logger.error(
+                    "Error creating index",
+                    extra={"collection": collection_name, "index": name, "error": str(e)},
+                )
+                entry["failed"].append(name)
+        entry["unknown"] = sorted(name for name in existing if name not in registered_names | {"_id_"})
+        report[collection_name] = entry
+    return report
+
+
+def index_usage_report(db):
+    """
+    Report registered indexes that are missing and existing indexes that have never been used.
+
+    Usage counters come from $indexStats and reset when mongod restarts, so "unused"
+    only means unused since then.
+
+    Returns:
+        Dict per collection with 'missing' (registered names absent from the database)
+        and 'usage' ({index_name: ops}) plus 'unused' name lists
+    """
+    report = {}
+    for collection_name, specs in get_index_registry().items():
+        collection = db[collection_name]
+        try:
+            stats = list(collection.aggregate([{"$indexStats": {}}]))
+        except errors.PyMongoError as e:
+            logger.error("Error reading index stats", extra={"collection": collection_name, "error": str(e)})
+            raise RepositoryError(f"Error reading index stats: {str(e)}") from e
+        usage = {stat["name"]: stat["accesses"]["ops"] for stat in stats}
+        report[collection_name] = {
+            "missing": [spec.document["name"] for spec in specs if spec.document["name"] not in usage],
+            "usage": usage,
+            "unused": sorted(name for name, ops in usage.items() if ops == 0 and name != "_id_"),
+        }
+    return report
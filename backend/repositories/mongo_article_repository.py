@@ -1,6 +1,7 @@
+import re
 from utilities.logger import get_logger
-from utilities.custom_exceptions import RepositoryError
-from pymongo import errors
+from utilities.custom_exceptions import RepositoryError, ValidationError
+from pymongo import errors, IndexModel, ReturnDocument, ASCENDING, DESCENDING, TEXT
 from bson import ObjectId
 from bson.errors import InvalidId
 from .base_article_repository import BaseArticleRepository
@@ -10,12 +11,116 @@ from .db import get_db
 logger = get_logger(__name__)
 
 
+def _projection(fields):
+    """
+    Build a Mongo projection from a list of field names; None means the full document.
+    updated_at is always kept because it is the version used for ETags.
+    """
+    if fields is None:
+        # title_lower only backs prefix search, so it is never returned.
+        return {"title_lower": 0}
+    projection = {"_id": 1, "updated_at": 1}
+    projection.update({field: 1 for field in fields})
+    return projection
+
+
+def _filter_query(filters):
+    """
+    Translate service filters into predicates on indexed fields:
+    author -> (author, _id) / (author, created_at); date_from/date_to -> created_at.
+    """
+    query = {}
+    if not filters:
+        return query
+    if filters.get("author"):
+        query["author"] = filters["author"]
+    created_at = {}
+    if filters.get("date_from") is not None:
+        created_at["$gte"] = filters["date_from"]
+    if filters.get("date_to") is not None:
+        created_at["$lt"] = filters["date_to"]
+    if created_at:
+        query["created_at"] = created_at
+    return query
+
+
+def _title_lower(title):
+    """Case-folded title stored next to the title, so prefix search can use an index."""
+    return (title or "").casefold()
+
+
+def _search_query(query, prefix, filters):
+    match = _filter_query(filters)
+    if prefix:
+        # A case-sensitive anchored regex on the folded title is an index range scan;
+        # $options: "i" on title would have to examine every key.
+        match["title_lower"] = {"$regex": "^" + re.escape(_title_lower(query))}
+    else:
+        match["$text"] = {"$search": query}
+    return match
+
+
+def _search_sort(prefix):
+    if prefix:
+        return [("created_at", DESCENDING), ("_id", DESCENDING)]
+    return [("score", {"$meta": "textScore"}), ("_id", DESCENDING)]
+
+
+def _month_bucket():
+    # Only real dates have a month; legacy string timestamps fall out of the facet.
+    return {
+        "$cond": [
+            {"$eq": [{"$type": "$created_at"}, "date"]},
+            {"$dateToString": {"format": "%Y-%m", "date": "$created_at"}},
+            None,
+        ]
+    }
+
+
+def _facet_buckets(facet_size, key, sort):
+    return [
+        {"$group": {"_id": key, "count": {"$sum": 1}}},
+        {"$match": {"_id": {"$ne": None}}},
+        {"$sort": sort},
+        {"$limit": facet_size},
+        {"$project": {"_id": 0, "value": "$_id", "count": 1}},
+    ]
+
+
 class MongoArticleRepository(BaseArticleRepository):
-    def __init__(self):
-        self.db = get_db()  # Use the getter function to initialize the database
-        self.articles = self.db.articles
+    COLLECTION = "articles"
+    INDEXES = [
+        IndexModel([("created_at", DESCENDING)]),
+        IndexModel([("author", ASCENDING), ("created_at", DESCENDING)]),
+        # Serves author-filtered listings in the default _id order (page and cursor mode).
+        IndexModel([("author", ASCENDING), ("_id", ASCENDING)]),
+        # Serves incremental exports (since=) in index order, without an in-memory sort.
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)]),
+        # Serves title prefix search (short queries and partial last words).
+        IndexModel([("title_lower", ASCENDING)]),
+        IndexModel(
+            [("title", TEXT), ("content", TEXT)],
+            name="title_content_text",
+            weights={"title": 10, "content": 1},
+        ),
+    ]
+
+    def __init__(self, db=None):
+        # Scripts with their own client (e.g. seed_articles.py) pass db explicitly.
+        self._db = db
+
+    @property
+    def db(self):
+        # Resolved on use, so a repository built before a worker fork talks to the
+        # worker's own client rather than the parent's.
+        return self._db if self._db is not None else get_db()
+
+    @property
+    def articles(self):
+        return self.db.articles
 
     def create_article(self, article_data):
+        article_data["title_lower"] = _title_lower(article_data.get("title"))
         try:
             result = self.articles.insert_one(article_data)
             return str(result.inserted_id)
@@ -26,9 +131,30 @@ class MongoArticleRepository(BaseArticleRepository):
             )
             raise RepositoryError(f"Error creating article: {str(e)}") from e
 
-    def get_all_articles(self, skip=0, limit=2):
+    def create_articles(self, articles):
+        if not articles:
+            return []
+        failed = {}
+        for article in articles:
+            article["title_lower"] = _title_lower(article.get("title"))
         try:
-            cursor = self.articles.find({}).sort("_id", 1).skip(skip).limit(limit)
+            self.articles.insert_many(articles, ordered=False)
+        except errors.BulkWriteError as e:
+            # Unordered: every document without a write error was inserted.
+            failed = {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+            logger.warning("Bulk insert had write errors", extra={"failed": len(failed)})
+        except errors.PyMongoError as e:
+            logger.error("Error bulk creating articles", extra={"count": len(articles), "error": str(e)})
+            raise RepositoryError(f"Error creating articles: {str(e)}") from e
+        # insert_many assigns _id on the input documents before sending them.
+        return [
+            (None, failed[i]) if i in failed else (str(article["_id"]), None)
+            for i, article in enumerate(articles)
+        ]
+
+    def get_all_articles(self, skip=0, limit=2, fields=None, filters=None):
+        try:
+            cursor = self.articles.find(_filter_query(filters), _projection(fields)).sort("_id", 1).skip(skip).limit(limit)
             articles = []
             for article in cursor:
                 # Rename _id to article_id to match our API specification
@@ -39,6 +165,53 @@ class MongoArticleRepository(BaseArticleRepository):
             logger.error("Error retrieving articles", extra={"skip": skip, "limit": limit, "error": str(e)})
             raise RepositoryError(f"Error retrieving articles: {str(e)}") from e
 
+    def get_articles_after(self, after_id=None, limit=2, fields=None, filters=None):
+        """
+        Keyset pagination: seek past after_id on the _id index instead of skipping documents.
+        """
+        query = _filter_query(filters)
+        if after_id is not None:
+            try:
+                query["_id"] = {"$gt": ObjectId(after_id)}
+            except (InvalidId, TypeError) as e:
+                # A well-formed cursor can still carry a bad id; that is the client's error.
+                logger.warning("Invalid cursor article ID", extra={"after_id": after_id})
+                raise ValidationError("Invalid cursor") from e
+        try:
+            cursor = self.articles.find(query, _projection(fields)).sort("_id", 1).limit(limit)
+            articles = []
+            for article in cursor:
+                article["article_id"] = str(article.pop("_id"))
+                articles.append(article)
+            return articles
+        except errors.PyMongoError as e:
+            logger.error(
+                "Error retrieving articles after cursor",
+                extra={"after_id": after_id, "limit": limit, "error": str(e)},
+            )
+            raise RepositoryError(f"Error retrieving articles: {str(e)}") from e
+
+    def iter_articles(self, since=None, fields=None, batch_size=500):
+        """
+        Stream articles from a single cursor; only one batch is held in memory at a time.
+        With since, documents are filtered and ordered on the (updated_at, _id) index.
+        """
+        if since is not None:
+            query = {"updated_at": {"$gte": since}}
+            sort = [("updated_at", ASCENDING), ("_id", ASCENDING)]
+        else:
+            query = {}
+            sort = [("_id", ASCENDING)]
+        try:
+            cursor = self.articles.find(query, _projection(fields)).sort(sort).batch_size(batch_size)
+            with cursor:
+                for article in cursor:
+                    article["article_id"] = str(article.pop("_id"))
+                    yield article
+        except errors.PyMongoError as e:
+            logger.error("Error iterating articles", extra={"since": since, "error": str(e)})
+            raise RepositoryError(f"Error iterating articles: {str(e)}") from e
+
     def get_article_by_id(self, article_id):
         try:
             try:
@@ -48,7 +221,7 @@ class MongoArticleRepository(BaseArticleRepository):
                     "Invalid article ID format", extra={"article_id": article_id}
                 )
                 return None
-            article = self.articles.find_one({"_id": obj_id})
+            article = self.articles.find_one({"_id": obj_id}, _projection(None))
             if article:
                 article["_id"] = str(article["_id"])
                 return article
@@ -61,12 +234,72 @@ class MongoArticleRepository(BaseArticleRepository):
             )
             raise RepositoryError(f"Error retrieving article by ID: {str(e)}") from e
 
-    def update_article(self, article_id, update_data):
+    def get_articles_by_ids(self, article_ids, fields=None):
+        """Fetch a page of articles by id in one $in query, keeping the caller's order."""
+        object_ids = []
+        for article_id in article_ids:
+            try:
+                object_ids.append(ObjectId(article_id))
+            except (InvalidId, TypeError):
+                continue
+        if not object_ids:
+            return []
+        try:
+            by_id = {}
+            for article in self.articles.find({"_id": {"$in": object_ids}}, _projection(fields)):
+                article["article_id"] = str(article.pop("_id"))
+                by_id[article["article_id"]] = article
+            return [by_id[article_id] for article_id in article_ids if article_id in by_id]
+        except errors.PyMongoError as e:
+            logger.error("Error retrieving articles by ids", extra={"count": len(object_ids), "error": str(e)})
+            raise RepositoryError(f"Error retrieving articles by ids: {str(e)}") from e
+
+    def get_article_version(self, article_id):
+        """Fetch only updated_at, so conditional GETs can be answered without the body."""
+        try:
+            try:
+                obj_id = ObjectId(article_id)
+            except InvalidId:
+                return None
+            return self.articles.find_one({"_id": obj_id}, {"_id": 0, "updated_at": 1})
+        except errors.PyMongoError as e:
+            logger.error(
+                "Error retrieving article version",
+                extra={"article_id": article_id, "error": str(e)},
+            )
+            raise RepositoryError(f"Error retrieving article version: {str(e)}") from e
+
+    def update_article(self, article_id, update_data, author=None, fields=None):
+        """
+        Apply update_data in one round trip. When author is given the filter also
+        matches on author, so the ownership check and the write are atomic.
+        Returns False when no article matched the filter. With fields, returns the
+        updated article restricted to those fields instead (None when nothing matched),
+        read back by the same command.
+        """
+        if "title" in update_data:
+            update_data = {**update_data, "title_lower": _title_lower(update_data["title"])}
         try:
-            result = self.articles.update_one(
-                {"_id": ObjectId(article_id)}, {"$set": update_data}
+            try:
+                query = {"_id": ObjectId(article_id)}
+            except InvalidId:
+                return None if fields is not None else False
+            if author is not None:
+                query["author"] = author
+            if fields is None:
+                result = self.articles.find_one_and_update(
+                    query, {"$set": update_data}, projection={"_id": 1}
+                )
+                return result is not None
+            article = self.articles.find_one_and_update(
+                query,
+                {"$set": update_data},
+                projection=_projection(fields),
+                return_document=ReturnDocument.AFTER,
             )
-            return result.modified_count > 0
+            if article is not None:
+                article["article_id"] = str(article.pop("_id"))
+            return article
         except errors.PyMongoError as e:
             logger.error(
                 "Error updating article",
@@ -78,9 +311,15 @@ class MongoArticleRepository(BaseArticleRepository):
             )
             raise RepositoryError(f"Error updating article: {str(e)}") from e
 
-    def delete_article(self, article_id):
+    def delete_article(self, article_id, author=None):
         try:
-            result = self.articles.delete_one({"_id": ObjectId(article_id)})
+            try:
+                query = {"_id": ObjectId(article_id)}
+            except InvalidId:
+                return False
+            if author is not None:
+                query["author"] = author
+            result = self.articles.delete_one(query)
             return result.deleted_count > 0
         except errors.PyMongoError as e:
             logger.error(
@@ -89,17 +328,111 @@ class MongoArticleRepository(BaseArticleRepository):
             )
             raise RepositoryError(f"Error deleting article: {str(e)}") from e
 
-    def search_articles(self, query):
+    def article_exists(self, article_id):
+        """Cheap _id-only lookup, used to tell a missing article from a foreign one."""
+        try:
+            try:
+                obj_id = ObjectId(article_id)
+            except InvalidId:
+                return False
+            return self.articles.count_documents({"_id": obj_id}, limit=1) > 0
+        except errors.PyMongoError as e:
+            logger.error(
+                "Error checking article existence",
+                extra={"article_id": article_id, "error": str(e)},
+            )
+            raise RepositoryError(f"Error checking article existence: {str(e)}") from e
+
+    def search_articles(self, query, fields=None, skip=0, limit=20, prefix=False, filters=None):
         """
-        For now, perform a simple case-insensitive search in the title field.
+        Full-text search over title and content using the title_content_text index,
+        ranked by textScore (title matches weigh 10x). With prefix=True (short,
+        still-being-typed queries) match titles starting with the escaped query instead.
         """
         try:
-            cursor = self.articles.find({"title": {"$regex": query, "$options": "i"}})
+            cursor = self.articles.find(
+                _search_query(query, prefix, filters), _projection(fields)
+            ).sort(_search_sort(prefix))
             articles = []
-            for article in cursor:
+            for article in cursor.skip(skip).limit(limit):
                 article["article_id"] = str(article.pop("_id"))
                 articles.append(article)
             return articles
-        except Exception as e:
-            logger.error("Error in search_articles", extra={"error": str(e)})
-            raise e
+        except errors.PyMongoError as e:
+            logger.error("Error in search_articles", extra={"query": query, "error": str(e)})
+            raise RepositoryError(f"Error searching articles: {str(e)}") from e
+
+    def get_articles_with_facets(
+        self, skip=0, limit=20, fields=None, filters=None, text=None, prefix=False, facet_size=10
+    ):
+        """
+        One $facet aggregation returning a page of articles plus author and month bucket
+        counts (and the total) over everything matching filters and the optional search text.
+        Without text, the page is in _id order like get_all_articles.
+        """
+        stages = []
+        if text is None:
+            match, sort = _filter_query(filters), {"_id": ASCENDING}
+        elif prefix:
+            match, sort = _search_query(text, prefix, filters), dict(_search_sort(prefix))
+        else:
+            match, sort = _search_query(text, prefix, filters), {"_score": DESCENDING, "_id": DESCENDING}
+            # Materialize the score before $facet so the page sub-pipeline can sort on it.
+            stages.append({"$addFields": {"_score": {"$meta": "textScore"}}})
+        page = [{"$sort": sort}, {"$skip": skip}, {"$limit": limit}]
+        page.append(
+            {"$project": _projection(fields)} if fields is not None else {"$unset": ["_score", "title_lower"]}
+        )
+        pipeline = [
+            {"$match": match},
+            *stages,
+            {
+                "$facet": {
+                    "articles": page,
+                    "author": _facet_buckets(facet_size, "$author", {"count": DESCENDING, "_id": ASCENDING}),
+                    "month": _facet_buckets(facet_size, _month_bucket(), {"_id": DESCENDING}),
+                    "total": [{"$count": "count"}],
+                }
+            },
+        ]
+        try:
+            result = next(self.articles.aggregate(pipeline))
+        except errors.PyMongoError as e:
+            logger.error("Error computing article facets", extra={"filters": filters, "error": str(e)})
+            raise RepositoryError(f"Error computing article facets: {str(e)}") from e
+        articles = []
+        for article in result["articles"]:
+            article["article_id"] = str(article.pop("_id"))
+            articles.append(article)
+        total = result["total"][0]["count"] if result["total"] else 0
+        return {
+            "articles": articles,
+            "facets": {"author": result["author"], "month": result["month"]},
+            "total": total,
+        }
+
+    def get_articles_missing_title_lower(self, limit=100):
+        try:
+            cursor = self.articles.find(
+                {"title_lower": {"$exists": False}}, {"title": 1}
+            ).limit(limit)
+            return [
+                {"article_id": str(article["_id"]), "title": article.get("title", "")}
+                for article in cursor
+            ]
+        except errors.PyMongoError as e:
+            logger.error("Error retrieving articles missing title_lower", extra={"error": str(e)})
+            raise RepositoryError(f"Error retrieving articles: {str(e)}") from e
+
+    def get_articles_missing_summary(self, limit=100):
+        try:
+            cursor = self.articles.find(
+                {"excerpt": {"$exists": False}}, {"content": 1}
+            ).limit(limit)
+            return [
+                {"article_id": str(article["_id"]), "content": article.get("content", "")}
+                for article in cursor
+            ]
+        except errors.PyMongoError as e:
+            logger.error("Error retrieving articles missing summary", extra={"error": str(e)})
+            raise RepositoryError(f"Error retrieving articles: {str(e)}") from e
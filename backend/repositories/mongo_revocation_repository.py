@@ -0,0 +1,62 @@
+# backend/repositories/mongo_revocation_repository.py
+from datetime import datetime, timezone
+from utilities.logger import get_logger
+from utilities.custom_exceptions import RepositoryError
+from pymongo import errors, IndexModel, ASCENDING
+from .base_revocation_repository import BaseRevocationRepository
+from .db import get_db
+
+logger = get_logger(__name__)
+
+
+class MongoRevocationRepository(BaseRevocationRepository):
+    """
+    Access-token revocations shared by every worker:
+    {kind: "token", key: jti, ...} revokes one token, {kind: "user", key: username,
+    not_before: ts, ...} revokes every token of that user issued at or before ts.
+
+    A revocation only has to outlive the access tokens it covers, so each document
+    carries expires_at and the TTL index removes it afterwards.
+    """
+
+    COLLECTION = "revocations"
+    INDEXES = [
+        # Incremental sync: revocations created since a worker's last poll.
+        IndexModel([("created_at", ASCENDING)]),
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ]
+
+    def __init__(self, db=None):
+        self._db = db
+
+    @property
+    def db(self):
+        return self._db if self._db is not None else get_db()
+
+    @property
+    def revocations(self):
+        return self.db.revocations
+
+    def add_revocation(self, revocation):
+        try:
+            result = self.revocations.insert_one(revocation)
+            return str(result.inserted_id)
+        except errors.PyMongoError as e:
+            logger.error(
+                "Error recording revocation",
+                extra={"kind": revocation.get("kind"), "key": revocation.get("key"), "error": str(e)},
+            )
+            raise RepositoryError(f"Error recording revocation: {str(e)}") from e
+
+    def get_revocations_since(self, since=None):
+        # The TTL monitor only runs once a minute, so skip documents that are already past expiry.
+        query = {"expires_at": {"$gt": datetime.now(timezone.utc)}}
+        if since is not None:
+            query["created_at"] = {"$gte": since}
+        try:
+            return list(
+                self.revocations.find(query, projection={"_id": 0}).sort("created_at", ASCENDING)
+            )
+        except errors.PyMongoError as e:
+            logger.error("Error reading revocations", extra={"error": str(e)})
+            raise RepositoryError(f"Error reading revocations: {str(e)}") from e
@@ -0,0 +1,76 @@
+# backend/repositories/mongo_session_repository.py
+from utilities.logger import get_logger
+from utilities.custom_exceptions import RepositoryError
+from pymongo import errors, IndexModel, ASCENDING
+from .base_session_repository import BaseSessionRepository
+from .db import get_db
+
+logger = get_logger(__name__)
+
+
+class MongoSessionRepository(BaseSessionRepository):
+    """
+    One document per refresh token (i.e. per signed-in device):
+    {_id: jti, username, fingerprint, created_at, expires_at}.
+
+    Refresh is a point lookup on _id, logout-everywhere is a delete_many on the
+    username index, and the TTL index lets Mongo purge expired sessions itself.
+    """
+
+    COLLECTION = "sessions"
+    INDEXES = [
+        IndexModel([("username", ASCENDING)]),
+        # expires_at holds the exact expiry, so documents go once it has passed.
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+    ]
+
+    def __init__(self, db=None):
+        self._db = db
+
+    @property
+    def db(self):
+        return self._db if self._db is not None else get_db()
+
+    @property
+    def sessions(self):
+        return self.db.sessions
+
+    def create_session(self, session_data):
+        try:
+            result = self.sessions.insert_one(session_data)
+            return str(result.inserted_id)
+        except errors.PyMongoError as e:
+            logger.error(
+                "Error creating session",
+                extra={"username": session_data.get("username"), "error": str(e)},
+            )
+            raise RepositoryError(f"Error creating session: {str(e)}") from e
+
+    def claim_session(self, session_id, username):
+        """
+        Remove and return the session in one round trip, so a refresh token can be
+        rotated at most once even when two refreshes race.
+        """
+        try:
+            return self.sessions.find_one_and_delete(
+                {"_id": session_id, "username": username}, projection={"fingerprint": 1}
+            )
+        except errors.PyMongoError as e:
+            logger.error("Error claiming session", extra={"username": username, "error": str(e)})
+            raise RepositoryError(f"Error claiming session: {str(e)}") from e
+
+    def delete_session(self, session_id):
+        try:
+            result = self.sessions.delete_one({"_id": session_id})
+            return result.deleted_count > 0
+        except errors.PyMongoError as e:
+            logger.error("Error deleting session", extra={"error": str(e)})
+            raise RepositoryError(f"Error deleting session: {str(e)}") from e
+
+    def delete_user_sessions(self, username):
+        try:
+            result = self.sessions.delete_many({"username": username})
+            return result.deleted_count
+        except errors.PyMongoError as e:
+            logger.error("Error deleting user sessions", extra={"username": username, "error": str(e)})
+            raise RepositoryError(f"Error deleting user sessions: {str(e)}") from e
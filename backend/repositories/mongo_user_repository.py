@@ -1,26 +1,70 @@
 # backend/repositories/mongo_user_repository.py
+import re
 from utilities.logger import get_logger
-from pymongo import errors
+from pymongo import errors, IndexModel, ASCENDING
 from bson import ObjectId
+from utilities.custom_exceptions import DuplicateRecordError, RepositoryError, ValidationError
 from .db import get_db  # Use the getter function instead of importing db directly
 
 logger = get_logger(__name__)
 
+
+# Fields returned by list_users; password hashes and legacy refresh tokens never leave Mongo.
+USER_LIST_FIELDS = ("username", "email", "role", "created_at", "updated_at")
+
+
+def _projection(fields):
+    """Mongo projection for a list of field names; None means the full document."""
+    if fields is None:
+        return None
+    return {field: 1 for field in fields}
+
+
 class MongoUserRepository:
-    def __init__(self):
-        self.db = get_db()
-        self.users = self.db.users
+    COLLECTION = "users"
+    INDEXES = [
+        IndexModel([("username", ASCENDING)], unique=True),
+        IndexModel([("email", ASCENDING)], unique=True),
+        # list_users sorts on (username, _id) and seeks past the cursor on the same keys;
+        # the role-prefixed copy serves role-filtered listings.
+        IndexModel([("username", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("role", ASCENDING), ("username", ASCENDING), ("_id", ASCENDING)]),
+    ]
+
+    def __init__(self, db=None):
+        self._db = db
+
+    @property
+    def db(self):
+        return self._db if self._db is not None else get_db()
+
+    @property
+    def users(self):
+        return self.db.users
+
+    def ensure_unique_indexes(self):
+        """
+        Create the unique username/email indexes if they are missing (idempotent).
+
+        Duplicate detection in register_user relies on them. Raises RepositoryError when they
+        can't be built, e.g. existing duplicates or a conflicting non-unique index.
+        """
+        try:
+            self.users.create_indexes([spec for spec in self.INDEXES if spec.document.get("unique")])
+        except errors.PyMongoError as e:
+            logger.error("Unique user indexes unavailable", extra={"error": str(e)})
+            raise RepositoryError(f"Unique user indexes unavailable: {str(e)}") from e
 
-    def find_by_email(self, email):
+    def find_by_email(self, email, fields=None):
         try:
-            return self.users.find_one({"email": email})
+            return self.users.find_one({"email": email}, projection=_projection(fields))
         except errors.PyMongoError as e:
             logger.error("Error finding user by email", extra={"email": email, "error": str(e)})
             raise e
 
-    def find_by_username(self, username):
+    def find_by_username(self, username, fields=None):
         try:
-            return self.users.find_one({"username": username})
+            return self.users.find_one({"username": username}, projection=_projection(fields))
         except errors.PyMongoError as e:
             logger.error("Error finding user by username", extra={"username": username, "error": str(e)})
             raise e
@@ -32,10 +76,57 @@ class MongoUserRepository:
             logger.error("Error finding user by id", extra={"user_id": user_id, "error": str(e)})
             raise e
 
+    def list_users(self, after=None, limit=10, skip=0, role=None, username_prefix=None):
+        """
+        Page through users ordered by (username, _id), projected to USER_LIST_FIELDS.
+
+        after is the (username, user_id) of the last user of the previous page; the
+        query seeks past it on the index, so every page costs the same regardless of
+        depth. skip is only used by classic page/size callers. username_prefix is an
+        anchored, case-sensitive match, which Mongo turns into index bounds.
+        Returns user dicts with _id as a string.
+        """
+        clauses = []
+        if role is not None:
+            clauses.append({"role": role})
+        if username_prefix:
+            clauses.append({"username": {"$regex": "^" + re.escape(username_prefix)}})
+        if after is not None:
+            after_username, after_id = after
+            # Cursor values come from the client: anything but a string here (e.g. a
+            # dict like {"$ne": null}) would be read as a query operator.
+            if not isinstance(after_username, str) or not isinstance(after_id, str) or not ObjectId.is_valid(after_id):
+                logger.warning("Invalid user cursor", extra={"after_id": str(after_id)})
+                raise ValidationError("Invalid cursor")
+            after_oid = ObjectId(after_id)
+            clauses.append({"$or": [
+                {"username": {"$gt": after_username}},
+                {"username": after_username, "_id": {"$gt": after_oid}},
+            ]})
+        query = {"$and": clauses} if len(clauses) > 1 else (clauses[0] if clauses else {})
+        try:
+            cursor = (
+                self.users.find(query, _projection(USER_LIST_FIELDS))
+                .sort([("username", ASCENDING), ("_id", ASCENDING)])
+                .skip(skip)
+                .limit(limit)
+            )
+            users = []
+            for user in cursor:
+                user["_id"] = str(user["_id"])
+                users.append(user)
+            return users
+        except errors.PyMongoError as e:
+            logger.error("Error listing users", extra={"limit": limit, "error": str(e)})
+            raise e
+
     def create_user(self, user_data):
         try:
             result = self.users.insert_one(user_data)
             return str(result.inserted_id)
+        except errors.DuplicateKeyError as e:
+            logger.warning("Duplicate user", extra={"username": user_data.get("username")})
+            raise DuplicateRecordError("User already exists") from e
         except errors.PyMongoError as e:
             logger.error("Error creating user", extra={"user_data": user_data, "error": str(e)})
             raise e
@@ -47,36 +138,29 @@ class MongoUserRepository:
                 {"$set": update_data}
             )
             return result.modified_count > 0
+        except errors.DuplicateKeyError as e:
+            logger.warning("Duplicate user on update", extra={"user_id": user_id})
+            raise DuplicateRecordError("Username or email already in use") from e
         except errors.PyMongoError as e:
             logger.error("Error updating user", extra={"user_id": user_id, "update_data": update_data, "error": str(e)})
             raise e
 
     def delete_user(self, user_id):
+        """Delete the user and return the removed document (username only), or None."""
         try:
-            result = self.users.delete_one({"_id": ObjectId(user_id)})
-            return result.deleted_count > 0
+            return self.users.find_one_and_delete({"_id": ObjectId(user_id)}, projection={"username": 1})
         except errors.PyMongoError as e:
             logger.error("Error deleting user", extra={"user_id": user_id, "error": str(e)})
             raise e
 
-    def store_refresh_token(self, username, hashed_refresh):
+    def clear_refresh_token(self, username):
+        """Remove a legacy single-session refresh token from the user document."""
         try:
             result = self.users.update_one(
-                {"username": username},
-                {"$set": {"refresh_token": hashed_refresh}},
-                upsert=True
+                {"username": username, "refresh_token": {"$exists": True}},
+                {"$unset": {"refresh_token": ""}}
             )
-            return result.modified_count > 0 or result.upserted_id is not None
-        except errors.PyMongoError as e:
-            logger.error("Error storing refresh token", extra={"username": username, "error": str(e)})
-            raise e
-
-    def get_refresh_token(self, username):
-        try:
-            user = self.users.find_one({"username": username})
-            if user:
-                return user.get("refresh_token")
-            return None
+            return result.modified_count > 0
         except errors.PyMongoError as e:
-            logger.error("Error retrieving refresh token", extra={"username": username, "error": str(e)})
+            logger.error("Error clearing refresh token", extra={"username": username, "error": str(e)})
             raise e
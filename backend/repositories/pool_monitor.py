@@ -0,0 +1,120 @@
+# backend/repositories/pool_monitor.py
+"""
+Connection pool metrics from pymongo's pool events.
+
+Registered on the process's MongoClient by repositories/db.py. Compare the checkout
+wait times and peak in-use count with MONGO_MAX_POOL_SIZE and the worker thread count:
+waits near zero with max_in_use well below the pool size mean the pool is oversized,
+while growing waits or checkout failures mean threads queue for connections.
+"""
+import threading
+from pymongo import monitoring
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds (seconds) of the checkout wait histogram; the last bucket is unbounded.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    Counts connections and checkouts across all pools of one client.
+
+    Events arrive on request threads and pymongo's background threads, so counters
+    are updated under a lock held only for a few additions.
+    """
+
+    def __init__(self, slow_checkout=0.1):
+        self.slow_checkout = slow_checkout
+        self._lock = threading.Lock()
+        self.open = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.checkouts = 0
+        self.checkout_failures = {}
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self.pools_cleared = 0
+
+    def _record_wait(self, duration):
+        self.wait_total += duration
+        if duration > self.wait_max:
+            self.wait_max = duration
+        for i, bound in enumerate(WAIT_BUCKETS):
+            if duration <= bound:
+                self.wait_buckets[i] += 1
+                return
+        self.wait_buckets[-1] += 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open -= 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            if self.in_use > self.max_in_use:
+                self.max_in_use = self.in_use
+            self._record_wait(event.duration)
+        if event.duration >= self.slow_checkout:
+            logger.warning(
+                "Slow Mongo connection checkout",
+                extra={"address": event.address, "wait_ms": round(event.duration * 1000, 1), "in_use": self.in_use},
+            )
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures[event.reason] = self.checkout_failures.get(event.reason, 0) + 1
+            self._record_wait(event.duration)
+        logger.error(
+            "Mongo connection checkout failed",
+            extra={"address": event.address, "reason": event.reason, "wait_ms": round(event.duration * 1000, 1)},
+        )
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.pools_cleared += 1
+
+    # Remaining pool events carry nothing we count.
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def stats(self):
+        """Return a snapshot of the pool counters; wait times are in seconds."""
+        with self._lock:
+            attempts = self.checkouts + sum(self.checkout_failures.values())
+            return {
+                "open": self.open,
+                "in_use": self.in_use,
+                "max_in_use": self.max_in_use,
+                "checkouts": self.checkouts,
+                "checkout_failures": dict(self.checkout_failures),
+                "wait_total": self.wait_total,
+                "wait_max": self.wait_max,
+                "wait_avg": self.wait_total / attempts if attempts else 0.0,
+                "wait_buckets": dict(zip([*map(str, WAIT_BUCKETS), "+Inf"], self.wait_buckets)),
+                "pools_cleared": self.pools_cleared,
+            }
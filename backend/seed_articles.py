@@ -18,6 +18,8 @@ load_dotenv()
 from app.config import Config
 from utilities.logger import get_logger
 from pymongo import MongoClient
+from repositories.mongo_article_repository import MongoArticleRepository
+from services.article_service import ArticleService
 
 logger = get_logger(__name__)
 
@@ -593,27 +595,29 @@ def seed_articles():
         
         # Create articles with timestamps spread over the past few weeks
         base_time = datetime.now(timezone.utc)
-        created_articles = []
+        items = []
         
         for i, article_data in enumerate(SAMPLE_ARTICLES):
             # Spread articles over the past 4 weeks (28 days)
             days_ago = len(SAMPLE_ARTICLES) - i - 1
-            created_at = base_time - timedelta(days=days_ago)
-            
-            article_doc = {
+            items.append({
                 "title": article_data["title"],
                 "content": article_data["content"],
                 "author": article_data["author"],
-                "created_at": created_at,
-                "updated_at": created_at
-            }
-            
-            result = articles_collection.insert_one(article_doc)
-            created_articles.append({
-                "id": str(result.inserted_id),
-                "title": article_data["title"]
+                "created_at": base_time - timedelta(days=days_ago)
             })
-            print(f"Created article: {article_data['title']}")
+        
+        # Same validation and summary fields as the API, written with unordered insert_many
+        service = ArticleService(repository=MongoArticleRepository(db=db))
+        result = service.bulk_create_articles(items)
+        created_articles = []
+        for item in result["results"]:
+            title = SAMPLE_ARTICLES[item["index"]]["title"]
+            if "article_id" in item:
+                created_articles.append({"id": item["article_id"], "title": title})
+                print(f"Created article: {title}")
+            else:
+                print(f"Failed to create article: {title} ({item['error']})")
         
         print(f"\nSuccessfully created {len(created_articles)} articles!")
         print(f"Total articles in database: {articles_collection.count_documents({})}")
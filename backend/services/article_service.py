@@ -1,15 +1,98 @@
+import itertools
+import time
 from datetime import datetime, timezone
+from pydantic import ValidationError as PydanticValidationError
 from repositories.mongo_article_repository import MongoArticleRepository
+from repositories.cached_article_repository import CachedArticleRepository
 from utilities.logger import get_logger
-from utilities.custom_exceptions import RepositoryError, ArticleNotFoundError, ValidationError
+from utilities.custom_exceptions import (
+    RepositoryError,
+    ArticleNotFoundError,
+    ForbiddenError,
+    ValidationError,
+)
+from utilities.pagination import encode_cursor, decode_cursor
+from utilities.lru_cache import TTLCache
+from utilities.search_index import (
+    InvertedIndex,
+    PrefixIndex,
+    RefreshingIndex,
+    TrigramIndex,
+    tokenize,
+)
+from utilities.text_utils import summarize_content, build_snippet, find_highlights
 
 
 logger = get_logger(__name__)
 
+# Fields a client may request through the fields= projection; article_id and updated_at
+# (the version used for ETags) are always returned.
+ARTICLE_FIELDS = (
+    "title",
+    "content",
+    "author",
+    "created_at",
+    "updated_at",
+    "excerpt",
+    "word_count",
+    "reading_time",
+)
+
+# Fields search results carry by default; the body is replaced by a highlighted snippet.
+SEARCH_RESULT_FIELDS = ("title", "author", "created_at", "updated_at")
+
+# Filters accepted by listing and search; each maps to an indexed predicate in the repository.
+ARTICLE_FILTERS = ("author", "date_from", "date_to")
+
+# Accepted values of the search mode= parameter; None is the default ranked search.
+SEARCH_MODES = (None, "fuzzy")
+
 
 class ArticleService:
-    def __init__(self, repository=None):
-        self.repo = repository if repository is not None else MongoArticleRepository()
+    def __init__(self, repository=None, config=None):
+        if config is None:
+            # Lazy import of Config to break circular dependency
+            from app.config import Config
+            config = Config
+        self.max_page_size = int(config.ARTICLES_MAX_PAGE_SIZE)
+        self.excerpt_length = int(config.ARTICLE_EXCERPT_LENGTH)
+        self.words_per_minute = int(config.ARTICLE_WORDS_PER_MINUTE)
+        self.export_batch_size = int(config.ARTICLE_EXPORT_BATCH_SIZE)
+        self.bulk_batch_size = int(config.ARTICLE_BULK_BATCH_SIZE)
+        self.search_default_limit = int(config.SEARCH_DEFAULT_LIMIT)
+        self.search_max_results = int(config.SEARCH_MAX_RESULTS)
+        self.search_min_text_length = int(config.SEARCH_MIN_TEXT_LENGTH)
+        self.snippet_length = int(config.SEARCH_SNIPPET_LENGTH)
+        self.facet_size = int(config.ARTICLE_FACET_SIZE)
+        # "index" ranks searches with the in-process BM25 index instead of Mongo $text
+        self.search_backend = config.SEARCH_BACKEND
+        self.suggest_max_results = int(config.SUGGEST_MAX_RESULTS)
+        self.suggest_time_budget = float(config.SUGGEST_TIME_BUDGET_MS) / 1000
+        max_age = float(config.SEARCH_INDEX_MAX_AGE)
+        self._search_index = RefreshingIndex(self._build_search_index, max_age)
+        self._suggest_index = RefreshingIndex(self._build_suggest_index, max_age)
+        self._fuzzy_index = RefreshingIndex(self._build_fuzzy_index, max_age)
+        self.fuzzy_threshold = float(config.SEARCH_FUZZY_THRESHOLD)
+        # Search results are cached under the corpus generation, which every write in
+        # this process bumps; stale entries are simply never looked up again and age
+        # out of the LRU. Writes in other workers are covered by SEARCH_CACHE_TTL.
+        self._generations = itertools.count(1)
+        self.generation = 0
+        self.search_cache = None
+        if config.SEARCH_CACHE_ENABLED:
+            self.search_cache = TTLCache(
+                max_size=int(config.SEARCH_CACHE_MAX_SIZE),
+                ttl=float(config.SEARCH_CACHE_TTL),
+            )
+        if repository is None:
+            repository = MongoArticleRepository()
+            if config.ARTICLE_CACHE_ENABLED:
+                repository = CachedArticleRepository(
+                    repository,
+                    max_size=int(config.ARTICLE_CACHE_MAX_SIZE),
+                    ttl=float(config.ARTICLE_CACHE_TTL),
+                )
+        self.repo = repository
         logger.info("ArticleService initialized")
 
     def create_article(self, title, content, author):
@@ -19,28 +102,154 @@ class ArticleService:
             raise ValidationError("Content is required")
         if title.strip().lower() == "fail":
             raise RepositoryError("Forced failure")
-        article_data = {
-            "title": title,
-            "content": content,
-            "author": author,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
-        }
+        article_data = self._build_article(title, content, author)
         article_id = self.repo.create_article(article_data)
+        self._on_article_written(article_id, article_data)
         logger.info(
             "Article created", extra={"article_id": article_id, "author": author}
         )
         return {"message": "Article created successfully", "article_id": article_id}
 
-    def get_all_articles(self, page=1, limit=2):
+    def bulk_create_articles(self, items, author=None, batch_size=None):
+        """
+        Validate and insert many articles with unordered insert_many, one chunk at a time.
+
+        Args:
+            items: Iterable of article dicts (may be a lazy NDJSON reader); non-dict
+                items are reported as errors
+            author: Author stamped on every article. When None (trusted callers such as
+                seed_articles.py), each item supplies its own author and optional created_at
+            batch_size: Items validated and written per round trip (default ARTICLE_BULK_BATCH_SIZE)
+
+        Returns:
+            Dict with inserted/failed counts and per-item results ordered by index
+        """
+        # Lazy import: app.schemas lives in the app package
+        from app.schemas import ArticleCreateSchema
+
+        batch_size = batch_size or self.bulk_batch_size
+        results = []
+        pending = []  # (index, document)
+        # Set once a batch fails outright; later items are reported rather than attempted.
+        write_error = None
+
+        def flush():
+            nonlocal write_error
+            if write_error is None:
+                try:
+                    outcomes = self.repo.create_articles([document for _, document in pending])
+                except RepositoryError as e:
+                    if not any("article_id" in result for result in results):
+                        # Nothing stored yet, so a plain error loses nothing.
+                        raise
+                    # Earlier batches are committed: report them instead of failing the
+                    # whole request, so a client retries only the items marked failed.
+                    logger.error("Bulk article batch failed", extra={"count": len(pending), "error": str(e)})
+                    write_error = "Batch write failed"
+            if write_error is not None:
+                results.extend({"index": index, "error": write_error} for index, _ in pending)
+                pending.clear()
+                return
+            for (index, document), (article_id, error) in zip(pending, outcomes):
+                if error is None:
+                    self._on_article_written(article_id, document)
+                    results.append({"index": index, "article_id": article_id})
+                else:
+                    results.append({"index": index, "error": error})
+            pending.clear()
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append({"index": index, "error": "Item must be a JSON object"})
+                continue
+            try:
+                validated = ArticleCreateSchema(**item)
+            except PydanticValidationError as e:
+                details = "; ".join(
+                    f"{'.'.join(str(x) for x in error['loc'])}: {error['msg']}" for error in e.errors()
+                )
+                results.append({"index": index, "error": details})
+                continue
+            if author is not None:
+                document = self._build_article(validated.title, validated.content, author)
+            else:
+                document = self._build_article(
+                    validated.title, validated.content, item.get("author"), item.get("created_at")
+                )
+            pending.append((index, document))
+            if len(pending) >= batch_size:
+                flush()
+        if pending:
+            flush()
+
+        results.sort(key=lambda result: result["index"])
+        inserted = sum(1 for result in results if "article_id" in result)
+        failed = len(results) - inserted
+        logger.info("Bulk article import", extra={"inserted": inserted, "failed": failed})
+        return {
+            "message": "Bulk import completed",
+            "inserted": inserted,
+            "failed": failed,
+            "results": results,
+        }
+
+    def get_all_articles(self, page=1, limit=2, cursor=None, fields=None, filters=None, facets=False):
+        """
+        List articles, capping limit at ARTICLES_MAX_PAGE_SIZE.
+        fields (comma-separated string or list) restricts the returned fields.
+        filters (author, date_from, date_to) are applied in the query on indexed fields.
+
+        With cursor=None this is classic page/limit pagination and returns a list.
+        With a cursor (an empty string starts from the beginning) it seeks on _id and
+        returns {"articles": [...], "next_cursor": token or None}.
+        With facets=True (page mode only) it returns {"articles", "facets", "total"}.
+        """
+        if page < 1 or limit < 1:
+            raise ValidationError("Invalid pagination parameters")
+        limit = min(limit, self.max_page_size)
+        fields = self.parse_fields(fields)
+        filters = self._clean_filters(filters)
+        if cursor is not None:
+            if facets:
+                raise ValidationError("Facets are not available with cursor pagination")
+            return self._get_articles_by_cursor(cursor, limit, fields, filters)
         skip = (page - 1) * limit
-        articles = self.repo.get_all_articles(skip=skip, limit=limit)
+        if facets:
+            return self.repo.get_articles_with_facets(
+                skip=skip, limit=limit, fields=fields, filters=filters, facet_size=self.facet_size
+            )
+        articles = self.repo.get_all_articles(skip=skip, limit=limit, fields=fields, filters=filters)
         logger.info(
             "Fetched articles",
             extra={"page": page, "limit": limit, "count": len(articles)},
         )
         return articles
 
+    def _get_articles_by_cursor(self, cursor, limit, fields, filters=None):
+        after_id = decode_cursor(cursor, 1)[0] if cursor else None
+        # Fetch one extra document to learn whether another page exists.
+        articles = self.repo.get_articles_after(
+            after_id=after_id, limit=limit + 1, fields=fields, filters=filters
+        )
+        next_cursor = None
+        if len(articles) > limit:
+            articles = articles[:limit]
+            next_cursor = encode_cursor([articles[-1]["article_id"]])
+        logger.info(
+            "Fetched articles by cursor",
+            extra={"limit": limit, "count": len(articles), "has_more": next_cursor is not None},
+        )
+        return {"articles": articles, "next_cursor": next_cursor}
+
+    def export_articles(self, since=None, fields=None):
+        """
+        Return a generator over every article (updated at or after since, if given),
+        read from one server-side cursor in ARTICLE_EXPORT_BATCH_SIZE batches.
+        """
+        fields = self.parse_fields(fields)
+        logger.info("Exporting articles", extra={"since": since, "fields": fields})
+        return self.repo.iter_articles(since=since, fields=fields, batch_size=self.export_batch_size)
+
     def get_article_by_id(self, article_id):
         article = self.repo.get_article_by_id(article_id)
         if not article:
@@ -49,35 +258,363 @@ class ArticleService:
         logger.info("Article retrieved", extra={"article_id": article_id})
         return article
 
-    def update_article(self, article_id, title=None, content=None):
+    def get_article_version(self, article_id):
+        """Return the article's updated_at without fetching its body."""
+        version = self.repo.get_article_version(article_id)
+        if version is None:
+            raise ArticleNotFoundError(f"Article with id {article_id} not found")
+        return version.get("updated_at")
+
+    def update_article(self, article_id, title=None, content=None, author=None):
+        """
+        Update an article in a single ownership-checked write.
+
+        Args:
+            author: Restrict the update to articles owned by this author (regular users);
+                None lets moderators and admins update any article
+        """
         update_data = {}
         if title:
             update_data["title"] = title
         if content:
             update_data["content"] = content
+            update_data.update(self._summarize(content))
         if not update_data:
             raise ValidationError("No data provided for update")
         update_data["updated_at"] = datetime.now(timezone.utc)
-        success = self.repo.update_article(article_id, update_data)
-        if not success:
-            raise ArticleNotFoundError(f"Article with id {article_id} not found")
+        # The BM25 index needs both title and content. When the update carries only
+        # one, the write returns the other instead of paying for a separate read.
+        fields = None
+        if self._search_index.active and not (title and content):
+            fields = ["title", "content"]
+        result = self.repo.update_article(article_id, update_data, author=author, fields=fields)
+        if not result:
+            self._raise_write_miss(article_id, author, "update")
+        self._bump_generation()
+        article = result if fields is not None else update_data
+        if "title" in article and "content" in article:
+            self._search_index.apply(lambda index: index.add(article_id, article["title"], article["content"]))
+        if title:
+            for title_index in (self._suggest_index, self._fuzzy_index):
+                title_index.apply(lambda index: index.add(article_id, title))
         return {"message": "Article updated successfully"}
 
-    def delete_article(self, article_id):
-        success = self.repo.delete_article(article_id)
+    def delete_article(self, article_id, author=None):
+        success = self.repo.delete_article(article_id, author=author)
         if not success:
             logger.warning("Article deletion failed", extra={"article_id": article_id})
-            raise ArticleNotFoundError(f"Article with id {article_id} not found")
+            self._raise_write_miss(article_id, author, "delete")
+        self._on_article_deleted(article_id)
         logger.info("Article deleted", extra={"article_id": article_id})
         return {"message": "Article deleted successfully"}
 
-    def search_articles(self, query):
+    def _raise_write_miss(self, article_id, author, action):
+        # The owner-filtered write matched nothing: either the article is gone or it
+        # belongs to someone else. Only this failure path pays for the extra lookup.
+        if author is not None and self.repo.article_exists(article_id):
+            raise ForbiddenError(f"User not authorized to {action} this article")
+        raise ArticleNotFoundError(f"Article with id {article_id} not found")
+
+    def search_articles(
+        self, query, fields=None, page=1, limit=None, mode=None, filters=None, facets=False
+    ):
         """
-        Search for articles that match the query in the title or content.
-        For now, we'll implement a simple search returning all articles that contain the query.
+        Search articles by relevance, one page at a time.
+
+        Queries of at least SEARCH_MIN_TEXT_LENGTH characters use the text index;
+        shorter ones (the first keystrokes of a search box) match title prefixes, as
+        do longer ones the text index finds nothing for (a partial last word).
+        mode="fuzzy" instead ranks titles by trigram similarity, tolerating typos.
+        Paging stops at SEARCH_MAX_RESULTS results in total.
+
+        filters (author, date_from, date_to) narrow the match inside Mongo. With
+        facets=True the result is {"articles", "facets", "total"} instead of a list.
         """
         if not query or not query.strip():
             raise ValidationError("Missing search query")
-        results = self.repo.search_articles(query)
+        if mode not in SEARCH_MODES:
+            raise ValidationError("Invalid search mode")
+        filters = self._clean_filters(filters)
+        if mode == "fuzzy" and (filters or facets):
+            raise ValidationError("Filters and facets are not available with mode=fuzzy")
+        query = self.normalize_query(query)
+        limit = self.search_default_limit if limit is None else limit
+        if page < 1 or limit < 1:
+            raise ValidationError("Invalid pagination parameters")
+        skip = (page - 1) * limit
+        limit = min(limit, self.search_max_results - skip)
+        if limit <= 0 and not facets:
+            return []
+        fields = self.parse_fields(fields)
+        if self.search_cache is None:
+            return self._search(query, fields, skip, limit, mode, filters, facets)
+        key = (
+            self.generation,
+            mode,
+            query,
+            skip,
+            limit,
+            tuple(fields) if fields is not None else None,
+            tuple(sorted(filters.items())) if filters else None,
+            facets,
+        )
+        results = self.search_cache.get(key)
+        if results is None:
+            results = self._search(query, fields, skip, limit, mode, filters, facets)
+            self.search_cache.set(key, results)
+        # Hand out copies so callers cannot alter the cached page.
+        if facets:
+            return {**results, "articles": [dict(article) for article in results["articles"]]}
+        return [dict(article) for article in results]
+
+    def _search(self, query, fields, skip, limit, mode=None, filters=None, facets=False):
+        # Fetch only what the result cards and the snippet need, never the whole document.
+        requested = list(SEARCH_RESULT_FIELDS) if fields is None else fields
+        fetch = list(dict.fromkeys([*requested, "title", "content"]))
+        terms = tuple(dict.fromkeys(tokenize(query)))
+        prefix = len(query) < self.search_min_text_length
+        matched_terms = {}
+        if facets:
+            # Facets and the page come from one $facet aggregation. Past the result
+            # cap the page is empty but the counts are still reported.
+            # A text query with no match is retried as a title prefix, as below.
+            for as_prefix in dict.fromkeys((prefix, True)):
+                faceted = self.repo.get_articles_with_facets(
+                    skip=skip if limit > 0 else 0,
+                    limit=max(limit, 1),
+                    fields=fetch,
+                    filters=filters,
+                    text=query,
+                    prefix=as_prefix,
+                    facet_size=self.facet_size,
+                )
+                if faceted["total"]:
+                    break
+            results = faceted["articles"] if limit > 0 else []
+        elif mode == "fuzzy":
+            hits = self._fuzzy_index.get().search(
+                query, threshold=self.fuzzy_threshold, limit=limit, skip=skip
+            )
+            # Highlight the title words that matched, not the misspelled query.
+            matched_terms = {key: tuple(words) for key, _, words in hits}
+            results = self.repo.get_articles_by_ids(list(matched_terms), fields=fetch)
+        else:
+            # Filters are pushed down to Mongo, so they bypass the in-process index.
+            search_index = None if prefix or filters else self._get_search_index()
+            if search_index is not None:
+                hits = search_index.search(query, limit=limit, skip=skip)
+                results = self.repo.get_articles_by_ids([key for key, _ in hits], fields=fetch)
+            else:
+                results = self.repo.search_articles(
+                    query, fields=fetch, skip=skip, limit=limit, prefix=prefix, filters=filters
+                )
+            if not results and not prefix:
+                # The text index only matches whole words, so a query whose last word is
+                # still being typed ("flask tut") finds nothing; retry it as a title prefix.
+                results = self.repo.search_articles(
+                    query, fields=fetch, skip=skip, limit=limit, prefix=True, filters=filters
+                )
+        for article in results:
+            article_terms = matched_terms.get(article["article_id"], terms)
+            article["snippet"] = build_snippet(article.get("content", ""), article_terms, self.snippet_length)
+            article["title_highlights"] = find_highlights(article.get("title", ""), article_terms)
+            for field in ("title", "content"):
+                if field not in requested:
+                    article.pop(field, None)
         logger.info("Search returned %d articles", len(results))
+        if facets:
+            return {"articles": results, "facets": faceted["facets"], "total": faceted["total"]}
         return results
+
+    def suggest_titles(self, prefix, limit=None):
+        """
+        Autocomplete article titles for a search box.
+
+        Served from an in-process prefix index over titles (built on first use, kept
+        current by this process's writes, rebuilt after SEARCH_INDEX_MAX_AGE), so it
+        never touches the database on the request path once warm. The lookup stops
+        after SUGGEST_TIME_BUDGET_MS and returns what it has.
+        """
+        if not prefix or not prefix.strip():
+            raise ValidationError("Missing suggest prefix")
+        limit = self.suggest_max_results if limit is None else limit
+        if limit < 1:
+            raise ValidationError("Invalid limit parameter")
+        limit = min(limit, self.suggest_max_results)
+        matches = self._suggest_index.get().suggest(
+            prefix, limit=limit, budget=self.suggest_time_budget
+        )
+        return [{"article_id": key, "title": title} for key, title in matches]
+
+    def _get_search_index(self):
+        """Return the BM25 index when SEARCH_BACKEND is "index", building it on first use."""
+        if self.search_backend != "index":
+            return None
+        return self._search_index.get()
+
+    def _build_search_index(self):
+        started = time.monotonic()
+        index = InvertedIndex()
+        for article in self.repo.iter_articles(
+            fields=["title", "content"], batch_size=self.export_batch_size
+        ):
+            index.add(article["article_id"], article.get("title", ""), article.get("content", ""))
+        logger.info(
+            "Search index built",
+            extra={**index.stats(), "seconds": round(time.monotonic() - started, 3)},
+        )
+        return index
+
+    def _build_suggest_index(self):
+        index = PrefixIndex()
+        index.add_many(self._iter_titles())
+        logger.info("Suggest index built", extra={"documents": len(index)})
+        return index
+
+    def _build_fuzzy_index(self):
+        index = TrigramIndex()
+        for article_id, title in self._iter_titles():
+            index.add(article_id, title)
+        logger.info("Fuzzy index built", extra={"documents": len(index)})
+        return index
+
+    def _iter_titles(self):
+        for article in self.repo.iter_articles(fields=["title"], batch_size=self.export_batch_size):
+            yield article["article_id"], article.get("title", "")
+
+    def _bump_generation(self):
+        """Retire every cached search result after a write to the corpus."""
+        self.generation = next(self._generations)
+
+    def _on_article_written(self, article_id, article):
+        """
+        Keep the in-process indexes current after a create or update. They only see
+        this process's writes; rebuilds after SEARCH_INDEX_MAX_AGE pick up the rest.
+        Writes made while an index is rebuilt are replayed onto the new one.
+        """
+        self._bump_generation()
+        if not article:
+            return
+        title = article.get("title", "")
+        content = article.get("content", "")
+        self._search_index.apply(lambda index: index.add(article_id, title, content))
+        for title_index in (self._suggest_index, self._fuzzy_index):
+            title_index.apply(lambda index: index.add(article_id, title))
+
+    def _on_article_deleted(self, article_id):
+        self._bump_generation()
+        for index in (self._search_index, self._suggest_index, self._fuzzy_index):
+            index.apply(lambda current: current.remove(article_id))
+
+    def backfill_summaries(self, batch_size=100):
+        """
+        Compute excerpt/word_count/reading_time for articles stored before summaries existed.
+        Returns the number of articles updated.
+        """
+        updated = 0
+        while True:
+            batch = self.repo.get_articles_missing_summary(limit=batch_size)
+            if not batch:
+                break
+            for article in batch:
+                summary = self._summarize(article["content"])
+                # The payload changes, so its version must too: ETags, Last-Modified and
+                # incremental exports all key on updated_at.
+                summary["updated_at"] = datetime.now(timezone.utc)
+                self.repo.update_article(article["article_id"], summary)
+            updated += len(batch)
+        if updated:
+            self._bump_generation()
+        logger.info("Backfilled article summaries", extra={"count": updated})
+        return updated
+
+    def backfill_title_lower(self, batch_size=100):
+        """
+        Store the case-folded title used by prefix search on articles stored before it existed.
+        Returns the number of articles updated.
+        """
+        updated = 0
+        while True:
+            batch = self.repo.get_articles_missing_title_lower(limit=batch_size)
+            if not batch:
+                break
+            for article in batch:
+                # The repository derives title_lower whenever a title is written.
+                self.repo.update_article(article["article_id"], {"title": article["title"]})
+            updated += len(batch)
+        if updated:
+            self._bump_generation()
+        logger.info("Backfilled article title_lower", extra={"count": updated})
+        return updated
+
+    def stats(self):
+        """Cache and search index counters for monitoring, keyed by component."""
+        stats = {}
+        if self.search_cache is not None:
+            stats["search_cache"] = self.search_cache.stats()
+        article_cache = getattr(self.repo, "cache", None)
+        if article_cache is not None:
+            stats["article_cache"] = article_cache.stats()
+        search_index = self._search_index.current
+        if search_index is not None:
+            stats["search_index"] = search_index.stats()
+        return stats
+
+    @staticmethod
+    def _clean_filters(filters):
+        """Drop unset filters; returns None when nothing is left to filter on."""
+        if not filters:
+            return None
+        unknown = set(filters) - set(ARTICLE_FILTERS)
+        if unknown:
+            raise ValidationError(f"Invalid filters: {', '.join(sorted(unknown))}")
+        filters = {name: value for name, value in filters.items() if value not in (None, "")}
+        date_from, date_to = filters.get("date_from"), filters.get("date_to")
+        if date_from is not None and date_to is not None and date_from >= date_to:
+            raise ValidationError("Invalid date range")
+        return filters or None
+
+    @staticmethod
+    def normalize_query(query):
+        """Case-fold and collapse whitespace so equivalent queries share one cache entry."""
+        return " ".join(query.split()).casefold()
+
+    @staticmethod
+    def parse_fields(fields):
+        """
+        Validate a fields= projection.
+
+        Args:
+            fields: Comma-separated string, list of names, or None/empty for all fields
+
+        Returns:
+            List of field names (empty when only article_id is wanted), or None for the full document
+
+        Raises:
+            ValidationError: If an unknown field is requested
+        """
+        if not fields:
+            return None
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(",") if field.strip()]
+        if not fields:
+            return None
+        unknown = [field for field in fields if field not in ARTICLE_FIELDS + ("article_id",)]
+        if unknown:
+            raise ValidationError(f"Invalid fields: {', '.join(unknown)}")
+        return [field for field in fields if field != "article_id"]
+
+    def _build_article(self, title, content, author, created_at=None):
+        now = datetime.now(timezone.utc)
+        article_data = {
+            "title": title,
+            "content": content,
+            "author": author,
+            "created_at": created_at or now,
+            "updated_at": created_at or now,
+        }
+        article_data.update(self._summarize(content))
+        return article_data
+
+    def _summarize(self, content):
+        return summarize_content(content, self.excerpt_length, self.words_per_minute)
@@ -0,0 +1,200 @@
+# backend/services/revocation_service.py
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from repositories.mongo_revocation_repository import MongoRevocationRepository
+from utilities.bloom_filter import BloomFilter
+from utilities.custom_exceptions import RepositoryError
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds of overlap re-read on each sync, so a revocation committed by another worker
+# with a slightly earlier created_at than our watermark is not missed.
+SYNC_OVERLAP = 2.0
+
+
+class RevocationService:
+    """
+    Per-process mirror of the revocations collection, fronted by a Bloom filter.
+
+    Two kinds of revocation are kept: a token id (jti) revoked on its own, and a
+    user cutoff that revokes every access token of that user issued at or before it
+    (user deleted, role changed, logged out everywhere). is_revoked() is called for
+    every JWT-protected request. A token whose jti and username both miss the Bloom
+    filter, which is the common case, costs a few hash probes and no database call.
+    A Bloom hit is confirmed against the exact local mirror.
+
+    The mirror is synced incrementally (revocations created since the last poll) at
+    most every sync_interval seconds, so revocations made by other workers take
+    effect within that interval; revocations made by this process apply at once.
+    """
+
+    def __init__(self, config=None, repository=None, clock=time.monotonic):
+        if config is None:
+            # Lazy import of Config to break circular dependency
+            from app.config import Config
+            config = Config
+        self.token_ttl = int(config.JWT_ACCESS_TOKEN_EXPIRES)
+        self.sync_interval = float(config.REVOCATION_SYNC_INTERVAL)
+        self.bloom_capacity = int(config.REVOCATION_BLOOM_CAPACITY)
+        self.bloom_error_rate = float(config.REVOCATION_BLOOM_ERROR_RATE)
+        self.repo = repository if repository is not None else MongoRevocationRepository()
+        self._clock = clock
+        self._sync_lock = threading.Lock()
+        # Serializes writers (local revocations, sync, rebuild); readers take no lock.
+        self._write_lock = threading.RLock()
+        self._synced_at = None
+        self._watermark = None
+        # Exact mirror: jti -> expiry and username -> (cutoff, expiry), expiries as epoch seconds.
+        self._tokens = {}
+        self._users = {}
+        self._bloom = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        self.probes = 0
+        self.bloom_hits = 0
+        self.false_positives = 0
+        self.syncs = 0
+        self.sync_errors = 0
+
+    def revoke_token(self, jti, expires_at):
+        """Revoke one access token until its own expiry (epoch seconds)."""
+        now = datetime.now(timezone.utc)
+        self._record({
+            "kind": "token",
+            "key": jti,
+            "created_at": now,
+            "expires_at": datetime.fromtimestamp(float(expires_at), timezone.utc),
+        })
+
+    def revoke_user(self, username):
+        """Revoke every access token issued to username up to now."""
+        now = datetime.now(timezone.utc)
+        self._record({
+            "kind": "user",
+            "key": username,
+            "not_before": now.timestamp(),
+            "created_at": now,
+            # Tokens issued before now are all expired after one access-token lifetime.
+            "expires_at": now + timedelta(seconds=self.token_ttl),
+        })
+
+    def _record(self, revocation):
+        self.repo.add_revocation(dict(revocation))
+        self._apply(revocation)
+        logger.info("Access tokens revoked", extra={"kind": revocation["kind"], "key": revocation["key"]})
+
+    def _apply(self, revocation):
+        with self._write_lock:
+            self._apply_locked(revocation)
+
+    def _apply_locked(self, revocation):
+        expires = revocation["expires_at"]
+        if expires.tzinfo is None:
+            # pymongo returns naive UTC datetimes.
+            expires = expires.replace(tzinfo=timezone.utc)
+        expires = expires.timestamp()
+        if revocation["kind"] == "token":
+            self._tokens[revocation["key"]] = expires
+            self._bloom.add("token:" + revocation["key"])
+        else:
+            cutoff = float(revocation["not_before"])
+            previous = self._users.get(revocation["key"])
+            if previous is None or previous[0] < cutoff:
+                self._users[revocation["key"]] = (cutoff, expires)
+            self._bloom.add("user:" + revocation["key"])
+        # Compare with the live filter's capacity: a rebuild sizes it for the entries kept.
+        if len(self._bloom) > self._bloom.capacity:
+            self._rebuild()
+
+    def _rebuild(self):
+        """Drop expired entries and rebuild the Bloom filter from what is left."""
+        with self._write_lock:
+            self._rebuild_locked()
+
+    def _rebuild_locked(self):
+        now = time.time()
+        self._tokens = {jti: exp for jti, exp in self._tokens.items() if exp > now}
+        self._users = {user: entry for user, entry in self._users.items() if entry[1] > now}
+        capacity = max(self.bloom_capacity, 2 * (len(self._tokens) + len(self._users)))
+        bloom = BloomFilter(capacity, self.bloom_error_rate)
+        for jti in self._tokens:
+            bloom.add("token:" + jti)
+        for user in self._users:
+            bloom.add("user:" + user)
+        # Readers probe whichever filter they loaded; swapping the reference is atomic.
+        self._bloom = bloom
+
+    def sync(self):
+        """Pull revocations created by any worker since the last sync into the mirror."""
+        since = self._watermark - timedelta(seconds=SYNC_OVERLAP) if self._watermark else None
+        revocations = self.repo.get_revocations_since(since)
+        for revocation in revocations:
+            self._apply(revocation)
+            created = revocation["created_at"]
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            if self._watermark is None or created > self._watermark:
+                self._watermark = created
+        if self._watermark is None:
+            self._watermark = datetime.now(timezone.utc)
+        now = time.time()
+        if any(exp <= now for exp in self._tokens.values()) or any(
+            entry[1] <= now for entry in self._users.values()
+        ):
+            self._rebuild()
+        self.syncs += 1
+
+    def _maybe_sync(self):
+        now = self._clock()
+        if self._synced_at is not None and now - self._synced_at < self.sync_interval:
+            return
+        # One thread syncs; the others keep answering from the current mirror.
+        if not self._sync_lock.acquire(blocking=False):
+            return
+        try:
+            self.sync()
+        except RepositoryError as e:
+            # Keep serving from the mirror; a database blip must not reject every request.
+            self.sync_errors += 1
+            logger.error("Revocation sync failed", extra={"error": str(e)})
+        finally:
+            self._synced_at = now
+            self._sync_lock.release()
+
+    def is_revoked(self, payload):
+        """True when the decoded access token payload has been revoked."""
+        self._maybe_sync()
+        self.probes += 1
+        bloom = self._bloom
+        jti = payload.get("jti")
+        username = payload.get("sub")
+        revoked = False
+        if jti and "token:" + jti in bloom:
+            self.bloom_hits += 1
+            if jti in self._tokens:
+                revoked = True
+            else:
+                self.false_positives += 1
+        if not revoked and username and "user:" + username in bloom:
+            self.bloom_hits += 1
+            entry = self._users.get(username)
+            if entry is None:
+                self.false_positives += 1
+            else:
+                # Tokens issued after the cutoff (e.g. a fresh login) stay valid.
+                revoked = float(payload.get("iat", 0)) <= entry[0]
+        return revoked
+
+    def stats(self):
+        """Return a snapshot of the mirror and probe counters."""
+        return {
+            "tokens": len(self._tokens),
+            "users": len(self._users),
+            "bloom_items": len(self._bloom),
+            "bloom_bits": self._bloom.num_bits,
+            "probes": self.probes,
+            "bloom_hits": self.bloom_hits,
+            "false_positives": self.false_positives,
+            "syncs": self.syncs,
+            "sync_errors": self.sync_errors,
+        }
@@ -1,23 +1,73 @@
 # backend/services/user_service.py
 import datetime
+import uuid
 from datetime import timezone, timedelta
-import bcrypt
 import jwt
 from utilities.logger import get_logger
 from repositories.mongo_user_repository import MongoUserRepository
-from utilities.custom_exceptions import UserNotFoundError, UnauthorizedError, ValidationError
+from repositories.mongo_session_repository import MongoSessionRepository
+from services.revocation_service import RevocationService
+from utilities.auth_utils import refresh_token_fingerprint, verify_refresh_token
+from utilities.hash_pool import HashPool
+from utilities.pagination import encode_cursor, decode_cursor
+from utilities.custom_exceptions import (
+    UserNotFoundError,
+    UnauthorizedError,
+    ValidationError,
+    DuplicateRecordError,
+    ServiceUnavailableError,
+    RepositoryError,
+)
 
 logger = get_logger(__name__)
 
+# Roles accepted by the list_users role filter (same set UserUpdateSchema allows).
+USER_ROLES = ("admin", "moderator", "regular")
+
+# Profile fields read when issuing tokens; everything else (password hash, timestamps) stays in Mongo.
+TOKEN_USER_FIELDS = ("username", "email", "role")
+
 class UserService:
-    def __init__(self, config, repository=None):
+    def __init__(self, config, repository=None, hash_pool=None, session_repository=None, revocations=None):
         self.jwt_secret_key = config.JWT_SECRET_KEY
         self.jwt_algorithm = config.JWT_ALGORITHM
         self.jwt_access_expires = int(config.JWT_ACCESS_TOKEN_EXPIRES)
         self.jwt_refresh_expires = int(config.JWT_REFRESH_TOKEN_EXPIRES)
+        self.users_max_page_size = int(getattr(config, "USERS_MAX_PAGE_SIZE", 100))
+        self.refresh_fingerprint_key = (
+            getattr(config, "REFRESH_TOKEN_FINGERPRINT_KEY", None) or config.JWT_SECRET_KEY
+        )
         self.repo = repository if repository is not None else MongoUserRepository()
+        self.sessions = session_repository if session_repository is not None else MongoSessionRepository()
+        # Consulted by the JWT blocklist loader on every protected request (see app/__init__.py).
+        self.revocations = revocations if revocations is not None else RevocationService(config)
+        # bcrypt runs off the request thread so a login burst can't starve cheap routes.
+        self.hash_pool = hash_pool if hash_pool is not None else HashPool(
+            workers=int(getattr(config, "PASSWORD_HASH_WORKERS", 2)),
+            queue_size=int(getattr(config, "PASSWORD_HASH_QUEUE_SIZE", 8)),
+            timeout=float(getattr(config, "PASSWORD_HASH_TIMEOUT", 5)),
+            retry_after=int(getattr(config, "PASSWORD_HASH_RETRY_AFTER", 2)),
+        )
+        # Set once the unique username/email indexes are known to exist (see register_user).
+        self._unique_indexes_verified = False
         logger.info("UserService initialized", extra={"jwt_algorithm": self.jwt_algorithm})
 
+    def _require_unique_indexes(self):
+        """
+        Make sure the unique indexes that detect duplicate users exist before the first
+        registration, whether or not the startup bootstrap ran or succeeded. Registration
+        is refused while they can't be built, rather than silently creating duplicates.
+        """
+        if self._unique_indexes_verified:
+            return
+        try:
+            self.repo.ensure_unique_indexes()
+        except RepositoryError as e:
+            raise ServiceUnavailableError(
+                "Registration is temporarily unavailable", retry_after=self.hash_pool.retry_after
+            ) from e
+        self._unique_indexes_verified = True
+
     def register_user(self, username, email, password, role="regular"):
         if not username or not username.strip():
             raise ValidationError("Username is required")
@@ -25,11 +75,9 @@ class UserService:
             raise ValidationError("Email is required")
         if not password or len(password) < 6:
             raise ValidationError("Password must be at least 6 characters")
-        existing_user = self.repo.find_by_username(username)
-        if existing_user:
-            logger.warning("Attempted to register user with existing username", extra={"username": username})
-            raise ValidationError("User already exists")
-        hashed_pw = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+        self._require_unique_indexes()
+        # A duplicate is only detected by the insert, after the bcrypt hash has been paid.
+        hashed_pw = self.hash_pool.hash_password(password)
         now_iso = datetime.datetime.now(timezone.utc).isoformat()
         user_data = {
             "username": username,
@@ -39,7 +87,12 @@ class UserService:
             "created_at": now_iso,
             "updated_at": now_iso
         }
-        user_id = self.repo.create_user(user_data)
+        try:
+            # The unique username/email indexes make the insert itself the existence check.
+            user_id = self.repo.create_user(user_data)
+        except DuplicateRecordError:
+            logger.warning("Attempted to register user with existing username or email", extra={"username": username})
+            raise ValidationError("User already exists")
         logger.info("User registered successfully", extra={"username": username, "user_id": user_id})
         return {"message": "User registered successfully", "user_id": user_id}
 
@@ -48,98 +101,106 @@ class UserService:
             raise ValidationError("Username or email is required")
         if not password:
             raise ValidationError("Password is required")
+        fields = TOKEN_USER_FIELDS + ("password",)
         if "@" in username_or_email:
-            user = self.repo.find_by_email(username_or_email)
+            user = self.repo.find_by_email(username_or_email, fields=fields)
         else:
-            user = self.repo.find_by_username(username_or_email)
+            user = self.repo.find_by_username(username_or_email, fields=fields)
         if not user:
             logger.warning("Login attempt for non-existent user", extra={"username_or_email": username_or_email})
             raise UnauthorizedError("User not found")
-        if not bcrypt.checkpw(password.encode("utf-8"), user["password"]):
+        if not self.hash_pool.check_password(password, user["password"]):
             logger.warning("Invalid credentials", extra={"username_or_email": username_or_email})
             raise UnauthorizedError("Invalid credentials")
+        access_token, refresh_token, claims = self._issue_tokens(user)
+        logger.info("User logged in successfully", extra={"username": user["username"]})
+        return {
+            "message": "Login successful",
+            "user": {
+                "username": user["username"],
+                "email": user["email"],
+                "role": user["role"]
+            },
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "claims": claims
+        }
+
+    def _issue_tokens(self, user):
+        """
+        Sign a new access/refresh token pair for user and open a session for the
+        refresh token. Each refresh token carries its session id as jti, so every
+        device holds its own session.
+
+        Returns (access_token, refresh_token, access_claims); the claims are the
+        payload just signed, so callers never need to decode the new token.
+        """
         now = datetime.datetime.now(timezone.utc)
         access_payload = {
             "sub": user["username"],
             "email": user["email"],
             "role": user["role"],
+            "jti": uuid.uuid4().hex,
             "iat": now.timestamp(),
             "exp": (now + timedelta(seconds=self.jwt_access_expires)).timestamp()
         }
         access_token = jwt.encode(access_payload, self.jwt_secret_key, algorithm=self.jwt_algorithm)
+        refresh_expires_at = now + timedelta(seconds=self.jwt_refresh_expires)
+        session_id = uuid.uuid4().hex
         refresh_payload = {
             "sub": user["username"],
             "email": user["email"],
+            "jti": session_id,
             "iat": now.timestamp(),
-            "exp": (now + timedelta(seconds=self.jwt_refresh_expires)).timestamp()
+            "exp": refresh_expires_at.timestamp()
         }
         refresh_token = jwt.encode(refresh_payload, self.jwt_secret_key, algorithm=self.jwt_algorithm)
-        hashed_refresh = bcrypt.hashpw(refresh_token.encode("utf-8"), bcrypt.gensalt())
-        self.repo.store_refresh_token(user["username"], hashed_refresh)
-        logger.info("User logged in successfully", extra={"username": user["username"]})
-        return {
-            "message": "Login successful",
-            "user": {
-                "username": user["username"],
-                "email": user["email"],
-                "role": user["role"]
-            },
-            "access_token": access_token,
-            "refresh_token": refresh_token
-        }
+        self.sessions.create_session({
+            "_id": session_id,
+            "username": user["username"],
+            "fingerprint": refresh_token_fingerprint(refresh_token, self.refresh_fingerprint_key),
+            "created_at": now,
+            # BSON date, so the TTL index can expire the session.
+            "expires_at": refresh_expires_at,
+        })
+        return access_token, refresh_token, access_payload
 
     def refresh_access_token(self, refresh_token):
         if not refresh_token or not refresh_token.strip():
             raise UnauthorizedError("Missing refresh token")
+        # One verified decode: signature first, then exp, with sub and exp required.
         try:
-            unverified_payload = jwt.decode(
+            payload = jwt.decode(
                 refresh_token,
-                options={"verify_signature": False, "verify_exp": False}
+                self.jwt_secret_key,
+                algorithms=[self.jwt_algorithm],
+                options={"require": ["sub", "exp"]},
             )
-        except Exception as e:
-            logger.error("Error decoding refresh token", extra={"error": str(e)})
-            raise UnauthorizedError("Invalid refresh token")
-        if "sub" not in unverified_payload or "exp" not in unverified_payload:
-            raise UnauthorizedError("Invalid refresh token")
-        now_ts = datetime.datetime.now(timezone.utc).timestamp()
-        try:
-            token_exp = float(unverified_payload["exp"])
-        except Exception:
-            raise UnauthorizedError("Invalid refresh token")
-        if now_ts > token_exp:
+        except jwt.ExpiredSignatureError:
             raise UnauthorizedError("Refresh token expired")
-        try:
-            payload = jwt.decode(refresh_token, self.jwt_secret_key, algorithms=[self.jwt_algorithm])
-            username = payload.get("sub")
-        except jwt.InvalidTokenError:
+        except jwt.InvalidTokenError as e:
+            logger.warning("Invalid refresh token", extra={"error": str(e)})
             raise UnauthorizedError("Invalid refresh token")
-        stored_hash = self.repo.get_refresh_token(username)
-        if not stored_hash:
-            raise UnauthorizedError("Invalid refresh token")
-        stored_hash_bytes = stored_hash if isinstance(stored_hash, bytes) else stored_hash.encode("utf-8")
-        if not bcrypt.checkpw(refresh_token.encode("utf-8"), stored_hash_bytes):
-            raise UnauthorizedError("Invalid refresh token")
-        user = self.repo.find_by_username(username)
+        username = payload["sub"]
+        session_id = payload.get("jti")
+        if session_id:
+            # Claiming deletes the session, so a refresh token rotates exactly once.
+            session = self.sessions.claim_session(session_id, username)
+            stored = session.get("fingerprint") if session else None
+            if not verify_refresh_token(refresh_token, stored, self.refresh_fingerprint_key):
+                raise UnauthorizedError("Invalid refresh token")
+            user = self.repo.find_by_username(username, fields=TOKEN_USER_FIELDS)
+        else:
+            # Issued before sessions existed: the same projected read returns the
+            # profile and the value stored on the user document.
+            user = self.repo.find_by_username(username, fields=TOKEN_USER_FIELDS + ("refresh_token",))
+            stored = user.get("refresh_token") if user else None
+            if not verify_refresh_token(refresh_token, stored, self.refresh_fingerprint_key):
+                raise UnauthorizedError("Invalid refresh token")
+            self.repo.clear_refresh_token(username)
         if not user:
-            raise UserNotFoundError("User not found")
-        now = datetime.datetime.now(timezone.utc)
-        access_payload = {
-            "sub": user["username"],
-            "email": user["email"],
-            "role": user["role"],
-            "iat": now.timestamp(),
-            "exp": (now + timedelta(seconds=self.jwt_access_expires)).timestamp()
-        }
-        new_access_token = jwt.encode(access_payload, self.jwt_secret_key, algorithm=self.jwt_algorithm)
-        new_refresh_payload = {
-            "sub": user["username"],
-            "email": user["email"],
-            "iat": now.timestamp(),
-            "exp": (now + timedelta(seconds=self.jwt_refresh_expires)).timestamp()
-        }
-        new_refresh_token = jwt.encode(new_refresh_payload, self.jwt_secret_key, algorithm=self.jwt_algorithm)
-        new_hashed_refresh = bcrypt.hashpw(new_refresh_token.encode("utf-8"), bcrypt.gensalt())
-        self.repo.store_refresh_token(user["username"], new_hashed_refresh)
+            raise UnauthorizedError("Invalid refresh token")
+        new_access_token, new_refresh_token, claims = self._issue_tokens(user)
         logger.info("Tokens refreshed successfully", extra={"username": username})
         return {
             "message": "Token refreshed successfully",
@@ -149,18 +210,72 @@ class UserService:
                 "role": user["role"]
             },
             "access_token": new_access_token,
-            "refresh_token": new_refresh_token
+            "refresh_token": new_refresh_token,
+            "claims": claims
         }
 
+    def _decode_for_logout(self, token):
+        """Verified payload of token ignoring expiry, or None when it is missing or invalid."""
+        if not token:
+            return None
+        try:
+            return jwt.decode(
+                token,
+                self.jwt_secret_key,
+                algorithms=[self.jwt_algorithm],
+                options={"verify_exp": False},
+            )
+        except jwt.InvalidTokenError:
+            return None
+
+    def logout_user(self, refresh_token, access_token=None):
+        """
+        End the session of the presented refresh token and revoke the presented access
+        token. Invalid or expired tokens are ignored: logging out must always succeed
+        in clearing the client's cookies.
+        """
+        access_payload = self._decode_for_logout(access_token)
+        if access_payload and access_payload.get("jti") and access_payload.get("exp"):
+            if float(access_payload["exp"]) > datetime.datetime.now(timezone.utc).timestamp():
+                self.revocations.revoke_token(access_payload["jti"], access_payload["exp"])
+        payload = self._decode_for_logout(refresh_token)
+        if payload is None:
+            return {"message": "Logged out successfully"}
+        if payload.get("jti"):
+            self.sessions.delete_session(payload["jti"])
+        elif payload.get("sub"):
+            self.repo.clear_refresh_token(payload["sub"])
+        logger.info("User logged out", extra={"username": payload.get("sub")})
+        return {"message": "Logged out successfully"}
+
+    def logout_all_sessions(self, username):
+        """
+        End every session of the user (all devices) with a single delete, and revoke
+        the access tokens already issued to them.
+        """
+        revoked = self.sessions.delete_user_sessions(username)
+        self.revocations.revoke_user(username)
+        if self.repo.clear_refresh_token(username):
+            revoked += 1
+        logger.info("All sessions revoked", extra={"username": username, "sessions": revoked})
+        return {"message": "Logged out of all sessions", "sessions_revoked": revoked}
+
     def update_user(self, user_id, update_data):
         if not update_data:
             raise ValidationError("No update data provided")
         if "password" in update_data:
             if len(update_data["password"]) < 6:
                 raise ValidationError("Password must be at least 6 characters")
-            update_data["password"] = bcrypt.hashpw(update_data["password"].encode("utf-8"), bcrypt.gensalt())
+            update_data["password"] = self.hash_pool.hash_password(update_data["password"])
         update_data["updated_at"] = datetime.datetime.now(timezone.utc).isoformat()
-        success = self.repo.update_user(user_id, update_data)
+        # Access tokens carry username and role as claims, so changing either revokes them.
+        previous = None
+        if "role" in update_data or "username" in update_data:
+            previous = self.repo.find_by_id(user_id)
+        try:
+            success = self.repo.update_user(user_id, update_data)
+        except DuplicateRecordError as e:
+            raise ValidationError(str(e))
         if not success:
             existing = self.repo.find_by_id(user_id)
             if not existing:
@@ -173,6 +288,11 @@ class UserService:
         if not updated_user:
             logger.warning("User not found after update", extra={"user_id": user_id})
             raise UserNotFoundError(f"User with id {user_id} not found")
+        if previous and (
+            previous.get("role") != updated_user.get("role")
+            or previous.get("username") != updated_user.get("username")
+        ):
+            self.revocations.revoke_user(previous["username"])
         # Remove sensitive fields
         updated_user["_id"] = str(updated_user["_id"])
         if "password" in updated_user:
@@ -182,10 +302,41 @@ class UserService:
         logger.info("User updated successfully", extra={"user_id": user_id})
         return {"message": "User updated successfully", "user": updated_user}
 
+    def list_users(self, page=1, size=10, cursor=None, role=None, username_prefix=None):
+        """
+        List users ordered by username, capping size at USERS_MAX_PAGE_SIZE.
+
+        With cursor=None this is classic page/size pagination and returns a list.
+        With a cursor (an empty string starts from the beginning) it seeks on the
+        (username, _id) index and returns {"users": [...], "next_cursor": token or None}.
+        role and username_prefix narrow the listing in the query itself.
+        """
+        if page < 1 or size < 1:
+            raise ValidationError("Invalid pagination parameters")
+        size = min(size, self.users_max_page_size)
+        if role is not None:
+            role = role.lower()
+            if role not in USER_ROLES:
+                raise ValidationError("Role must be one of: admin, moderator, regular")
+        if cursor is None:
+            return self.repo.list_users(
+                skip=(page - 1) * size, limit=size, role=role, username_prefix=username_prefix
+            )
+        after = decode_cursor(cursor, 2) if cursor else None
+        # Fetch one extra user to learn whether another page exists.
+        users = self.repo.list_users(after=after, limit=size + 1, role=role, username_prefix=username_prefix)
+        next_cursor = None
+        if len(users) > size:
+            users = users[:size]
+            next_cursor = encode_cursor([users[-1]["username"], users[-1]["_id"]])
+        return {"users": users, "next_cursor": next_cursor}
+
     def delete_user(self, user_id):
-        success = self.repo.delete_user(user_id)
-        if not success:
+        deleted = self.repo.delete_user(user_id)
+        if not deleted:
             logger.warning("User deletion failed", extra={"user_id": user_id})
             raise UserNotFoundError(f"User with id {user_id} not found")
+        self.sessions.delete_user_sessions(deleted["username"])
+        self.revocations.revoke_user(deleted["username"])
         logger.info("User deleted successfully", extra={"user_id": user_id})
         return {"message": "User deleted successfully"}
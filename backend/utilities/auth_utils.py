@@ -1,6 +1,42 @@
 # backend/utilities/auth_utils.py
+import hashlib
+import hmac
+import bcrypt
 from flask import make_response
 
+# Marks stored refresh-token values that are HMAC fingerprints rather than legacy bcrypt hashes.
+REFRESH_FINGERPRINT_PREFIX = "hmac-sha256$"
+
+
+def refresh_token_fingerprint(token, key):
+    """
+    Keyed SHA-256 fingerprint of a refresh token, as stored on the user document.
+
+    Refresh tokens are signed JWTs with plenty of entropy, so a keyed hash is enough;
+    the key keeps a leaked users collection from being checked against guessed tokens.
+    """
+    digest = hmac.new(key.encode("utf-8"), token.encode("utf-8"), hashlib.sha256).hexdigest()
+    return REFRESH_FINGERPRINT_PREFIX + digest
+
+
+def verify_refresh_token(token, stored, key):
+    """
+    Check a presented refresh token against its stored value in constant time.
+
+    Values written before fingerprints were introduced are bcrypt hashes; those are
+    still checked with bcrypt so existing sessions keep working until they rotate.
+    """
+    if not stored:
+        return False
+    if isinstance(stored, str) and stored.startswith(REFRESH_FINGERPRINT_PREFIX):
+        return hmac.compare_digest(stored, refresh_token_fingerprint(token, key))
+    stored_bytes = stored if isinstance(stored, bytes) else stored.encode("utf-8")
+    try:
+        return bcrypt.checkpw(token.encode("utf-8"), stored_bytes)
+    except ValueError:
+        # Not a bcrypt hash either.
+        return False
+
 
 def set_auth_cookies(response, tokens, config):
     """
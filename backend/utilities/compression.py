@@ -0,0 +1,153 @@
+# backend/utilities/compression.py
+"""
+Response compression negotiated from Accept-Encoding.
+
+gzip is always available; br and zstd are used when the optional 'brotli' and
+'zstandard' packages are installed. Dynamic responses are compressed in an
+after_request hook once they reach a size threshold; static files are compressed
+once at startup and served from memory.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from flask import current_app, request
+from utilities.logger import get_logger
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = get_logger(__name__)
+
+# Server preference when the client accepts several codings with equal quality.
+ENCODING_PREFERENCE = ("br", "zstd", "gzip")
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "image/svg+xml",
+    "text/css",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+
+
+def etag_variants(etag):
+    """Return the plain ETag plus the per-coding variants Compressor may have sent."""
+    return [etag] + [f"{etag}-{coding}" for coding in ENCODING_PREFERENCE]
+
+
+class Compressor:
+    """Flask extension that compresses responses and serves precompressed static files."""
+
+    def __init__(self, app=None):
+        self.codecs = {}
+        self.min_size = 500
+        self.precompressed = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        config = app.config
+        if not config.get("COMPRESS_ENABLED", True):
+            return
+        self.min_size = int(config.get("COMPRESS_MIN_SIZE", 500))
+        self.codecs = self._build_codecs(
+            gzip_level=int(config.get("COMPRESS_LEVEL", 6)),
+            br_level=int(config.get("COMPRESS_BR_LEVEL", 4)),
+            zstd_level=int(config.get("COMPRESS_ZSTD_LEVEL", 3)),
+        )
+        # Static files are compressed once, so spend the CPU on the best ratio.
+        static_codecs = self._build_codecs(gzip_level=9, br_level=11, zstd_level=19)
+        self._precompress_static(app, static_codecs)
+        if "static" in app.view_functions:
+            app.view_functions["static"] = self._wrap_static_view(app.view_functions["static"])
+        app.after_request(self.compress_response)
+        app.extensions["compressor"] = self
+        logger.info("Response compression enabled", extra={"codings": list(self.codecs)})
+
+    @staticmethod
+    def _build_codecs(gzip_level, br_level, zstd_level):
+        codecs = {}
+        if brotli is not None:
+            codecs["br"] = lambda data: brotli.compress(data, quality=br_level)
+        if zstandard is not None:
+            # ZstdCompressor instances are not thread-safe, so build one per call.
+            codecs["zstd"] = lambda data: zstandard.ZstdCompressor(level=zstd_level).compress(data)
+        codecs["gzip"] = lambda data: gzip.compress(data, compresslevel=gzip_level, mtime=0)
+        return codecs
+
+    def negotiate(self, codecs=None):
+        """Pick the best coding the client accepts (honouring q-values), or None."""
+        codecs = codecs if codecs is not None else self.codecs
+        offered = [coding for coding in ENCODING_PREFERENCE if coding in codecs]
+        return request.accept_encodings.best_match(offered)
+
+    def _precompress_static(self, app, codecs):
+        static_folder = app.static_folder
+        if not static_folder or not os.path.isdir(static_folder):
+            return
+        for root, _, files in os.walk(static_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                filename = os.path.relpath(path, static_folder).replace(os.sep, "/")
+                with open(path, "rb") as handle:
+                    data = handle.read()
+                if len(data) < self.min_size:
+                    continue
+                digest = hashlib.sha1(data).hexdigest()
+                self.precompressed[filename] = {
+                    "etag": digest,
+                    "bodies": {coding: codec(data) for coding, codec in codecs.items()},
+                }
+        logger.info("Precompressed static files", extra={"files": sorted(self.precompressed)})
+
+    def _wrap_static_view(self, view):
+        def static_view(filename):
+            entry = self.precompressed.get(filename)
+            coding = self.negotiate(entry["bodies"]) if entry else None
+            if coding is None:
+                return view(filename=filename)
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            response = current_app.response_class(entry["bodies"][coding], mimetype=mimetype)
+            response.headers["Content-Encoding"] = coding
+            response.vary.add("Accept-Encoding")
+            response.set_etag(f"{entry['etag']}-{coding}")
+            return response.make_conditional(request)
+        return static_view
+
+    def compress_response(self, response):
+        """after_request hook: compress eligible dynamic responses in place."""
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add("Accept-Encoding")
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or response.direct_passthrough
+            or response.is_streamed
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        coding = self.negotiate()
+        if coding is None:
+            return response
+        response.set_data(self.codecs[coding](data))
+        response.headers["Content-Encoding"] = coding
+        # A strong ETag must differ between encodings of the same resource.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(f"{etag}-{coding}")
+        return response
@@ -3,6 +3,10 @@ class RepositoryError(Exception):
     """Exception raised for errors in the repository layer."""
 
 
+class DuplicateRecordError(RepositoryError):
+    """Exception raised when a write violates a unique index."""
+
+
 class ServiceError(Exception):
     """Exception raised for errors in the service layer."""
 
@@ -20,4 +24,16 @@ class ValidationError(Exception):
 
 
 class UnauthorizedError(Exception):
-    """Exception raised when user is not authorized to perform an action."""
\ No newline at end of file
+    """Exception raised when user is not authorized to perform an action."""
+
+
+class ForbiddenError(Exception):
+    """Exception raised when an authenticated user may not act on a resource."""
+
+
+class ServiceUnavailableError(Exception):
+    """Exception raised when the server is temporarily overloaded; clients should retry later."""
+
+    def __init__(self, message="Service unavailable", retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
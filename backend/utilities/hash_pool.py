@@ -0,0 +1,137 @@
+# backend/utilities/hash_pool.py
+"""
+Bounded worker pool for password hashing.
+
+bcrypt is deliberately slow (tens to hundreds of milliseconds per call). Run inline,
+a burst of logins occupies every request thread and starves cheap reads. HashPool
+runs hashes on a small dedicated thread pool (bcrypt releases the GIL while hashing)
+and admits at most workers + queue_size hashes at a time. Anything beyond that, or
+anything that cannot finish before its deadline, fails fast with
+ServiceUnavailableError so the route answers 503 + Retry-After.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt
+from utilities.custom_exceptions import ServiceUnavailableError
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HashPool:
+    """
+    Size-limited executor with admission control and a per-call deadline.
+
+    Queue wait (submit to start) and hash time (start to finish) are accumulated for
+    monitoring; stats() returns a snapshot.
+    """
+
+    def __init__(self, workers=2, queue_size=8, timeout=5.0, retry_after=2, clock=time.monotonic):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hash")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+        self.hash_time_total = 0.0
+        self.hash_time_max = 0.0
+
+    def run(self, func, *args):
+        """
+        Run func(*args) on the pool and return its result.
+
+        Raises ServiceUnavailableError when the pool is full or the call does not
+        finish within timeout seconds of being submitted.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            logger.warning("Password hash pool saturated", extra={"in_flight": self.in_flight})
+            raise ServiceUnavailableError("Server busy, try again shortly", retry_after=self.retry_after)
+        with self._lock:
+            self.in_flight += 1
+        submitted = self._clock()
+        deadline = submitted + self.timeout
+        try:
+            future = self._executor.submit(self._timed, func, args, submitted, deadline)
+        except RuntimeError:
+            # Executor shut down (interpreter exit).
+            self._release()
+            raise ServiceUnavailableError("Server shutting down", retry_after=self.retry_after)
+        future.add_done_callback(lambda _: self._release())
+        try:
+            return future.result(timeout=max(0.0, deadline - self._clock()))
+        except FutureTimeoutError:
+            # A still-queued call is dropped; a running one finishes and frees its slot.
+            future.cancel()
+            with self._lock:
+                self.timed_out += 1
+            logger.warning("Password hash missed its deadline", extra={"timeout": self.timeout})
+            raise ServiceUnavailableError("Server busy, try again shortly", retry_after=self.retry_after)
+
+    def _timed(self, func, args, submitted, deadline):
+        started = self._clock()
+        waited = started - submitted
+        if started >= deadline:
+            # The caller has already given up; don't burn a worker on the result.
+            self._record(waited, None)
+            raise ServiceUnavailableError("Server busy, try again shortly", retry_after=self.retry_after)
+        try:
+            return func(*args)
+        finally:
+            self._record(waited, self._clock() - started)
+
+    def _record(self, waited, elapsed):
+        with self._lock:
+            self.queue_wait_total += waited
+            self.queue_wait_max = max(self.queue_wait_max, waited)
+            if elapsed is not None:
+                self.completed += 1
+                self.hash_time_total += elapsed
+                self.hash_time_max = max(self.hash_time_max, elapsed)
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def hash_password(self, password):
+        """bcrypt-hash a password (str) with a fresh salt; returns bytes."""
+        return self.run(lambda: bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()))
+
+    def check_password(self, password, hashed):
+        """Check a password (str) against a stored bcrypt hash."""
+        hashed = hashed if isinstance(hashed, bytes) else hashed.encode("utf-8")
+        return self.run(bcrypt.checkpw, password.encode("utf-8"), hashed)
+
+    def stats(self):
+        """Return a snapshot of the pool counters (times in seconds)."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "queue_wait_total": self.queue_wait_total,
+                "queue_wait_max": self.queue_wait_max,
+                "hash_time_total": self.hash_time_total,
+                "hash_time_max": self.hash_time_max,
+            }
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
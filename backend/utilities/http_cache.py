@@ -0,0 +1,79 @@
+# backend/utilities/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from flask import current_app, jsonify, request
+from utilities.compression import etag_variants
+
+
+def make_etag(*parts):
+    """
+    Build a strong ETag value (without quotes) from version-identifying parts,
+    e.g. an article id and its updated_at.
+    """
+    raw = "\x1f".join(str(part) for part in parts)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def to_datetime(value):
+    """
+    Coerce a stored timestamp into an aware UTC datetime for Last-Modified.
+
+    Accepts datetimes (naive values from pymongo are UTC), ISO 8601 strings and
+    RFC 1123 strings. Returns None when the value cannot be interpreted.
+    """
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    if isinstance(value, str):
+        for parse in (datetime.fromisoformat, parsedate_to_datetime):
+            try:
+                return to_datetime(parse(value))
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def _matched_etag(etag):
+    """
+    Return the variant of etag (plain or per-coding) listed in If-None-Match, if any.
+    If-None-Match uses weak comparison (RFC 9110), so W/"..." as sent back by a proxy matches too.
+    """
+    for variant in etag_variants(etag):
+        if request.if_none_match.contains_weak(variant):
+            return variant
+    return None
+
+
+def is_not_modified(etag, last_modified=None):
+    """
+    Evaluate the request's conditional headers against the current representation.
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+    """
+    if request.if_none_match:
+        return _matched_etag(etag) is not None
+    if last_modified is not None and request.if_modified_since is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def not_modified_response(etag, last_modified=None):
+    """Return an empty 304 response carrying the validators the client holds."""
+    response = current_app.response_class(status=304)
+    response.set_etag((request.if_none_match and _matched_etag(etag)) or etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+def conditional_json(payload, etag, last_modified=None):
+    """
+    Return 304 if the client already holds this version, otherwise jsonify payload
+    with ETag (and Last-Modified when known). Serialization is skipped on a 304.
+    """
+    if is_not_modified(etag, last_modified):
+        return not_modified_response(etag, last_modified)
+    response = jsonify(payload)
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
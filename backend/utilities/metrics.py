@@ -0,0 +1,416 @@
+# backend/utilities/metrics.py
+"""
+In-process metrics exposed in the Prometheus text format at /metrics.
+
+Request latency per endpoint and Mongo command latency per collection and operation
+(repositories/command_monitor.py) are recorded into histograms and counters. Recording
+sits on every request and every Mongo command, so it takes no lock: each thread
+writes to its own shard, a dict that only that thread mutates. The lock is taken
+once per thread to register the shard, and by /metrics while merging shards.
+Shards of threads that have exited (the dev server starts one per request) are
+folded into a base shard whenever shards are registered or merged, so their
+count tracks live threads.
+
+Component counters that already exist (hash pool, revocations, caches, connection
+pool) are not duplicated: collectors added per app with Metrics.add_collector()
+return their stats() snapshots, which are exported as gauges when scraped.
+
+Recording is per process. Under gunicorn each scrape is answered by whichever
+worker accepts it, so with METRICS_MULTIPROC_DIR set (gunicorn.conf.py sets it)
+every worker writes a snapshot of its series to that directory, at most every
+METRICS_FLUSH_INTERVAL seconds and when it exits. A scrape then merges all the
+snapshots, dead workers' included, and reports totals for the whole server that
+never go backwards. The collector gauges stay per process (the answering worker,
+labelled by pid). Without the directory every series carries the worker label.
+"""
+import hmac
+import json
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from flask import Response, current_app, g, request
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bucket upper bounds, in seconds for latencies.
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COMMAND_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+COMMANDS_PER_REQUEST_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value):
+    if isinstance(value, bool):
+        return str(int(value))
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _metric_name(*parts):
+    name = "_".join(str(part) for part in parts if part)
+    return "".join(ch if ch.isalnum() or ch == "_" else "_" for ch in name)
+
+
+class _ShardedMetric:
+    """Base for metrics whose series live in per-thread shards keyed by label values."""
+
+    kind = None
+
+    def __init__(self, name, help_text, label_names=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards = []  # (weakref to owning thread, shard)
+        self._base = {}  # series folded in from exited threads' shards
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._fold_exited_locked()
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+            self._local.shard = shard
+        return shard
+
+    def _fold_exited_locked(self):
+        """Merge the shards of threads that have exited into _base; nothing writes to them anymore."""
+        live = []
+        for thread_ref, shard in self._shards:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                live.append((thread_ref, shard))
+            else:
+                _add_series(self._base, shard)
+        self._shards = live
+
+    def _merged(self):
+        with self._lock:
+            self._fold_exited_locked()
+            merged = {labels: list(series) for labels, series in self._base.items()}
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            _add_series(merged, shard)
+        return merged
+
+    def _clear(self):
+        # Each thread caches its shard in _local, so it is replaced along with the shards.
+        self._local = threading.local()
+        self._shards = []
+        self._base = {}
+        self._lock = threading.Lock()
+
+
+def _add_series(total, shard):
+    # list() copies the items in one step, so a concurrent insert by the owning
+    # thread can't break the iteration; a series may lag by the observation in flight.
+    for labels, series in list(shard.items()):
+        existing = total.get(labels)
+        if existing is None:
+            total[labels] = list(series)
+        else:
+            for i, value in enumerate(series):
+                existing[i] += value
+
+
+class Counter(_ShardedMetric):
+    """Monotonic counter per label set."""
+
+    kind = "counter"
+
+    def inc(self, labels=(), amount=1):
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            shard[labels] = [amount]
+        else:
+            series[0] += amount
+
+    def samples(self, merged, prefix=()):
+        for labels, series in sorted(merged.items()):
+            yield self.name, prefix + labels, series[0]
+
+
+class Histogram(_ShardedMetric):
+    """Cumulative histogram per label set, with Prometheus le semantics (upper bound inclusive)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, label_names=(), buckets=REQUEST_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels, value):
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            # One count per bucket, one for +Inf, then the running sum.
+            series = shard[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def samples(self, merged, prefix=()):
+        bounds = [_format_value(float(bound)) for bound in self.buckets] + ["+Inf"]
+        for labels, series in sorted(merged.items()):
+            values = prefix + labels
+            cumulative = 0
+            for bound, count in zip(bounds, series[:-1]):
+                cumulative += count
+                yield self.name + "_bucket", values + (bound,), cumulative
+            yield self.name + "_sum", values, series[-1]
+            yield self.name + "_count", values, cumulative
+
+
+class MetricsRegistry:
+    """Holds the recorded metrics and renders them, with any collector snapshots, for scraping."""
+
+    def __init__(self, prefix="hive"):
+        self.prefix = prefix
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._snapshot_name = None  # (pid, file name), renamed after a fork
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, help_text, label_names=()):
+        return self._register(Counter(_metric_name(self.prefix, name), help_text, label_names))
+
+    def histogram(self, name, help_text, label_names=(), buckets=REQUEST_BUCKETS):
+        return self._register(Histogram(_metric_name(self.prefix, name), help_text, label_names, buckets))
+
+    def _collected_lines(self, collectors, worker):
+        for collector in collectors:
+            try:
+                sources = collector() or {}
+            except Exception as e:
+                # A broken collector must not take the whole scrape down.
+                logger.error("Metrics collector failed", extra={"error": str(e)})
+                continue
+            for source, stats in sources.items():
+                for stat, value in (stats or {}).items():
+                    name = _metric_name(self.prefix, source, stat)
+                    if isinstance(value, dict):
+                        samples = [(("worker", "key"), (worker, key), item) for key, item in value.items()]
+                    else:
+                        samples = [(("worker",), (worker,), value)]
+                    samples = [sample for sample in samples if isinstance(sample[2], (int, float))]
+                    if not samples:
+                        continue
+                    yield f"# TYPE {name} gauge"
+                    for label_names, label_values, item in samples:
+                        yield f"{name}{_format_labels(label_names, label_values)} {_format_value(item)}"
+
+    def clear(self):
+        """Drop every recorded series, e.g. those a forked worker inherited from its parent."""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric._clear()
+            self._snapshot_name = None
+
+    def _snapshot_file(self):
+        pid = os.getpid()
+        if self._snapshot_name is None or self._snapshot_name[0] != pid:
+            # A new process may reuse a dead worker's pid; it must not overwrite that file.
+            self._snapshot_name = (pid, f"{self.prefix}-{pid}-{time.time_ns()}.json")
+        return self._snapshot_name[1]
+
+    def write_snapshot(self, directory):
+        """Write this process's series to directory, replacing its previous snapshot."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        data = {
+            metric.name: [[list(labels), series] for labels, series in metric._merged().items()]
+            for metric in metrics
+        }
+        path = os.path.join(directory, self._snapshot_file())
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        # Atomic, so a concurrent scrape reads either the old or the new snapshot.
+        os.replace(temporary, path)
+
+    def _read_snapshots(self, directory):
+        """Sum the series of every process's snapshot in directory: {metric name: {labels: series}}."""
+        totals = {}
+        for entry in os.listdir(directory):
+            if not (entry.startswith(self.prefix + "-") and entry.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(directory, entry), encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning("Unreadable metrics snapshot skipped", extra={"file": entry, "error": str(e)})
+                continue
+            for name, items in data.items():
+                _add_series(totals.setdefault(name, {}), {tuple(labels): series for labels, series in items})
+        return totals
+
+    def render(self, collectors=(), directory=None):
+        """
+        Return every metric in the Prometheus text format.
+
+        With directory (METRICS_MULTIPROC_DIR), this process's snapshot is refreshed and
+        the series are summed over every snapshot there, without a worker label.
+        Otherwise they cover this process and carry worker="<pid>".
+
+        collectors are callables returning {source: stats_dict}. Numeric stats become
+        gauges named <prefix>_<source>_<stat>; a nested dict (e.g. failures by reason)
+        becomes one gauge labelled by key. They always describe this process.
+        """
+        worker = str(os.getpid())
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        if directory:
+            self.write_snapshot(directory)
+            totals = self._read_snapshots(directory)
+            prefix, prefix_names = (), ()
+        else:
+            totals = None
+            prefix, prefix_names = (worker,), ("worker",)
+        for metric in metrics:
+            merged = totals.get(metric.name, {}) if totals is not None else metric._merged()
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, label_values, value in metric.samples(merged, prefix):
+                names = prefix_names + metric.label_names + (("le",) if name.endswith("_bucket") else ())
+                lines.append(f"{name}{_format_labels(names, label_values)} {_format_value(value)}")
+        lines.extend(self._collected_lines(collectors, worker))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+if hasattr(os, "register_at_fork"):
+    # A preforked worker starts from the master's memory; series the master recorded
+    # (e.g. the index bootstrap's Mongo commands) would otherwise be counted once per worker.
+    os.register_at_fork(after_in_child=REGISTRY.clear)
+
+# Mongo commands issued by the current request, counted by the command listener on
+# the thread running the request (pymongo publishes command events synchronously).
+_request_state = threading.local()
+
+
+def count_request_command():
+    """Count one Mongo command against the request on this thread, if any."""
+    commands = getattr(_request_state, "commands", None)
+    if commands is not None:
+        _request_state.commands = commands + 1
+
+
+class Metrics:
+    """Flask extension that times requests and serves the registry at /metrics."""
+
+    def __init__(self, app=None, registry=REGISTRY):
+        self.registry = registry
+        self.auth_token = None
+        self.directory = None
+        self.flush_interval = 5.0
+        self._next_flush = 0.0
+        self.request_seconds = registry.histogram(
+            "http_request_duration_seconds",
+            "Request latency by endpoint and method.",
+            ("endpoint", "method"),
+            REQUEST_BUCKETS,
+        )
+        self.requests = registry.counter(
+            "http_requests_total",
+            "Requests by endpoint, method and status code.",
+            ("endpoint", "method", "status"),
+        )
+        self.request_commands = registry.histogram(
+            "http_request_mongo_commands",
+            "Mongo commands issued per request, by endpoint.",
+            ("endpoint",),
+            COMMANDS_PER_REQUEST_BUCKETS,
+        )
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        config = app.config
+        if not config.get("METRICS_ENABLED", True):
+            return
+        self.auth_token = config.get("METRICS_AUTH_TOKEN") or None
+        self.directory = config.get("METRICS_MULTIPROC_DIR") or None
+        self.flush_interval = float(config.get("METRICS_FLUSH_INTERVAL", 5.0))
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        if self.auth_token is None and config.get("FLASK_ENV") == "production":
+            logger.warning("Metrics endpoint is enabled without METRICS_AUTH_TOKEN; anyone can scrape it")
+        # Registered before other hooks so the timing covers them: before_request
+        # functions run in registration order, after_request functions in reverse.
+        app.before_request(self.start_request)
+        app.after_request(self.record_request)
+        app.add_url_rule(config.get("METRICS_PATH", "/metrics"), "metrics", self.metrics_view)
+        app.extensions["metrics"] = self
+        logger.info("Metrics enabled", extra={"path": config.get("METRICS_PATH", "/metrics")})
+
+    @staticmethod
+    def add_collector(app, collector):
+        """Export collector()'s {source: stats_dict} from app's /metrics (see MetricsRegistry.render)."""
+        app.extensions.setdefault("metrics_collectors", []).append(collector)
+
+    @staticmethod
+    def start_request():
+        g._metrics_started = time.perf_counter()
+        _request_state.commands = 0
+
+    def record_request(self, response):
+        started = g.pop("_metrics_started", None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        # Unmatched URLs share one label so scanners can't grow the series count.
+        endpoint = request.endpoint or "unmatched"
+        method = request.method
+        self.request_seconds.observe((endpoint, method), elapsed)
+        self.requests.inc((endpoint, method, str(response.status_code)))
+        commands = getattr(_request_state, "commands", None)
+        if commands is not None:
+            self.request_commands.observe((endpoint,), commands)
+            _request_state.commands = None
+        if self.directory is not None and time.monotonic() >= self._next_flush:
+            self.flush()
+        return response
+
+    def flush(self):
+        """Write this worker's snapshot to METRICS_MULTIPROC_DIR, for scrapes answered by other workers."""
+        self._next_flush = time.monotonic() + self.flush_interval
+        try:
+            self.registry.write_snapshot(self.directory)
+        except OSError as e:
+            logger.error("Metrics snapshot failed", extra={"error": str(e)})
+
+    def metrics_view(self):
+        if self.auth_token is not None:
+            header = request.headers.get("Authorization", "")
+            if not hmac.compare_digest(header.encode("utf-8"), f"Bearer {self.auth_token}".encode("utf-8")):
+                return Response("Unauthorized\n", status=401, content_type="text/plain")
+        collectors = current_app.extensions.get("metrics_collectors", [])
+        return Response(self.registry.render(collectors, self.directory), content_type=CONTENT_TYPE)
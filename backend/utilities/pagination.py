@@ -0,0 +1,43 @@
+# backend/utilities/pagination.py
+import base64
+import json
+from utilities.custom_exceptions import ValidationError
+
+
+def encode_cursor(values):
+    """
+    Encode the sort-key values of the last item of a page into an opaque cursor token.
+
+    Args:
+        values: List of JSON-serializable values (e.g. [str(_id)] or [username, str(_id)])
+
+    Returns:
+        URL-safe string without padding
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token, length):
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Args:
+        token: Cursor string received from the client
+        length: Expected number of sort-key values
+
+    Returns:
+        List of decoded values
+
+    Raises:
+        ValidationError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValidationError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != length:
+        raise ValidationError("Invalid cursor")
+    return values
+
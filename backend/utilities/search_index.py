@@ -0,0 +1,466 @@
+# backend/utilities/search_index.py
+"""
+In-process search structures: an inverted index with BM25 ranking, a sorted
+prefix index for title autocomplete and a trigram index for fuzzy title matching.
+
+Each term maps to a pair of parallel arrays (internal doc ids, term frequencies).
+Internal ids only grow, so appending keeps every posting list sorted. Deleting or
+re-indexing a document tombstones its old id; dead postings are skipped while
+scoring and dropped when the tombstones pass a fraction of the index.
+"""
+import bisect
+import heapq
+import math
+import re
+import threading
+import time
+from array import array
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens."""
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+class _Postings:
+    __slots__ = ("doc_ids", "freqs")
+
+    def __init__(self):
+        self.doc_ids = array("I")
+        self.freqs = array("I")
+
+
+class InvertedIndex:
+    """
+    Thread-safe BM25 index over short keyed documents.
+
+    add() replaces any previous version of the key, remove() drops it, search()
+    returns the top (key, score) pairs. Each title occurrence counts title_weight
+    times towards a term's frequency.
+    """
+
+    def __init__(self, k1=1.2, b=0.75, title_weight=3, compact_ratio=0.25):
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.compact_ratio = compact_ratio
+        self._postings = {}
+        self._keys = []  # internal id -> key (None once tombstoned)
+        self._lengths = array("I")  # internal id -> document length in tokens
+        self._ids = {}  # key -> live internal id
+        self._total_length = 0
+        self._dead = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def add(self, key, title="", content=""):
+        """Index (or re-index) a document under key."""
+        counts = {}
+        for token in tokenize(title):
+            counts[token] = counts.get(token, 0) + self.title_weight
+        for token in tokenize(content):
+            counts[token] = counts.get(token, 0) + 1
+        length = sum(counts.values())
+        with self._lock:
+            self._remove_locked(key)
+            doc_id = len(self._keys)
+            self._keys.append(key)
+            self._lengths.append(length)
+            self._ids[key] = doc_id
+            self._total_length += length
+            for token, freq in counts.items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = _Postings()
+                postings.doc_ids.append(doc_id)
+                postings.freqs.append(freq)
+            self._maybe_compact_locked()
+
+    def remove(self, key):
+        """Drop key from the index; unknown keys are ignored."""
+        with self._lock:
+            self._remove_locked(key)
+            self._maybe_compact_locked()
+
+    def search(self, query, limit=20, skip=0):
+        """
+        Rank live documents against query with BM25.
+
+        Returns:
+            List of (key, score), best first, for ranks skip..skip+limit
+        """
+        terms = set(tokenize(query))
+        if not terms or limit <= 0:
+            return []
+        with self._lock:
+            live = len(self._ids)
+            if live == 0:
+                return []
+            avg_length = self._total_length / live
+            k1, b = self.k1, self.b
+            keys, lengths = self._keys, self._lengths
+            scores = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                # One pass collects the live postings; their count is the document frequency.
+                matches = []
+                for doc_id, freq in zip(postings.doc_ids, postings.freqs):
+                    if keys[doc_id] is not None:
+                        norm = k1 * (1 - b + b * lengths[doc_id] / avg_length)
+                        matches.append((doc_id, freq * (k1 + 1) / (freq + norm)))
+                if not matches:
+                    continue
+                idf = math.log1p((live - len(matches) + 0.5) / (len(matches) + 0.5))
+                for doc_id, weight in matches:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * weight
+            # Partial selection: O(n log k) instead of sorting every match.
+            top = heapq.nlargest(skip + limit, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [(keys[doc_id], score) for doc_id, score in top[skip:]]
+
+    def stats(self):
+        """Return index size counters for monitoring."""
+        with self._lock:
+            return {
+                "documents": len(self._ids),
+                "terms": len(self._postings),
+                "postings": sum(len(p.doc_ids) for p in self._postings.values()),
+                "tombstones": self._dead,
+            }
+
+    def _remove_locked(self, key):
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return
+        self._keys[doc_id] = None
+        self._total_length -= self._lengths[doc_id]
+        self._dead += 1
+
+    def _maybe_compact_locked(self):
+        if self._dead <= max(64, self.compact_ratio * len(self._keys)):
+            return
+        # Renumber live documents in order so posting lists stay sorted.
+        remap = {}
+        keys, lengths = [], array("I")
+        for doc_id, key in enumerate(self._keys):
+            if key is not None:
+                remap[doc_id] = len(keys)
+                keys.append(key)
+                lengths.append(self._lengths[doc_id])
+        postings_by_term = {}
+        for term, postings in self._postings.items():
+            compacted = _Postings()
+            for doc_id, freq in zip(postings.doc_ids, postings.freqs):
+                new_id = remap.get(doc_id)
+                if new_id is not None:
+                    compacted.doc_ids.append(new_id)
+                    compacted.freqs.append(freq)
+            if compacted.doc_ids:
+                postings_by_term[term] = compacted
+        self._postings = postings_by_term
+        self._keys = keys
+        self._lengths = lengths
+        self._ids = {key: doc_id for doc_id, key in enumerate(keys)}
+        self._dead = 0
+
+
+
+class PrefixIndex:
+    """
+    Title autocomplete over a sorted array of (token, key) pairs.
+
+    Every title token is stored once per article, so all tokens starting with a
+    prefix form one contiguous run found with bisect. Single writes use
+    insort/deletion on the sorted list; bulk loads go through add_many(), which
+    sorts once, since an insort per token makes building the index quadratic.
+    """
+
+    def __init__(self):
+        self._entries = []  # sorted (token, key)
+        self._titles = {}  # key -> title
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._titles)
+
+    def add(self, key, title):
+        """Index (or re-index) the title stored under key."""
+        with self._lock:
+            self._remove_locked(key)
+            self._titles[key] = title
+            for token in set(tokenize(title)):
+                bisect.insort(self._entries, (token, key))
+
+    def add_many(self, items):
+        """Index (or re-index) an iterable of (key, title) pairs with a single sort."""
+        titles = dict(items)
+        entries = sorted((token, key) for key, title in titles.items() for token in set(tokenize(title)))
+        with self._lock:
+            for key in titles.keys() & self._titles.keys():
+                self._remove_locked(key)
+            self._titles.update(titles)
+            self._entries = list(heapq.merge(self._entries, entries))
+
+    def remove(self, key):
+        """Drop key from the index; unknown keys are ignored."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def suggest(self, prefix, limit=8, budget=None, clock=time.perf_counter):
+        """
+        Return up to limit (key, title) pairs whose title has a token starting with
+        the last word of prefix and contains the earlier words as whole tokens.
+
+        Exact token matches come first, then shorter titles. budget (seconds) caps
+        the scan; whatever was collected when it runs out is returned.
+        """
+        words = tokenize(prefix)
+        if not words or limit <= 0:
+            return []
+        *required, partial = words
+        deadline = clock() + budget if budget is not None else None
+        # Enough candidates to rank, without walking a huge run for one-letter prefixes.
+        wanted = limit * 4
+        seen = set()
+        candidates = []
+        with self._lock:
+            start = bisect.bisect_left(self._entries, (partial,))
+            entries = self._entries
+            for position in range(start, len(entries)):
+                token, key = entries[position]
+                if not token.startswith(partial) or len(candidates) >= wanted:
+                    break
+                # Checking the clock every entry would cost more than the scan itself.
+                if deadline is not None and (position - start) % 64 == 0 and clock() > deadline:
+                    break
+                if key in seen:
+                    continue
+                seen.add(key)
+                title = self._titles[key]
+                if required and not set(required).issubset(tokenize(title)):
+                    continue
+                candidates.append((token != partial, len(title), title, key))
+        candidates.sort()
+        return [(key, title) for _, _, title, key in candidates[:limit]]
+
+    def _remove_locked(self, key):
+        title = self._titles.pop(key, None)
+        if title is None:
+            return
+        for token in set(tokenize(title)):
+            position = bisect.bisect_left(self._entries, (token, key))
+            if position < len(self._entries) and self._entries[position] == (token, key):
+                del self._entries[position]
+
+
+class RefreshingIndex:
+    """
+    Lazily built index that is rebuilt from scratch once older than max_age seconds.
+
+    current is None until the first get(), which builds it in the calling thread.
+    Later rebuilds run in a background thread; until one finishes, every caller
+    keeps using the previous index instead of waiting. A failed rebuild is retried
+    no sooner than retry_delay seconds later.
+
+    Writes go through apply(). A build reads a snapshot of the collection, so the
+    writes applied while it runs are recorded and replayed onto the new index
+    before it is swapped in; otherwise a delete made mid-build would reappear.
+    """
+
+    def __init__(self, builder, max_age=300.0, clock=time.monotonic, retry_delay=30.0):
+        self.builder = builder
+        self.max_age = max_age
+        self.retry_delay = retry_delay
+        self._clock = clock
+        self.current = None
+        self.built_at = 0.0
+        self._retry_at = None
+        self._lock = threading.Lock()  # held for the whole build
+        self._write_lock = threading.Lock()  # orders apply() against the swap
+        self._pending = None  # writes made during the build in flight, if any
+
+    @property
+    def active(self):
+        """True when writes matter: an index is in use or being built."""
+        return self.current is not None or self._pending is not None
+
+    def apply(self, write):
+        """Run write(index) on the current index, and on the one being built once it is done."""
+        with self._write_lock:
+            if self.current is not None:
+                write(self.current)
+            if self._pending is not None:
+                self._pending.append(write)
+
+    def get(self):
+        index = self.current
+        if index is not None and self._clock() - self.built_at < self.max_age:
+            return index
+        if index is not None and self._retry_at is not None and self._clock() < self._retry_at:
+            return index
+        if not self._lock.acquire(blocking=index is None):
+            return index
+        if index is not None:
+            # Stale: serve it while a background thread builds the replacement.
+            self._start_build()
+            threading.Thread(target=self._rebuild, args=(index,), name="index-rebuild", daemon=True).start()
+            return index
+        try:
+            if self.current is None:
+                self._start_build()
+                try:
+                    self._finish_build(None, self.builder())
+                except Exception:
+                    self._pending = None
+                    raise
+            return self.current
+        finally:
+            self._lock.release()
+
+    def _start_build(self):
+        with self._write_lock:
+            self._pending = []
+
+    def _finish_build(self, replaced, index):
+        """Replay the writes made during the build onto index and swap it in for replaced."""
+        with self._write_lock:
+            pending, self._pending = self._pending, None
+            # A reset() while building means the result is already outdated.
+            if self.current is not replaced:
+                return
+            for write in pending:
+                write(index)
+            self.current = index
+            self.built_at = self._clock()
+            self._retry_at = None
+
+    def _rebuild(self, stale):
+        """Build a replacement for stale and swap it in; runs holding the lock taken by get()."""
+        try:
+            self._finish_build(stale, self.builder())
+        except Exception as e:
+            # Keep serving the stale index; get() tries again after retry_delay.
+            with self._write_lock:
+                self._pending = None
+            self._retry_at = self._clock() + self.retry_delay
+            logger.error("Index rebuild failed", extra={"error": str(e)})
+        finally:
+            self._lock.release()
+
+    def reset(self):
+        """Drop the index; the next get() rebuilds it."""
+        self.current = None
+
+
+def trigrams(word):
+    """Padded character trigrams of a word, pg_trgm style ("  ab " -> "  a", " ab", "ab ")."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Typo-tolerant word matching over a title vocabulary.
+
+    Each distinct title word gets an id; each trigram maps to an array of the word
+    ids containing it. A query word only probes its rarest trigrams (prefix
+    filtering): a word with Jaccard similarity >= threshold must share at least one
+    of them, so candidate generation touches posting lists proportional to the
+    matches rather than the vocabulary.
+    """
+
+    def __init__(self):
+        self._words = []  # word id -> word
+        self._word_ids = {}  # word -> word id
+        self._grams = {}  # trigram -> array of word ids
+        self._word_keys = {}  # word id -> set of keys whose title has the word
+        self._titles = {}  # key -> title
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._titles)
+
+    def add(self, key, title):
+        """Index (or re-index) the title stored under key."""
+        with self._lock:
+            self._remove_locked(key)
+            self._titles[key] = title
+            for word in set(tokenize(title)):
+                word_id = self._word_ids.get(word)
+                if word_id is None:
+                    word_id = self._word_ids[word] = len(self._words)
+                    self._words.append(word)
+                    for gram in trigrams(word):
+                        self._grams.setdefault(gram, array("I")).append(word_id)
+                self._word_keys.setdefault(word_id, set()).add(key)
+
+    def remove(self, key):
+        """Drop key from the index; unknown keys are ignored."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def similar_words(self, word, threshold=0.25):
+        """Return {vocabulary word: Jaccard similarity} for words at or above threshold."""
+        query_grams = trigrams(word)
+        required = max(1, math.ceil(threshold * len(query_grams)))
+        with self._lock:
+            # Rarest trigrams first; any match must contain one of the first
+            # len - required + 1 of them.
+            probes = sorted(query_grams, key=lambda gram: len(self._grams.get(gram, ())))
+            candidates = set()
+            for gram in probes[:len(probes) - required + 1]:
+                candidates.update(self._grams.get(gram, ()))
+            matches = {}
+            for word_id in candidates:
+                if not self._word_keys.get(word_id):
+                    continue
+                candidate = self._words[word_id]
+                grams = trigrams(candidate)
+                overlap = len(query_grams & grams)
+                similarity = overlap / (len(query_grams) + len(grams) - overlap)
+                if similarity >= threshold:
+                    matches[candidate] = similarity
+            return matches
+
+    def search(self, query, threshold=0.25, limit=20, skip=0):
+        """
+        Rank keys by the summed best similarity of each query word to their title words.
+
+        Returns:
+            List of (key, score, matched title words), best first, for ranks skip..skip+limit
+        """
+        scores = {}
+        matched = {}
+        for word in dict.fromkeys(tokenize(query)):
+            best = {}
+            for candidate, similarity in self.similar_words(word, threshold).items():
+                with self._lock:
+                    keys = tuple(self._word_keys.get(self._word_ids[candidate], ()))
+                for key in keys:
+                    if similarity > best.get(key, (0.0, None))[0]:
+                        best[key] = (similarity, candidate)
+            for key, (similarity, candidate) in best.items():
+                scores[key] = scores.get(key, 0.0) + similarity
+                matched.setdefault(key, []).append(candidate)
+        top = heapq.nlargest(skip + limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [(key, score, matched[key]) for key, score in top[skip:]]
+
+    def _remove_locked(self, key):
+        title = self._titles.pop(key, None)
+        if title is None:
+            return
+        for word in set(tokenize(title)):
+            keys = self._word_keys.get(self._word_ids[word])
+            if keys is not None:
+                keys.discard(key)
@@ -0,0 +1,122 @@
+# backend/utilities/text_utils.py
+import math
+import re
+
+
+def build_excerpt(content, max_length=200):
+    """
+    Return a plain-text preview of content, cut on a word boundary.
+
+    Args:
+        content: Full article body
+        max_length: Maximum number of characters before the ellipsis
+
+    Returns:
+        Excerpt string (content itself when already short enough)
+    """
+    text = " ".join(content.split())
+    if len(text) <= max_length:
+        return text
+    cut = text[:max_length]
+    space = cut.rfind(" ")
+    if space > max_length // 2:
+        cut = cut[:space]
+    return cut.rstrip(" .,;:") + "..."
+
+
+def summarize_content(content, excerpt_length=200, words_per_minute=200):
+    """
+    Compute the denormalized summary fields stored alongside an article body.
+
+    Returns:
+        Dict with 'excerpt', 'word_count' and 'reading_time' (whole minutes, at least 1)
+    """
+    word_count = len(content.split())
+    return {
+        "excerpt": build_excerpt(content, excerpt_length),
+        "word_count": word_count,
+        "reading_time": max(1, math.ceil(word_count / words_per_minute)),
+    }
+
+
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def find_highlights(text, terms):
+    """
+    Return [start, end] offsets of the words in text that start with any of terms
+    (lowercase), so "garden" also marks "gardens" the way the stemmed text index matches.
+    """
+    if not text or not terms:
+        return []
+    return [
+        [match.start(), match.end()]
+        for match in WORD_RE.finditer(text)
+        if match.group().lower().startswith(terms)
+    ]
+
+
+def build_snippet(text, terms, length=160):
+    """
+    Cut the window of about length characters that covers the most distinct query
+    terms, in a single scan over the text's words.
+
+    Args:
+        text: Article body
+        terms: Tuple of lowercase query terms
+        length: Target window size in characters
+
+    Returns:
+        Dict with 'text' (the window, with "..." where it was cut) and 'highlights'
+        ([start, end] offsets of matched words within that text)
+    """
+    text = text or ""
+    hits = []  # (start, end, term index)
+    for match in WORD_RE.finditer(text):
+        word = match.group().lower()
+        for index, term in enumerate(terms):
+            if word.startswith(term):
+                hits.append((match.start(), match.end(), index))
+                break
+    if not hits:
+        return {"text": build_excerpt(text, length), "highlights": []}
+
+    # Sliding window over the hits: maximize distinct terms, then total hits.
+    best = (0, 0, 0, 0)  # (distinct, count, first hit, last hit)
+    counts = {}
+    left = 0
+    for right, (_, end, term) in enumerate(hits):
+        counts[term] = counts.get(term, 0) + 1
+        # left < right keeps at least the newest hit, even if that word alone exceeds length.
+        while left < right and end - hits[left][0] > length:
+            left_term = hits[left][2]
+            counts[left_term] -= 1
+            if not counts[left_term]:
+                del counts[left_term]
+            left += 1
+        candidate = (len(counts), right - left + 1, left, right)
+        if candidate[:2] > best[:2]:
+            best = candidate
+    _, _, first, last = best
+
+    # Centre the covered hits in the window, then snap both edges to word boundaries.
+    covered_start, covered_end = hits[first][0], hits[last][1]
+    slack = max(0, length - (covered_end - covered_start))
+    start = max(0, covered_start - slack // 2)
+    end = min(len(text), max(covered_end, start + length))
+    if start > 0:
+        space = text.find(" ", start, covered_start)
+        start = space + 1 if space != -1 else start
+    if end < len(text):
+        space = text.rfind(" ", covered_end, end)
+        end = space if space != -1 else end
+
+    lead = "..." if start > 0 else ""
+    snippet = lead + text[start:end] + ("..." if end < len(text) else "")
+    shift = len(lead) - start
+    highlights = [
+        [hit_start + shift, hit_end + shift]
+        for hit_start, hit_end, _ in hits
+        if hit_start >= start and hit_end <= end
+    ]
+    return {"text": snippet, "highlights": highlights}
@@ -0,0 +1,12 @@
+"""
+Production WSGI entry point:
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+app.py can't serve this role: the app/ package shadows it on import, so
+"app:application" resolves to the package. app.py remains the development server.
+"""
+
+from app import create_app
+
+application = create_app()
@@ -9,6 +9,20 @@ const ArticleCard = ({ article }) => {
     return content.substring(0, maxLength) + '...'
   }
 
+  // Wrap the server-computed [start, end] highlight ranges in <mark>
+  const renderHighlighted = (text, highlights) => {
+    if (!highlights || highlights.length === 0) return text
+    const parts = []
+    let cursor = 0
+    highlights.forEach(([start, end]) => {
+      if (start > cursor) parts.push(text.slice(cursor, start))
+      parts.push(<mark key={start} className="bg-yellow-100">{text.slice(start, end)}</mark>)
+      cursor = end
+    })
+    parts.push(text.slice(cursor))
+    return parts
+  }
+
   const formatDate = (dateString) => {
     if (!dateString) return ''
     try {
@@ -28,8 +42,14 @@ const ArticleCard = ({ article }) => {
       to={`/articles/${article.article_id}`}
       className="block p-6 bg-white border border-gray-200 rounded-lg shadow-sm hover:shadow-lg transition-shadow duration-200 mb-4"
     >
-      <h3 className="text-xl font-bold text-gray-900 mb-2">{article.title}</h3>
-      <p className="text-gray-600 mb-4 line-clamp-3">{truncateContent(article.content)}</p>
+      <h3 className="text-xl font-bold text-gray-900 mb-2">
+        {renderHighlighted(article.title, article.title_highlights)}
+      </h3>
+      <p className="text-gray-600 mb-4 line-clamp-3">
+        {article.snippet
+          ? renderHighlighted(article.snippet.text, article.snippet.highlights)
+          : article.excerpt || truncateContent(article.content)}
+      </p>
       <div className="flex justify-between items-center text-sm text-gray-500">
         <span className="font-medium">By {article.author}</span>
         <span>{formatDate(article.created_at)}</span>
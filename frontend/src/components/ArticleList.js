@@ -17,7 +17,7 @@ const ArticleList = () => {
     setError('')
     try {
       const response = await axiosInstance.get('/articles', {
-        params: { page, limit }
+        params: { page, limit, fields: 'title,author,created_at,excerpt' }
       })
       
       const articlesData = Array.isArray(response.data) ? response.data : []
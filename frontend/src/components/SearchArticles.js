@@ -1,16 +1,52 @@
 // src/components/SearchArticles.js
 import React, { useState, useEffect, useRef } from 'react'
+import { Link } from 'react-router-dom'
 import axiosInstance from '../api/axiosInstance'
 import { toast } from 'react-toastify'
 import ArticleCard from './ArticleCard'
 
 const SearchArticles = () => {
   const [query, setQuery] = useState('')
+  const [suggestions, setSuggestions] = useState([])
+  const [submittedQuery, setSubmittedQuery] = useState('')
   const [results, setResults] = useState([])
+  const [fuzzy, setFuzzy] = useState(false)
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState('')
   const abortControllerRef = useRef(null)
 
+  // Lightweight title autocomplete while typing; the full search only runs on submit
+  const fetchSuggestions = async (prefix) => {
+    if (abortControllerRef.current) {
+      abortControllerRef.current.abort()
+    }
+    abortControllerRef.current = new AbortController()
+
+    try {
+      const response = await axiosInstance.get('/articles/suggest', {
+        params: { prefix },
+        signal: abortControllerRef.current.signal
+      })
+      setSuggestions(Array.isArray(response.data) ? response.data : [])
+    } catch (err) {
+      if (err.name === 'AbortError' || err.code === 'ERR_CANCELED') {
+        return
+      }
+      setSuggestions([])
+    }
+  }
+
+  const handleSubmit = (e) => {
+    e.preventDefault()
+    const searchQuery = query.trim()
+    if (!searchQuery) {
+      return
+    }
+    setSuggestions([])
+    setSubmittedQuery(searchQuery)
+    performSearch(searchQuery)
+  }
+
   const performSearch = async (searchQuery) => {
     // Cancel previous request if exists
     if (abortControllerRef.current) {
@@ -24,12 +60,25 @@ const SearchArticles = () => {
     setError('')
     
     try {
+      const signal = abortControllerRef.current.signal
+      // Results carry a highlighted snippet instead of the article body
       const response = await axiosInstance.get('/articles/search', {
-        params: { query: searchQuery },
-        signal: abortControllerRef.current.signal
+        params: { query: searchQuery, limit: 20 },
+        signal
       })
       
-      const articlesData = Array.isArray(response.data) ? response.data : []
+      let articlesData = Array.isArray(response.data) ? response.data : []
+      let usedFuzzy = false
+      if (articlesData.length === 0) {
+        // Nothing matched exactly: retry once with typo-tolerant title matching
+        const fuzzyResponse = await axiosInstance.get('/articles/search', {
+          params: { query: searchQuery, limit: 20, mode: 'fuzzy' },
+          signal
+        })
+        articlesData = Array.isArray(fuzzyResponse.data) ? fuzzyResponse.data : []
+        usedFuzzy = articlesData.length > 0
+      }
+      setFuzzy(usedFuzzy)
       setResults(articlesData)
       
       if (articlesData.length === 0 && searchQuery.trim()) {
@@ -50,10 +99,12 @@ const SearchArticles = () => {
     }
   }
 
-  // Debounce effect: delays API call by 100ms after user stops typing
+  // Debounce effect: fetches title suggestions 100ms after user stops typing
   useEffect(() => {
     if (!query.trim()) {
+      setSuggestions([])
       setResults([])
+      setSubmittedQuery('')
       setError('')
       setLoading(false)
       // Cancel any pending request
@@ -64,34 +115,44 @@ const SearchArticles = () => {
     }
 
     const timer = setTimeout(() => {
-      performSearch(query.trim())
+      fetchSuggestions(query.trim())
     }, 100)
 
     return () => {
       clearTimeout(timer)
-      // Cancel request if component unmounts or query changes before timeout
-      if (abortControllerRef.current) {
-        abortControllerRef.current.abort()
-      }
     }
   }, [query])
 
 
   return (
     <div className="w-full">
-      <div className="mb-6">
+      <form className="mb-6 relative" onSubmit={handleSubmit}>
         <input
           type="text"
           value={query}
           onChange={(e) => setQuery(e.target.value)}
-          placeholder="Search articles by title..."
+          placeholder="Search articles..."
           className="w-full p-3 border border-gray-300 rounded-md shadow-sm focus:ring-blue-500 focus:border-blue-500 text-lg"
           autoFocus
         />
+        {suggestions.length > 0 && (
+          <ul className="absolute z-10 w-full mt-1 bg-white border border-gray-200 rounded-md shadow-lg">
+            {suggestions.map((suggestion) => (
+              <li key={suggestion.article_id}>
+                <Link
+                  to={`/articles/${suggestion.article_id}`}
+                  className="block px-3 py-2 text-gray-800 hover:bg-gray-100"
+                >
+                  {suggestion.title}
+                </Link>
+              </li>
+            ))}
+          </ul>
+        )}
         {loading && (
           <div className="mt-2 text-gray-600 text-sm">Searching...</div>
         )}
-      </div>
+      </form>
 
       {error && !loading && (
         <div className="text-center py-8 text-gray-600">
@@ -99,16 +160,18 @@ const SearchArticles = () => {
         </div>
       )}
 
-      {!loading && !error && query.trim() && results.length === 0 && (
+      {!loading && !error && submittedQuery && results.length === 0 && (
         <div className="text-center py-8 text-gray-600">
-          No articles found matching "{query}"
+          No articles found matching "{submittedQuery}"
         </div>
       )}
 
       {!loading && results.length > 0 && (
         <div>
           <div className="mb-4 text-sm text-gray-600">
-            Found {results.length} {results.length === 1 ? 'article' : 'articles'}
+            {fuzzy
+              ? `No exact matches. Showing ${results.length} similar ${results.length === 1 ? 'title' : 'titles'}`
+              : `Found ${results.length} ${results.length === 1 ? 'article' : 'articles'}`}
           </div>
           <div>
             {results.map((article) => (
@@ -120,7 +183,7 @@ const SearchArticles = () => {
 
       {!query.trim() && (
         <div className="text-center py-8 text-gray-500">
-          Enter a search query to find articles
+          Type to see matching titles, or press Enter to search articles
         </div>
       )}
     </div>